@@ -0,0 +1,140 @@
+# testing/benchmark_eval_helpers.py
+
+"""Evaluation Helper Microbenchmark for V7P3R Chess Engine
+Times the bitboard helpers against the previous square-by-square scans on a
+fixed position set and checks that both return the same results.
+Run directly: python testing/benchmark_eval_helpers.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+import chess
+from v7p3r_utils import PIECE_VALUES, get_material_balance, get_game_phase, find_hanging_pieces
+from v7p3r_pst import PieceSquareTables
+from v7p3r_primary_scoring import PrimaryScoring
+
+POSITIONS = [
+    chess.STARTING_FEN,
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "2r3k1/pp3ppp/2n1b3/3pP3/3P4/P1N2N2/1P3PPP/2R3K1 b - - 0 20",
+    "8/5pk1/6p1/3R4/8/6P1/5PK1/3r4 w - - 0 40",
+    "8/8/4k3/8/2K5/8/3P4/8 w - - 0 60"
+]
+
+ITERATIONS = 2000
+
+
+# Previous implementations, scanning all 64 squares with piece_at
+
+def scan_material_balance(board, color):
+    our_material = 0
+    their_material = 0
+    for square in chess.SQUARES:
+        piece = board.piece_at(square)
+        if piece and piece.piece_type != chess.KING:
+            if piece.color == color:
+                our_material += PIECE_VALUES[piece.piece_type]
+            else:
+                their_material += PIECE_VALUES[piece.piece_type]
+    return our_material - their_material
+
+def scan_game_phase(board):
+    piece_count = 0
+    for square in chess.SQUARES:
+        piece = board.piece_at(square)
+        if piece and piece.piece_type != chess.KING:
+            piece_count += 1
+    if piece_count >= 24:
+        return "opening"
+    elif piece_count >= 12:
+        return "middlegame"
+    return "endgame"
+
+def scan_is_endgame(board):
+    material = 0
+    for square in chess.SQUARES:
+        piece = board.piece_at(square)
+        if piece and piece.piece_type != chess.KING:
+            material += PIECE_VALUES[piece.piece_type]
+    return material < 1300
+
+def scan_hanging_pieces(board, color):
+    hanging_pieces = []
+    for square in chess.SQUARES:
+        piece = board.piece_at(square)
+        if piece and piece.color != color:
+            our_attackers = board.attackers(color, square)
+            if our_attackers:
+                their_defenders = board.attackers(piece.color, square)
+                if not their_defenders:
+                    hanging_pieces.append((square, piece, PIECE_VALUES[piece.piece_type]))
+                else:
+                    min_attacker_value = min(PIECE_VALUES[board.piece_at(sq).piece_type] for sq in our_attackers)
+                    min_defender_value = min(PIECE_VALUES[board.piece_at(sq).piece_type] for sq in their_defenders)
+                    if min_attacker_value < min_defender_value:
+                        net_gain = PIECE_VALUES[piece.piece_type] - min_attacker_value
+                        if net_gain > 0:
+                            hanging_pieces.append((square, piece, net_gain))
+    hanging_pieces.sort(key=lambda x: x[2], reverse=True)
+    return hanging_pieces
+
+def scan_pst_score(pst, board, our_color):
+    our_pst = 0
+    their_pst = 0
+    is_endgame = scan_is_endgame(board)
+    for square in chess.SQUARES:
+        piece = board.piece_at(square)
+        if piece:
+            pst_square = square if piece.color == chess.WHITE else chess.square_mirror(square)
+            pst_value = pst.get_pst_value(piece.piece_type, pst_square, is_endgame)
+            if piece.color == our_color:
+                our_pst += pst_value
+            else:
+                their_pst += pst_value
+    return our_pst - their_pst
+
+
+def time_per_call(function, boards):
+    """Average microseconds per call over the position set"""
+    def run():
+        for board in boards:
+            function(board)
+    seconds = timeit.timeit(run, number=ITERATIONS)
+    return seconds / (ITERATIONS * len(boards)) * 1e6
+
+
+def main():
+    boards = [chess.Board(fen) for fen in POSITIONS]
+    pst = PieceSquareTables()
+    primary = PrimaryScoring()
+
+    helpers = [
+        ("get_material_balance",
+         lambda b: scan_material_balance(b, chess.WHITE), lambda b: get_material_balance(b, chess.WHITE)),
+        ("get_game_phase", scan_game_phase, get_game_phase),
+        ("find_hanging_pieces",
+         lambda b: scan_hanging_pieces(b, b.turn), lambda b: find_hanging_pieces(b, b.turn)),
+        ("is_endgame", scan_is_endgame, pst.is_endgame),
+        ("_get_pst_score",
+         lambda b: scan_pst_score(pst, b, chess.WHITE), lambda b: primary._get_pst_score(b, chess.WHITE))
+    ]
+
+    print(f"{'helper':<22}{'before (us)':>12}{'after (us)':>12}{'speedup':>10}")
+    for name, before, after in helpers:
+        for board in boards:
+            if before(board) != after(board):
+                print(f"✗ {name} differs from the previous implementation on {board.fen()}")
+                return False
+        before_us = time_per_call(before, boards)
+        after_us = time_per_call(after, boards)
+        print(f"{name:<22}{before_us:>12.2f}{after_us:>12.2f}{before_us / after_us:>9.1f}x")
+
+    return True
+
+
+if __name__ == "__main__":
+    main()
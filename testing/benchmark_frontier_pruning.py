@@ -0,0 +1,89 @@
+# testing/benchmark_frontier_pruning.py
+
+"""Frontier Pruning Benchmark for V7P3R Chess Engine
+Searches middlegame and tactical positions to a fixed depth with the move
+list truncated to the first ordered moves, at full width, and at full width
+with futility pruning and razoring, with and without late move reductions.
+Reports nodes, quiescence nodes, wall-clock time (best of REPEATS runs per
+position) and how many best moves agree with the full-width search.
+Run directly: python testing/benchmark_frontier_pruning.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+
+POSITIONS = [
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQK2R b KQkq - 0 5",
+    "2kr3r/pp1q1ppp/2n1bn2/2bpp3/4P3/2NP1N2/PPPBBPPP/R2QK2R w KQ - 0 9",
+    "r3k2r/pbpnqppp/1p2pn2/3p4/2PP4/P1NBPN2/1P3PPP/R2QK2R w KQkq - 0 10",
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "r1b1k2r/ppppnppp/2n2q2/2b5/3NP3/2P1B3/PP3PPP/RN1QKB1R w KQkq - 0 1",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "8/5pk1/6p1/3R4/7P/6P1/r4PK1/8 w - - 0 40"
+]
+
+SEARCH_DEPTH = 4
+TRUNCATED_MOVES = 6
+REPEATS = 3
+
+# name: (late move reductions, move limit, frontier pruning)
+VARIANTS = {
+    'truncated': (False, TRUNCATED_MOVES, False),
+    'full width': (False, 0, False),
+    'full + frontier': (False, 0, True),
+    'lmr': (True, TRUNCATED_MOVES, False),
+    'lmr + frontier': (True, TRUNCATED_MOVES, True)
+}
+
+
+def make_config(use_lmr, move_limit, use_pruning):
+    config = V7P3RConfig("speed_config.json")
+    engine_config = config.config['engine_config']
+    engine_config['depth'] = SEARCH_DEPTH
+    engine_config['use_late_move_reduction'] = use_lmr
+    engine_config['max_ordered_moves'] = move_limit
+    engine_config['use_futility_pruning'] = use_pruning
+    engine_config['use_razoring'] = use_pruning
+    return config
+
+
+def run_variant(use_lmr, move_limit, use_pruning):
+    """Best moves, total nodes, quiescence nodes, pruning counters and wall-clock time over all positions"""
+    config = make_config(use_lmr, move_limit, use_pruning)
+    moves, nodes, qnodes, prunes, seconds = [], 0, 0, 0, 0.0
+    for fen in POSITIONS:
+        timings = []
+        for _ in range(REPEATS):
+            board = chess.Board(fen)
+            search = SearchController(config)
+            start = time.perf_counter()
+            move = search.find_best_move(board, board.turn)
+            timings.append(time.perf_counter() - start)
+        moves.append(move)
+        seconds += min(timings)
+        stats = search.get_search_stats()
+        nodes += stats['nodes_searched']
+        qnodes += stats['qnodes']
+        prunes += stats['futility_prunes'] + stats['razor_cutoffs']
+    return moves, nodes, qnodes, prunes, seconds
+
+
+def main():
+    print(f"Depth {SEARCH_DEPTH} search of {len(POSITIONS)} positions, best of {REPEATS} runs")
+    print(f"{'variant':<17}{'nodes':>8}{'qnodes':>8}{'pruned':>8}{'time':>8}{'same move':>11}")
+    results = {name: run_variant(*variant) for name, variant in VARIANTS.items()}
+    reference = results['full width'][0]
+    for name, (moves, nodes, qnodes, prunes, seconds) in results.items():
+        same = sum(move == expected for move, expected in zip(moves, reference))
+        print(f"{name:<17}{nodes:>8}{qnodes:>8}{prunes:>8}{seconds:>7.2f}s{same:>8}/{len(POSITIONS)}")
+
+
+if __name__ == "__main__":
+    main()
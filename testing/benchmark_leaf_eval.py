@@ -0,0 +1,115 @@
+# testing/benchmark_leaf_eval.py
+
+"""Leaf Evaluation Throughput Benchmark for V7P3R Chess Engine
+Compares the previous two-pass capture potential with the single-pass version
+on a fixed set of leaf-like positions, and reports how often lazy evaluation
+skips the capture term for a typical search window.
+Run directly: python testing/benchmark_leaf_eval.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+import chess
+from v7p3r_primary_scoring import PrimaryScoring
+from v7p3r_utils import evaluate_exchange, find_hanging_pieces
+
+START_POSITIONS = [
+    chess.STARTING_FEN,
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "2r3k1/pp3ppp/2n1b3/3pP3/3P4/P1N2N2/1P3PPP/2R3K1 b - - 0 20"
+]
+
+LEAVES_PER_START = 100
+PLIES_PER_LEAF = 6
+WINDOW = 50  # Half-width of the window used for the lazy evaluation figures
+
+
+def previous_capture_potential(primary, board, our_color):
+    """The two-pass version: exchange and MVV-LVA scores computed separately per capture"""
+    exchange_score = 0
+    for move in board.legal_moves:
+        if board.is_capture(move):
+            moving_piece = board.piece_at(move.from_square)
+            if moving_piece and moving_piece.color == our_color:
+                exchange_value = evaluate_exchange(board, move)
+                if exchange_value > 0:
+                    exchange_score += exchange_value
+
+    hanging_score = sum(value for _, _, value in find_hanging_pieces(board, our_color))
+
+    mvv_lva_score = 0
+    for move in board.legal_moves:
+        if board.is_capture(move):
+            moving_piece = board.piece_at(move.from_square)
+            if moving_piece and moving_piece.color == our_color:
+                mvv_lva_score += primary.mvv_lva.get_capture_score(board, move) // 100
+
+    return exchange_score + hanging_score + mvv_lva_score
+
+
+def build_leaves():
+    """Fixed set of positions a few random plies away from the start positions"""
+    rng = random.Random(11)
+    leaves = []
+    for fen in START_POSITIONS:
+        for _ in range(LEAVES_PER_START):
+            board = chess.Board(fen)
+            for _ in range(PLIES_PER_LEAF):
+                moves = list(board.legal_moves)
+                if not moves:
+                    break
+                board.push(rng.choice(moves))
+            leaves.append(chess.Board(board.fen()))
+    return leaves
+
+
+def evals_per_second(evaluate, leaves, repeats=3):
+    """Leaf evaluations per second over the position set"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for board in leaves:
+            evaluate(board)
+    return repeats * len(leaves) / (time.perf_counter() - start)
+
+
+def main():
+    primary = PrimaryScoring()
+    lazy_primary = PrimaryScoring(lazy_eval=True)
+    leaves = build_leaves()
+
+    for board in leaves:
+        if previous_capture_potential(primary, board, board.turn) != primary._get_capture_potential(board, board.turn):
+            print(f"✗ Capture potential differs on {board.fen()}")
+            return False
+
+    def previous(board):
+        return primary._get_material_score(board, board.turn) + primary._get_pst_score(board, board.turn) \
+            + previous_capture_potential(primary, board, board.turn)
+
+    def single_pass(board):
+        return primary.evaluate(board, board.turn)
+
+    def lazy(board):
+        # Window centred on the material balance, as at a typical leaf in a quiet search
+        centre = primary._get_material_score(board, board.turn)
+        return lazy_primary.evaluate(board, board.turn, None, centre - WINDOW, centre + WINDOW)
+
+    before = evals_per_second(previous, leaves)
+    after = evals_per_second(single_pass, leaves)
+    lazy_rate = evals_per_second(lazy, leaves, repeats=1)
+    skip_pct = lazy_primary.lazy_eval_skips / len(leaves) * 100
+
+    print(f"Leaf positions: {len(leaves)}")
+    print(f"Two-pass capture potential:    {before:8.0f} evals/s")
+    print(f"Single-pass capture potential: {after:8.0f} evals/s ({after / before:.1f}x)")
+    print(f"With lazy evaluation:          {lazy_rate:8.0f} evals/s ({skip_pct:.0f}% skipped)")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# testing/benchmark_mate_search.py
+
+"""Mate Search Benchmark for V7P3R Chess Engine
+Solves mate puzzles with the negamax search and with the "mate" search
+algorithm (proof-number search, falling back to negamax), and reports time
+and whether the chosen move keeps a forced mate.
+Run directly: python testing/benchmark_mate_search.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_mate_search import MateSearch
+
+# (FEN, mate length in moves)
+MATE_PUZZLES = [
+    ("r2qkb1r/pp2nppp/3p4/2pNN1B1/2BnP3/3P4/PPP2PPP/R2bK2R w KQkq - 1 1", 2),
+    ("r1b2k1r/ppp1bppp/8/1B1Q4/5q2/2P5/PPP2PPP/R3R1K1 w - - 1 1", 2),
+    ("6k1/pp4p1/2p5/2bp4/8/P5Pb/1P3rrP/2BRRN1K b - - 0 1", 2),
+    ("1r6/4b2k/1q1pNrpp/p2Pp3/4P3/1P1R3Q/5PPP/5RK1 w - - 0 1", 2),
+    ("r1b2rk1/2p2ppp/p7/1p6/3P3q/1BP3bP/PP3QP1/RNB1R1K1 w - - 1 1", 2),
+    ("r1b1kb1r/pppp1ppp/5q2/4n3/3KP3/2N3PN/PPP4P/R1BQ1B1R b kq - 0 1", 3),
+    ("r5rk/5p1p/5R2/4B3/8/8/7P/7K w - - 0 1", 3),
+    ("3r1r1k/1p3p1p/p2p4/4n1NN/6bQ/1BPq4/P3p1PP/1R5K w - - 0 1", 3),
+    ("r1bk3r/pppq1ppp/5n2/4N1N1/2Bp4/Bn6/P4PPP/4R1K1 w - - 0 1", 4)
+]
+
+SEARCH_DEPTH = 4
+TIME_LIMIT = 30.0
+
+
+def keeps_forced_mate(board, move, moves_left):
+    """True if the move mates or every reply still allows a mate in the remaining moves"""
+    solver = MateSearch(max(moves_left - 1, 1))
+    board.push(move)
+    try:
+        if board.is_checkmate():
+            return True
+        if moves_left <= 1:
+            return False
+        for reply in list(board.legal_moves):
+            board.push(reply)
+            proven = solver.solve(board, 10 ** 6) is not None
+            board.pop()
+            if not proven:
+                return False
+        return True
+    finally:
+        board.pop()
+
+
+def solve(algorithm, board):
+    """Move and seconds for one puzzle from a fresh search"""
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['search_algorithm'] = algorithm
+    config.config['engine_config']['depth'] = SEARCH_DEPTH
+    config.config['engine_config']['mate_search_depth'] = 4
+    search = SearchController(config)
+
+    start = time.perf_counter()
+    move = search.find_best_move(board.copy(), board.turn, TIME_LIMIT)
+    return move, time.perf_counter() - start
+
+
+def main():
+    totals = {'negamax': [0, 0.0], 'mate': [0, 0.0]}
+    print(f"Mate puzzles, negamax depth {SEARCH_DEPTH} against proof-number mate search")
+    print(f"{'puzzle':<8}{'mate in':<9}{'algorithm':<11}{'move':<8}{'mates':<7}{'time (s)':>9}")
+    for index, (fen, mate_in) in enumerate(MATE_PUZZLES):
+        board = chess.Board(fen)
+        for algorithm in ('negamax', 'mate'):
+            move, seconds = solve(algorithm, board)
+            mates = move is not None and keeps_forced_mate(board, move, mate_in)
+            totals[algorithm][0] += mates
+            totals[algorithm][1] += seconds
+            print(f"{index + 1:<8}{mate_in:<9}{algorithm:<11}{str(move):<8}{'yes' if mates else 'no':<7}{seconds:>9.2f}")
+
+    for algorithm, (solved, seconds) in totals.items():
+        print(f"{algorithm}: {solved}/{len(MATE_PUZZLES)} mates kept in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
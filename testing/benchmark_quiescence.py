@@ -0,0 +1,100 @@
+# testing/benchmark_quiescence.py
+
+"""Quiescence Search Benchmark for V7P3R Chess Engine
+Compares the previous quiescence search (captures filtered from all legal moves,
+stand-pat while in check, full terminal checks at every node) with the current
+one (capture generator, check evasions) at the horizon of a fixed-depth search
+of tactical positions. Reports main search nodes, quiescence nodes and time.
+Run directly: python testing/benchmark_quiescence.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_quiescence import QuiescenceSearch, DELTA_MARGIN
+from v7p3r_utils import see_ge
+
+TACTICAL_POSITIONS = [
+    "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQK2R b KQkq - 0 5",
+    "2kr3r/pp1q1ppp/2n1bn2/2bpp3/4P3/2NP1N2/PPPBBPPP/R2QK2R w KQ - 0 9",
+    "r3k2r/pbpnqppp/1p2pn2/3p4/2PP4/P1NBPN2/1P3PPP/R2QK2R w KQkq - 0 10",
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "r1b1k2r/ppppnppp/2n2q2/2b5/3NP3/2P1B3/PP3PPP/RN1QKB1R w KQkq - 0 1",
+    "1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10"
+]
+
+SEARCH_DEPTH = 3
+
+
+class PreviousQuiescence(QuiescenceSearch):
+    """Quiescence search as it was before capture generation and check evasions"""
+
+    def quiescence_search(self, board, alpha, beta, our_color, primary_scorer, depth=0,
+                          incremental=None, tt=None, ply=0):
+        self.nodes += 1
+        if depth >= self.max_quiescence_depth:
+            return self._evaluate_quiet_position(board, our_color, primary_scorer, incremental, alpha, beta, ply)
+
+        stand_pat = self._evaluate_quiet_position(board, our_color, primary_scorer, incremental, alpha, beta, ply)
+        if stand_pat >= beta:
+            return beta
+        if alpha < stand_pat:
+            alpha = stand_pat
+
+        captures = [move for move in board.legal_moves if board.is_capture(move)]
+        captures.sort(key=lambda move: self._order_key(board, move, None), reverse=True)
+        for move in captures:
+            if stand_pat + self._capture_gain(board, move) + DELTA_MARGIN <= alpha:
+                continue
+            if not see_ge(board, move, 0):
+                continue
+            self._push(board, move, incremental)
+            score = -self.quiescence_search(board, -beta, -alpha, not our_color, primary_scorer, depth + 1,
+                                            incremental, tt, ply + 1)
+            self._pop(board, incremental)
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+        return alpha
+
+
+def run_search(quiescence_class, board):
+    """Main nodes, quiescence nodes and seconds for a fixed-depth search from a fresh engine"""
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['use_quiescence'] = True
+    config.config['engine_config']['depth'] = SEARCH_DEPTH
+    search = SearchController(config)
+    search.scoring.quiescence = quiescence_class(config)
+
+    start = time.perf_counter()
+    search.find_best_move(board.copy(), board.turn)
+    elapsed = time.perf_counter() - start
+    stats = search.get_search_stats()
+    return stats['nodes_searched'], stats['qnodes'], elapsed
+
+
+def main():
+    totals = {'previous': [0, 0, 0.0], 'current': [0, 0, 0.0]}
+    print(f"Depth {SEARCH_DEPTH} search with quiescence at the horizon")
+    print(f"{'position':<10}{'version':<10}{'nodes':>8}{'qnodes':>8}{'time (s)':>10}")
+    for index, fen in enumerate(TACTICAL_POSITIONS):
+        board = chess.Board(fen)
+        for name, quiescence_class in (('previous', PreviousQuiescence), ('current', QuiescenceSearch)):
+            result = run_search(quiescence_class, board)
+            for i, value in enumerate(result):
+                totals[name][i] += value
+            print(f"{index + 1:<10}{name:<10}{result[0]:>8}{result[1]:>8}{result[2]:>10.2f}")
+
+    for name, (nodes, qnodes, seconds) in totals.items():
+        print(f"{'total':<10}{name:<10}{nodes:>8}{qnodes:>8}{seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
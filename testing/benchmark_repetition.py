@@ -0,0 +1,83 @@
+# testing/benchmark_repetition.py
+
+"""Repetition Tracking Benchmark for V7P3R Chess Engine
+Searches endgames reached at the end of long games, where the board's move
+stack is deep, with repetition checks done by board.is_repetition (replaying
+the move stack) and by the search's Zobrist key history. Reports nodes and
+nodes per second; node counts should match.
+Run directly: python testing/benchmark_repetition.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+
+# Endgames after a long game: random openings, then shuffling until few pieces are left
+GAME_SEEDS = [3, 5, 8, 13, 21]
+MAX_PIECES = 10
+MIN_PLIES = 300
+
+SEARCH_DEPTH = 7
+REPEATS = 3
+
+
+def play_long_game(seed):
+    """Board with a deep move stack, reduced to an endgame by random play"""
+    rng = random.Random(seed)
+    board = chess.Board()
+    while True:
+        moves = list(board.legal_moves)
+        if not moves or board.is_game_over(claim_draw=False):
+            board = chess.Board()
+            continue
+        captures = [move for move in moves if board.is_capture(move)]
+        if len(board.piece_map()) > MAX_PIECES and captures and rng.random() < 0.3:
+            board.push(rng.choice(captures))
+        else:
+            board.push(rng.choice(moves))
+        if len(board.piece_map()) <= MAX_PIECES and len(board.move_stack) >= MIN_PLIES \
+                and not board.is_game_over(claim_draw=False) and not board.is_check():
+            return board
+
+
+def run_search(use_history, board):
+    """Nodes and best time of a fixed-depth search from a fresh search controller"""
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['use_repetition_history'] = use_history
+    config.config['engine_config']['depth'] = SEARCH_DEPTH
+
+    best = float('inf')
+    for _ in range(REPEATS):
+        search = SearchController(config)
+        start = time.perf_counter()
+        search.find_best_move(board, board.turn)
+        best = min(best, time.perf_counter() - start)
+    return search.get_search_stats()['nodes_searched'], best
+
+
+def main():
+    boards = [play_long_game(seed) for seed in GAME_SEEDS]
+    totals = {'move stack': [0, 0.0], 'key history': [0, 0.0]}
+    print(f"Depth {SEARCH_DEPTH} search of endgames after long games")
+    print(f"{'game':<6}{'plies':>6}{'version':>13}{'nodes':>8}{'nps':>8}")
+    for index, board in enumerate(boards):
+        for name, use_history in (('move stack', False), ('key history', True)):
+            nodes, seconds = run_search(use_history, board)
+            if nodes == 0:
+                continue  # Decided before the search (hanging piece or mate in one)
+            totals[name][0] += nodes
+            totals[name][1] += seconds
+            print(f"{index + 1:<6}{len(board.move_stack):>6}{name:>13}{nodes:>8}{nodes / seconds:>8.0f}")
+
+    for name, (nodes, seconds) in totals.items():
+        print(f"total {name}: {nodes} nodes in {seconds:.2f}s, {nodes / seconds:.0f} nps")
+
+
+if __name__ == "__main__":
+    main()
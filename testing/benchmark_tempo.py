@@ -0,0 +1,162 @@
+# testing/benchmark_tempo.py
+
+"""Tempo Stage Benchmark for V7P3R Chess Engine
+Times TempoCalculation.evaluate_tempo over every legal move of middlegame
+positions, against the previous version that pushed every reply looking for
+mate and always ran the threefold repetition claim check. Also checks the mate
+detector against a brute-force mate-in-one search.
+Run directly: python testing/benchmark_tempo.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+import chess
+from v7p3r_tempo import TempoCalculation
+from v7p3r_mate_threat import MateThreatDetector
+from v7p3r_utils import get_material_balance, is_capture_that_escapes_check, pushed_move, DRAW_PENALTY
+
+MIDDLEGAME_POSITIONS = [
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N1PN2/PP3PPP/R2QKB1R w KQ - 0 8",
+    "2kr3r/pp1q1ppp/2n1bn2/2bpp3/4P3/2NP1N2/PPPBBPPP/R2QK2R w KQ - 0 9",
+    "r3k2r/pbpnqppp/1p2pn2/3p4/2PP4/P1NBPN2/1P3PPP/R2QK2R w KQkq - 0 10",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "2r2rk1/pp1bqppp/2n1pn2/3p4/3P4/2PBPN2/P1Q2PPP/R1B2RK1 b - - 3 12"
+]
+
+REPEATS = 3
+
+
+def previous_is_draw_position(board):
+    return (board.is_stalemate() or
+            board.is_insufficient_material() or
+            board.is_seventyfive_moves() or
+            board.is_fivefold_repetition() or
+            board.can_claim_threefold_repetition() or
+            board.can_claim_fifty_moves())
+
+
+class PreviousTempo(TempoCalculation):
+    """Tempo calculation as it was before the mate threat detector"""
+
+    def evaluate_tempo(self, board, move, depth):
+        tempo_score = 0
+        critical_move = False
+        mover = board.turn
+        escapes_check_by_capture = is_capture_that_escapes_check(board, move)
+        with pushed_move(board, move):
+            if board.is_checkmate():
+                return self.checkmate_score, True
+            if board.is_stalemate():
+                return self.stalemate_penalty, True
+            if previous_is_draw_position(board):
+                if get_material_balance(board, mover) > 0:
+                    tempo_score += DRAW_PENALTY
+            mate_threat = self._find_mate_threat(board, depth)
+            if mate_threat:
+                if mate_threat > 0:
+                    tempo_score += self.mate_threat_bonus
+                    critical_move = True
+                else:
+                    tempo_score += mate_threat
+            if board.is_check():
+                tempo_score += 100
+        if escapes_check_by_capture:
+            tempo_score += 500
+            critical_move = True
+        return tempo_score, critical_move
+
+    def _find_mate_threat(self, board, max_depth):
+        if max_depth <= 0:
+            return None
+        if board.is_check():
+            legal_moves = list(board.legal_moves)
+            if len(legal_moves) == 1:
+                board.push(legal_moves[0])
+                if board.is_checkmate():
+                    board.pop()
+                    return -self.checkmate_score + max_depth
+                deeper_threat = self._find_mate_threat(board, max_depth - 1)
+                board.pop()
+                if deeper_threat:
+                    return deeper_threat
+        for move in board.legal_moves:
+            board.push(move)
+            if board.is_checkmate():
+                board.pop()
+                return self.checkmate_score - max_depth
+            board.pop()
+        return None
+
+
+def brute_force_mate_in_one(board):
+    for move in board.legal_moves:
+        with pushed_move(board, move):
+            if board.is_checkmate():
+                return True
+    return False
+
+
+def check_detector(games=100):
+    """Compare the detector with brute force along random games"""
+    detector = MateThreatDetector()
+    rng = random.Random(1)
+    positions = 0
+    for _ in range(games):
+        board = chess.Board()
+        for _ in range(150):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            if (detector.find_mate_in_one(board) is not None) != brute_force_mate_in_one(board):
+                print(f"✗ Detector disagrees with brute force on {board.fen()}")
+                return False
+            positions += 1
+            # Favour checks and captures so mating nets come up
+            forcing = [m for m in moves if board.is_capture(m) or board.gives_check(m)]
+            board.push(rng.choice(forcing) if forcing and rng.random() < 0.4 else rng.choice(moves))
+    print(f"✓ Detector matches brute force on {positions} positions")
+    return True
+
+
+def time_tempo(tempo, boards):
+    """Average microseconds per evaluate_tempo call"""
+    calls = 0
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for board in boards:
+            for move in list(board.legal_moves):
+                tempo.evaluate_tempo(board, move, 4)
+                calls += 1
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    if not check_detector():
+        return False
+
+    boards = [chess.Board(fen) for fen in MIDDLEGAME_POSITIONS]
+    before = time_tempo(PreviousTempo(), boards)
+
+    # Cold cache: nothing is kept, so every position is a miss
+    cold = TempoCalculation()
+    cold.mate_detector.cache_size = 0
+    after_cold = time_tempo(cold, boards)
+
+    warm = TempoCalculation()
+    time_tempo(warm, boards)
+    after_warm = time_tempo(warm, boards)
+
+    print(f"evaluate_tempo per move, {len(boards)} middlegame positions")
+    print(f"  previous:           {before:8.1f} us")
+    print(f"  current (no cache): {after_cold:8.1f} us ({before / after_cold:.1f}x)")
+    print(f"  current (cached):   {after_warm:8.1f} us ({before / after_warm:.1f}x)")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# testing/benchmark_terminal_state.py
+
+"""Terminal State Benchmark for V7P3R Chess Engine
+Times the per-node work of deciding checkmate, stalemate and insufficient
+material and producing the move list, the previous way (is_checkmate,
+is_stalemate, is_insufficient_material, then a fresh move generation) against
+get_terminal_state on a single generated list, for the negamax move loop
+(plain and staged), the quiescence depth limit and the tempo stage.
+Run directly: python testing/benchmark_terminal_state.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+import chess
+from v7p3r_move_ordering import MoveOrdering
+from v7p3r_utils import (
+    get_terminal_state, is_draw_position,
+    ONGOING, STALEMATE, INSUFFICIENT_MATERIAL, MIN_FIVEFOLD_PLIES, MIN_REPETITION_CLAIM_PLIES
+)
+
+GAMES = 40
+REPEATS = 7
+
+
+def sample_positions():
+    """Positions from random games, biased towards captures so all phases come up"""
+    rng = random.Random(11)
+    positions = []
+    for _ in range(GAMES):
+        board = chess.Board()
+        for _ in range(160):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            captures = [move for move in moves if board.is_capture(move)]
+            board.push(rng.choice(captures) if captures and rng.random() < 0.4 else rng.choice(moves))
+            positions.append(board.copy(stack=False))
+    return positions
+
+
+def previous_node(board):
+    if board.is_checkmate():
+        return None
+    if board.is_stalemate() or board.is_insufficient_material():
+        return None
+    return list(board.legal_moves)
+
+
+def current_node(board):
+    moves = list(board.generate_legal_moves())
+    if get_terminal_state(board, moves) != ONGOING:
+        return None
+    return moves
+
+
+def previous_staged(ordering, board):
+    if board.is_checkmate() or board.is_stalemate() or board.is_insufficient_material():
+        return None
+    return list(ordering.staged_moves(board))
+
+
+def current_staged(ordering, board):
+    moves = list(board.generate_legal_moves())
+    if get_terminal_state(board, moves) != ONGOING:
+        return None
+    return list(ordering.staged_moves(board, legal_moves=moves))
+
+
+def previous_leaf(board):
+    if board.is_checkmate():
+        return 1
+    if board.is_stalemate():
+        return 0
+    return 0 if board.is_insufficient_material() else 2
+
+
+def current_leaf(board):
+    state = get_terminal_state(board)
+    if state == ONGOING:
+        return 2
+    return 1 if state != STALEMATE and state != INSUFFICIENT_MATERIAL else 0
+
+
+def previous_tempo(board):
+    if board.is_checkmate() or board.is_stalemate():
+        return True
+    return (board.is_stalemate() or
+            board.is_insufficient_material() or
+            board.is_seventyfive_moves() or
+            (board.halfmove_clock >= MIN_FIVEFOLD_PLIES and board.is_fivefold_repetition()) or
+            (board.halfmove_clock >= MIN_REPETITION_CLAIM_PLIES and board.can_claim_threefold_repetition()) or
+            board.can_claim_fifty_moves())
+
+
+def current_tempo(board):
+    state = get_terminal_state(board)
+    if state != ONGOING and state != INSUFFICIENT_MATERIAL:
+        return True
+    return is_draw_position(board, state)
+
+
+def time_pair(previous, current, positions):
+    """Best average microseconds per position for both versions, timed alternately"""
+    best = [float('inf'), float('inf')]
+    for _ in range(REPEATS):
+        for index, function in enumerate((previous, current)):
+            start = time.perf_counter()
+            for board in positions:
+                function(board)
+            best[index] = min(best[index], time.perf_counter() - start)
+    return [seconds / len(positions) * 1e6 for seconds in best]
+
+
+def main():
+    positions = sample_positions()
+    ordering = MoveOrdering()
+
+    for board in positions:
+        if previous_node(board) != current_node(board) or \
+           previous_staged(ordering, board) != current_staged(ordering, board):
+            print(f"✗ Move lists differ at {board.fen()}")
+            return False
+
+    print(f"Per-node terminal checks and move generation, {len(positions)} positions")
+    cases = [
+        ('negamax move list', previous_node, current_node),
+        ('negamax staged', lambda board: previous_staged(ordering, board),
+         lambda board: current_staged(ordering, board)),
+        ('quiescence leaf', previous_leaf, current_leaf),
+        ('tempo terminal', previous_tempo, current_tempo)
+    ]
+    for name, previous, current in cases:
+        before, after = time_pair(previous, current, positions)
+        print(f"  {name:<18} {before:7.1f} us -> {after:7.1f} us ({before / after:.2f}x)")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# testing/test_attack_map.py
+
+"""Attack Map Tests for V7P3R Chess Engine
+Tests attack maps against python-chess attackers and the LRU cache behaviour.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_attack_map import AttackMap, AttackMapCache
+
+POSITIONS = [
+    chess.STARTING_FEN,
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1"
+]
+
+def test_matches_board_attackers():
+    """Test attacked squares, attackers and hanging masks against the board"""
+    print("Testing attack map against board.attackers...")
+
+    for fen in POSITIONS:
+        board = chess.Board(fen)
+        attack_map = AttackMap(board)
+        for color in chess.COLORS:
+            hanging = 0
+            for square in chess.SQUARES:
+                attackers = board.attackers_mask(color, square)
+                if attack_map.attackers(color, square) != attackers or \
+                   attack_map.is_attacked(color, square) != bool(attackers):
+                    print(f"✗ Attackers of {chess.square_name(square)} differ in {fen}")
+                    return False
+                piece = board.piece_at(square)
+                if piece and piece.color == color and piece.piece_type != chess.KING and \
+                   board.is_attacked_by(not color, square) and not board.is_attacked_by(color, square):
+                    hanging |= chess.BB_SQUARES[square]
+            if attack_map.hanging(color) != hanging:
+                print(f"✗ Hanging mask differs in {fen}")
+                return False
+
+    print("✓ Attack maps match the board")
+    return True
+
+def test_lru_cache():
+    """Test that positions are reused by key and the oldest entry is evicted"""
+    print("\nTesting attack map cache...")
+
+    cache = AttackMapCache(size=2)
+    boards = [chess.Board(fen) for fen in POSITIONS]
+
+    first = cache.get(boards[0])
+    if cache.get(boards[0]) is not first:
+        print("✗ Same position did not reuse its map")
+        return False
+
+    cache.get(boards[1])
+    cache.get(boards[2])  # Evicts the starting position
+    cache.get(boards[0])
+
+    if cache.hits == 1 and cache.misses == 4:
+        print("✓ Cache hits and evictions working correctly")
+        return True
+
+    print(f"✗ Unexpected cache statistics: {cache.get_stats()}")
+    return False
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Attack Map Test")
+    print("=" * 50)
+
+    results = [
+        test_matches_board_attackers(),
+        test_lru_cache()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Attack map working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Attack map needs adjustment")
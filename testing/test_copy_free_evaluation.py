@@ -0,0 +1,64 @@
+# testing/test_copy_free_evaluation.py
+
+"""Copy-Free Evaluation Tests for V7P3R Chess Engine
+Tests that scoring works on the caller's board with push/pop and leaves it unchanged.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_engine import V7P3REngine
+from v7p3r_utils import pushed_move
+
+def test_pushed_move_pops_on_error():
+    """Test that the move is taken back when the with block raises"""
+    print("Testing pushed_move cleanup...")
+
+    board = chess.Board()
+    try:
+        with pushed_move(board, chess.Move.from_uci("e2e4")):
+            raise ValueError("evaluation failed")
+    except ValueError:
+        pass
+
+    if board.fen() == chess.STARTING_FEN and not board.move_stack:
+        print("✓ Move taken back after exception")
+        return True
+
+    print(f"✗ Board left modified: {board.fen()}")
+    return False
+
+def test_find_move_without_copies():
+    """Test that a search makes no board copies and restores the board"""
+    print("\nTesting find_move board copy counter...")
+
+    engine = V7P3REngine("speed_config.json")
+    board = chess.Board("r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8")
+    fen = board.fen()
+
+    move = engine.find_move(board, 10.0)
+    engine.shutdown()
+
+    if move in board.legal_moves and board.fen() == fen and engine.last_board_copies == 0:
+        print(f"✓ Found {move} with {engine.last_board_copies} board copies")
+        return True
+
+    print(f"✗ Unexpected result: {move}, copies {engine.last_board_copies}, board {board.fen()}")
+    return False
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Copy-Free Evaluation Test")
+    print("=" * 50)
+
+    results = [
+        test_pushed_move_pops_on_error(),
+        test_find_move_without_copies()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Evaluation is copy-free!")
+    else:
+        print("✗ SOME TESTS FAILED - Evaluation still copies boards")
@@ -0,0 +1,85 @@
+# testing/test_eval_cache.py
+
+"""Evaluation Cache Tests for V7P3R Chess Engine
+Tests that cached evaluations match fresh ones and that the cache is keyed by perspective.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import chess
+from v7p3r_eval_cache import EvaluationCache
+from v7p3r_primary_scoring import PrimaryScoring
+
+WINDOWS = [(None, None), (-50, 50), (-2000, -1000), (1000, 2000)]
+
+def test_cached_matches_uncached():
+    """Test cached evaluations against an uncached scorer under several windows"""
+    print("Testing cached evaluations against fresh ones...")
+
+    cached = PrimaryScoring(EvaluationCache(1), lazy_eval=True)
+    fresh = PrimaryScoring(lazy_eval=True)
+    rng = random.Random(5)
+
+    for game in range(10):
+        board = chess.Board()
+        for ply in range(60):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            board.push(rng.choice(moves))
+            # Evaluate twice so the second pass comes from the cache
+            for _ in range(2):
+                for color in chess.COLORS:
+                    for alpha, beta in WINDOWS:
+                        expected = fresh.evaluate(board, color, None, alpha, beta)
+                        actual = cached.evaluate(board, color, None, alpha, beta)
+                        if actual != expected:
+                            print(f"✗ Cached score {actual} != {expected} at {board.fen()}")
+                            return False
+
+    if cached.eval_cache.hits == 0:
+        print("✗ Cache never hit")
+        return False
+
+    print(f"✓ Cached evaluations match ({cached.eval_cache.get_stats()['eval_cache_hit_rate']:.0%} hit rate)")
+    return True
+
+def test_perspective_keys():
+    """Test that both colors' evaluations of a position are cached separately"""
+    print("\nTesting cache keys per perspective...")
+
+    cache = EvaluationCache(1)
+    key = 0x1234
+    cache.store(cache.make_key(key, chess.WHITE), 100, 10)
+    if cache.probe(cache.make_key(key, chess.BLACK)) is not None:
+        print("✗ Black lookup returned White's evaluation")
+        return False
+    if cache.probe(cache.make_key(key, chess.WHITE)) != (100, 10):
+        print("✗ White lookup missed")
+        return False
+
+    cache.clear()
+    if cache.probe(cache.make_key(key, chess.WHITE)) is not None:
+        print("✗ Entry survived clear")
+        return False
+
+    print("✓ Perspective keys working correctly")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Evaluation Cache Test")
+    print("=" * 50)
+
+    results = [
+        test_cached_matches_uncached(),
+        test_perspective_keys()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Evaluation cache working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Evaluation cache needs adjustment")
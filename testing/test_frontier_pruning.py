@@ -0,0 +1,163 @@
+# testing/test_frontier_pruning.py
+
+"""Frontier Pruning Tests for V7P3R Chess Engine
+Tests when futility pruning and razoring apply, that tactical moves survive
+them and that searches with and without them agree.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_transposition import MATE_THRESHOLD
+from v7p3r_mate_threat import get_check_masks, may_give_check
+
+POSITIONS = [
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "r3k2r/pbpnqppp/1p2pn2/3p4/2PP4/P1NBPN2/1P3PPP/R2QK2R w KQkq - 0 10"
+]
+
+def make_search(use_pruning, depth=3):
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['depth'] = depth
+    config.config['engine_config']['use_futility_pruning'] = use_pruning
+    config.config['engine_config']['use_razoring'] = use_pruning
+    return SearchController(config)
+
+def test_pruning_conditions():
+    """Test that frontier pruning is skipped in check, deeper nodes and mate windows"""
+    print("Testing frontier pruning conditions...")
+
+    search = make_search(True)
+    cases = [
+        ((1, 0, 100, False), True),
+        ((2, -50, -49, False), True),
+        ((1, 0, 100, True), False),
+        ((3, 0, 100, False), False),
+        ((1, float('-inf'), 100, False), False),
+        ((1, MATE_THRESHOLD + 5, MATE_THRESHOLD + 6, False), False),
+        ((1, -MATE_THRESHOLD - 6, -MATE_THRESHOLD - 5, False), False)
+    ]
+    for args, expected in cases:
+        if search._can_prune_frontier(*args) != expected:
+            print(f"✗ Frontier pruning with {args} should be {expected}")
+            return False
+
+    # Captures, promotions and checks are never pruned
+    board = chess.Board("4k3/1P6/8/3p4/4P3/8/8/R3K3 w - - 0 1")
+    moves = {"e4d5": False, "b7b8q": False, "a1a8": False, "e4e5": True, "e1f2": True}
+    for uci, quiet in moves.items():
+        if search._is_quiet_move(board, chess.Move.from_uci(uci)) != quiet:
+            print(f"✗ {uci} quiet should be {quiet}")
+            return False
+
+    print("✓ Pruning conditions correct")
+    return True
+
+def test_check_filter():
+    """Test that the check-square filter never drops a checking move"""
+    print("\nTesting check filter in front of gives_check...")
+
+    # Discovered checks, castling, en passant and promotions with check
+    fens = [
+        "4k3/8/8/8/4N3/8/8/4R1K1 w - - 0 1",
+        "5k2/8/8/8/8/8/8/4K2R w K - 0 1",
+        "8/8/8/1k6/3Pp3/8/8/4K2B b - d3 0 1",
+        "3k4/1P6/8/8/8/8/8/4K3 w - - 0 1"
+    ]
+    rng = random.Random(25)
+    boards = [chess.Board(fen) for fen in fens]
+    for _ in range(40):
+        board = chess.Board()
+        for _ in range(rng.randrange(10, 80)):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            board.push(rng.choice(moves))
+        boards.append(board)
+
+    checks = 0
+    filtered = 0
+    total = 0
+    for board in boards:
+        check_masks = get_check_masks(board)
+        for move in board.legal_moves:
+            total += 1
+            if not may_give_check(board, move, check_masks):
+                filtered += 1
+                if board.gives_check(move):
+                    print(f"✗ Filter dropped the check {move} at {board.fen()}")
+                    return False
+            elif board.gives_check(move):
+                checks += 1
+
+    if checks == 0 or filtered == 0:
+        print(f"✗ Nothing to compare: {checks} checks, {filtered} filtered")
+        return False
+
+    print(f"✓ {checks} checks kept, {filtered} of {total} moves skip gives_check")
+    return True
+
+def test_tactics_kept():
+    """Test that a queen sacrifice mating with a quiet check is still found"""
+    print("\nTesting tactics with frontier pruning...")
+
+    board = chess.Board("r1b2k1r/ppp1bppp/8/1B1Q4/5q2/2P5/PPP2PPP/R3R1K1 w - - 1 1")
+    search = make_search(True, depth=4)
+    move = search.find_best_move(board, board.turn)
+    stats = search.get_search_stats()
+    if move != chess.Move.from_uci("d5d8"):
+        print(f"✗ Found {move} instead of the mating d5d8")
+        return False
+    if stats['futility_prunes'] == 0 or stats['razor_cutoffs'] > stats['razor_attempts']:
+        print(f"✗ Unexpected pruning counters {stats['futility_prunes']}, "
+              f"{stats['razor_attempts']}, {stats['razor_cutoffs']}")
+        return False
+
+    print(f"✓ Mate found with {stats['futility_prunes']} quiet moves pruned")
+    return True
+
+def test_same_best_moves():
+    """Test that pruning searches fewer nodes and picks the same moves"""
+    print("\nTesting searches with and without frontier pruning...")
+
+    nodes = [0, 0]
+    for fen in POSITIONS:
+        moves = []
+        for index, use_pruning in enumerate((False, True)):
+            board = chess.Board(fen)
+            search = make_search(use_pruning)
+            moves.append(search.find_best_move(board, board.turn))
+            nodes[index] += search.get_search_stats()['nodes_searched']
+        if moves[0] != moves[1]:
+            print(f"✗ Best move changed from {moves[0]} to {moves[1]} at {fen}")
+            return False
+
+    if nodes[1] >= nodes[0]:
+        print(f"✗ Pruning didn't reduce nodes: {nodes}")
+        return False
+
+    print(f"✓ Same moves, {nodes[0]} -> {nodes[1]} nodes")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Frontier Pruning Test")
+    print("=" * 50)
+
+    results = [
+        test_pruning_conditions(),
+        test_check_filter(),
+        test_tactics_kept(),
+        test_same_best_moves()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Frontier pruning working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Frontier pruning needs adjustment")
@@ -0,0 +1,95 @@
+# testing/test_incremental_eval.py
+
+"""Incremental Evaluation Tests for V7P3R Chess Engine
+Tests that material/PST values kept across push/pop match a full recompute.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import chess
+from v7p3r_primary_scoring import PrimaryScoring
+from v7p3r_incremental import IncrementalEvaluation
+
+def test_random_games_match_full_recompute():
+    """Test make/unmake over random games, including castling, en passant and promotion"""
+    print("Testing incremental evaluation against full recompute...")
+
+    primary = PrimaryScoring()
+    state = IncrementalEvaluation(primary.pst, debug=True)
+    rng = random.Random(7)
+    special_moves = set()
+
+    for game in range(20):
+        board = chess.Board()
+        state.reset(board)
+        for ply in range(120):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            # Prefer rare special moves when they come up so every kind is exercised
+            special = [m for m in moves if board.is_en_passant(m) or board.is_castling(m) or m.promotion]
+            move = rng.choice(special or moves)
+            if board.is_castling(move):
+                special_moves.add('castling')
+            elif board.is_en_passant(move):
+                special_moves.add('en passant')
+            elif move.promotion:
+                special_moves.add('promotion')
+            state.push(board, move)
+            try:
+                state.verify(board, chess.WHITE, primary)
+                state.verify(board, chess.BLACK, primary)
+            except RuntimeError as error:
+                print(f"✗ {error}")
+                return False
+
+        # Unwind the whole game and check the root values are restored
+        while board.move_stack:
+            state.pop(board)
+        state.verify(board, chess.WHITE, primary)
+
+    if special_moves != {'castling', 'en passant', 'promotion'}:
+        print(f"✗ Random games did not cover all special moves: {special_moves}")
+        return False
+
+    print("✓ Incremental values match full recompute")
+    return True
+
+def test_null_move():
+    """Test that a null move leaves the values unchanged"""
+    print("\nTesting null move...")
+
+    primary = PrimaryScoring()
+    state = IncrementalEvaluation(primary.pst)
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+    state.reset(board)
+    before = state.get_pst_score(chess.WHITE)
+
+    state.push(board, chess.Move.null())
+    after = state.get_pst_score(chess.WHITE)
+    state.pop(board)
+
+    if before == after == primary._get_pst_score(board, chess.WHITE):
+        print("✓ Null move handled correctly")
+        return True
+
+    print(f"✗ PST changed across null move: {before} -> {after}")
+    return False
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Incremental Evaluation Test")
+    print("=" * 50)
+
+    results = [
+        test_random_games_match_full_recompute(),
+        test_null_move()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Incremental evaluation working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Incremental evaluation needs adjustment")
@@ -0,0 +1,121 @@
+# testing/test_late_move_reduction.py
+
+"""Late Move Reduction Tests for V7P3R Chess Engine
+Tests that quiet moves ordered past the old move limit are still searched and
+that a reduced search beating alpha is re-searched at full depth.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+
+# Only Ke3-f3 mates in two, and it is ordered far behind the queen moves
+QUIET_MATE_FEN = "8/8/8/8/7Q/4K3/8/6k1 w - - 0 1"
+QUIET_MATE_MOVE = chess.Move.from_uci("e3f3")
+
+MIDDLEGAME_FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8"
+
+def make_search(use_lmr, depth=6):
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['use_late_move_reduction'] = use_lmr
+    config.config['engine_config']['depth'] = depth
+    return SearchController(config)
+
+def test_late_quiet_move_found():
+    """Test that a quiet mate past max_ordered_moves is found once the move limit is gone"""
+    print("Testing quiet move past the move limit...")
+
+    board = chess.Board(QUIET_MATE_FEN)
+    search = make_search(True)
+    if search.move_limit is not None:
+        print(f"✗ Move limit {search.move_limit} still set with late move reductions")
+        return False
+
+    search.repetition.reset(board)
+    ordered = search.move_ordering.order_moves(board, list(board.legal_moves))
+    move_index = ordered.index(QUIET_MATE_MOVE)
+    if move_index < search.max_ordered_moves:
+        print(f"✗ {QUIET_MATE_MOVE} is ordered at {move_index}, inside the old limit")
+        return False
+
+    move = search.find_best_move(board, board.turn)
+    line = search.get_principal_variation()
+    for pv_move in line:
+        board.push(pv_move)
+    mated = board.is_checkmate()
+    for _ in line:
+        board.pop()
+    if move != QUIET_MATE_MOVE or not mated:
+        print(f"✗ Found {move} with line {[m.uci() for m in line]}")
+        return False
+    if search.get_search_stats()['lmr_researches'] == 0:
+        print("✗ No reduced search was re-searched")
+        return False
+
+    # The old truncation never looks at the move
+    truncated = make_search(False)
+    truncated_move = truncated.find_best_move(board, board.turn)
+    if truncated.move_limit != truncated.max_ordered_moves or truncated_move == QUIET_MATE_MOVE:
+        print(f"✗ Truncated search found {truncated_move}")
+        return False
+
+    print(f"✓ {QUIET_MATE_MOVE} found from move {move_index} (truncated search plays {truncated_move})")
+    return True
+
+def test_reduced_move_researched():
+    """Test that a reduced search beating alpha is repeated at full depth"""
+    print("\nTesting re-search of a reduced move...")
+
+    board = chess.Board(MIDDLEGAME_FEN)
+    search = make_search(True)
+    search._reset_search_stats()
+    search.eval_state.reset(board)
+    search.repetition.reset(board)
+
+    # Record the depth of each search of the move's child position
+    depth = 3
+    child_depths = []
+    original_negamax = search._negamax
+    def spy_negamax(board, child_depth, alpha, beta, our_color, ply=1, allow_null=True):
+        if ply == 1:
+            child_depths.append(child_depth)
+        return original_negamax(board, child_depth, alpha, beta, our_color, ply, allow_null)
+    search._negamax = spy_negamax
+
+    # A late quiet move with a very low alpha: the reduced search is bound to beat it
+    move = chess.Move.from_uci("a2a3")
+    move_index = search.max_ordered_moves
+    reduction = search._get_reduction(board, move, move_index, depth, -10000, 0, False)
+    search._search_move(board, move, move_index, depth, -10000, 10000, board.turn, 0, False)
+
+    if reduction == 0 or child_depths[0] != depth - 1 - reduction:
+        print(f"✗ Move not reduced: reduction {reduction}, depths {child_depths}")
+        return False
+    if depth - 1 not in child_depths[1:] or search.lmr_researches == 0:
+        print(f"✗ No full-depth re-search: depths {child_depths}")
+        return False
+    if board.fen() != MIDDLEGAME_FEN:
+        print("✗ Board not restored")
+        return False
+
+    print(f"✓ Searched at depths {child_depths}")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Late Move Reduction Test")
+    print("=" * 50)
+
+    results = [
+        test_late_quiet_move_found(),
+        test_reduced_move_researched()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Late move reductions working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Late move reductions need adjustment")
@@ -0,0 +1,93 @@
+# testing/test_lazy_eval.py
+
+"""Lazy Evaluation Tests for V7P3R Chess Engine
+Tests that the capped capture term puts scores with and without a search
+window on the same scale, and that a window only decides whether it is skipped.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_primary_scoring import PrimaryScoring, LAZY_EVAL_MARGIN
+
+# Capture potential far above the margin
+CAPTURE_HEAVY_FEN = "r3k2r/ppp2ppp/2n5/3q4/3n4/2N2Q2/PPP2PPP/R3K2R w KQkq - 0 1"
+
+INF = float('inf')
+WINDOWS = [(None, None), (-INF, INF), (-INF, 50), (-50, INF), (-50, 50), (-2000, -1000), (1000, 2000)]
+
+def test_same_scale_with_and_without_window():
+    """Test that a window changes the score only by skipping the capped capture term"""
+    print("Testing lazy evaluation scale...")
+
+    primary = PrimaryScoring(lazy_eval=True)
+    board = chess.Board(CAPTURE_HEAVY_FEN)
+    capture_score = primary._get_capture_potential(board, board.turn)
+    if capture_score <= LAZY_EVAL_MARGIN:
+        print(f"✗ Capture potential {capture_score} doesn't exceed the margin")
+        return False
+
+    unbounded = primary.evaluate(board, board.turn)
+    if primary.evaluate(board, board.turn, None, -50, 50) != unbounded or \
+       primary.evaluate_primary_score(board, board.turn)['total'] != unbounded:
+        print(f"✗ Scores differ with a window or in the breakdown ({unbounded})")
+        return False
+
+    rng = random.Random(16)
+    for _ in range(10):
+        board = chess.Board()
+        for _ in range(50):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            board.push(rng.choice(moves))
+            base_score = primary._get_material_score(board, board.turn) + primary._get_pst_score(board, board.turn) \
+                + primary._get_pawn_structure_score(board, board.turn)
+            unbounded = primary.evaluate(board, board.turn)
+            for alpha, beta in WINDOWS:
+                score = primary.evaluate(board, board.turn, None, alpha, beta)
+                if score != unbounded and score != base_score:
+                    print(f"✗ Window ({alpha}, {beta}) gave {score}, {unbounded} without at {board.fen()}")
+                    return False
+
+    print("✓ Capture term capped to the same total with and without a window")
+    return True
+
+def test_search_evaluation_consistent():
+    """Test that the search's leaf and static evaluations agree across windows"""
+    print("\nTesting search evaluation across windows...")
+
+    search = SearchController(V7P3RConfig("speed_config.json"))
+    board = chess.Board(CAPTURE_HEAVY_FEN)
+    search.eval_state.reset(board)
+    static_eval = search._evaluate(board, board.turn)
+    for alpha, beta in [(-INF, INF), (-50, 50), (-INF, 50), (-50, INF)]:
+        score = search._evaluate(board, board.turn, alpha, beta)
+        stand_pat = search.scoring.quiescence._stand_pat(board, board.turn, search.scoring.primary,
+                                                         search.eval_state, alpha, beta)
+        if score != static_eval or stand_pat != static_eval:
+            print(f"✗ Window ({alpha}, {beta}) gave {score} and stand pat {stand_pat}, static {static_eval}")
+            return False
+
+    print(f"✓ Static, leaf and stand pat scores all {static_eval}")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Lazy Evaluation Test")
+    print("=" * 50)
+
+    results = [
+        test_same_scale_with_and_without_window(),
+        test_search_evaluation_consistent()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Lazy evaluation working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Lazy evaluation needs adjustment")
@@ -0,0 +1,101 @@
+# testing/test_mate_search.py
+
+"""Mate Search Tests for V7P3R Chess Engine
+Tests the proof-number mate search on known mates, its node budget, and the
+"mate" search algorithm and engine pre-pass that use it.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_engine import V7P3REngine
+from v7p3r_mate_search import MateSearch
+
+# Forced mates in two: Nf6+ gxf6 Bxf7#, Qd8+ Bxd8 Re8#
+MATE_IN_TWO = [
+    "r2qkb1r/pp2nppp/3p4/2pNN1B1/2BnP3/3P4/PPP2PPP/R2bK2R w KQkq - 1 1",
+    "r1b2k1r/ppp1bppp/8/1B1Q4/5q2/2P5/PPP2PPP/R3R1K1 w - - 1 1"
+]
+
+def test_proves_mates():
+    """Test that known mates are proven and the line ends in checkmate"""
+    print("Testing proof-number mate search...")
+
+    solver = MateSearch(3)
+    for fen in MATE_IN_TWO:
+        board = chess.Board(fen)
+        move = solver.solve(board)
+        if move is None or solver.mate_in != 2 or board.fen() != chess.Board(fen).fen():
+            print(f"✗ Mate in 2 not proven at {fen} (got {move}, mate in {solver.mate_in})")
+            return False
+        for line_move in solver.principal_variation:
+            board.push(line_move)
+        if not board.is_checkmate():
+            print(f"✗ Line {[m.uci() for m in solver.principal_variation]} does not mate")
+            return False
+
+    # A quiet middlegame position has no forced mate
+    board = chess.Board("r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8")
+    if MateSearch(2).solve(board) is not None:
+        print("✗ Mate reported in a quiet position")
+        return False
+
+    print("✓ Mates proven and disproven correctly")
+    return True
+
+def test_node_budget():
+    """Test that the search stops at the node budget without proving anything"""
+    print("\nTesting mate search node budget...")
+
+    solver = MateSearch(3)
+    board = chess.Board(MATE_IN_TWO[0])
+    move = solver.solve(board, max_nodes=10)
+    if move is not None or solver.nodes > 10 + len(list(board.legal_moves)):
+        print(f"✗ Budget not respected ({solver.nodes} nodes, move {move})")
+        return False
+
+    print(f"✓ Stopped after {solver.nodes} nodes")
+    return True
+
+def test_search_integration():
+    """Test the mate search algorithm and the engine's mate search call"""
+    print("\nTesting mate search integration...")
+
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['search_algorithm'] = 'mate'
+    search = SearchController(config)
+    board = chess.Board(MATE_IN_TWO[1])
+    move = search.find_best_move(board, board.turn)
+    stats = search.get_search_stats()
+    if move != chess.Move.from_uci("d5d8") or stats['mate_search_mate_in'] != 2:
+        print(f"✗ Mate algorithm returned {move} with {stats}")
+        return False
+
+    engine = V7P3REngine("speed_config.json")
+    move = engine.find_mate(chess.Board(MATE_IN_TWO[0]))
+    if move != chess.Move.from_uci("d5f6"):
+        print(f"✗ Engine mate search returned {move}")
+        return False
+
+    print("✓ Mate search algorithm and engine call working")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Mate Search Test")
+    print("=" * 50)
+
+    results = [
+        test_proves_mates(),
+        test_node_budget(),
+        test_search_integration()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Mate search working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Mate search needs adjustment")
@@ -0,0 +1,95 @@
+# testing/test_mate_threat.py
+
+"""Mate Threat Tests for V7P3R Chess Engine
+Tests mate-in-one detection on known positions, the sign of mate threats and
+the position cache.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_mate_threat import MateThreatDetector
+
+def test_mate_in_one():
+    """Test known mates, including discovered and smothered ones, and near misses"""
+    print("Testing mate-in-one detection...")
+
+    detector = MateThreatDetector()
+    mates = {
+        "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1": "a1a8",                   # Back rank
+        "6rk/6pp/8/6N1/8/8/8/6K1 w - - 0 1": "g5f7",                    # Smothered
+        "7k/8/8/8/8/8/6PP/1q2R2K b - - 0 1": "b1e1",                    # Capture with mate
+        "r1b1kb1r/ppP3pp/3pq3/4np2/P7/3P2P1/1P2PP2/R1BQKBR1 b Q - 0 17": "e5f3"  # Pins the e2 pawn
+    }
+    for fen, expected in mates.items():
+        move = detector.find_mate_in_one(chess.Board(fen))
+        if move is None or move.uci() != expected:
+            print(f"✗ Expected {expected}, got {move} at {fen}")
+            return False
+
+    # Back rank check with an escape square, and a check the rook can be captured after
+    for fen in ("6k1/5pp1/8/8/8/8/8/R5K1 w - - 0 1", "5rk1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"):
+        move = detector.find_mate_in_one(chess.Board(fen))
+        if move is not None:
+            print(f"✗ False mate {move} at {fen}")
+            return False
+
+    print("✓ Mate-in-one detection correct")
+    return True
+
+def test_threat_sign():
+    """Test that the opponent's mate is negative and our forced mate is positive"""
+    print("\nTesting mate threat sign...")
+
+    detector = MateThreatDetector()
+
+    # Black to move mates with Qxe1
+    board = chess.Board("7k/8/8/8/8/8/6PP/1q2R2K b - - 0 1")
+    threat = detector.find_mate_threat(board, 2)
+    if threat is None or threat >= 0:
+        print(f"✗ Opponent mate scored {threat}")
+        return False
+
+    # Black is in check with Kg8 as the only reply, then Ra8 mates
+    board = chess.Board("7k/8/5K2/8/8/8/8/R6R b - - 0 1")
+    threat = detector.find_mate_threat(board, 2)
+    if threat is None or threat <= 0:
+        print(f"✗ Forced mate scored {threat}")
+        return False
+
+    print("✓ Mate threat signs correct")
+    return True
+
+def test_cache():
+    """Test that repeated positions are answered from the cache"""
+    print("\nTesting mate threat cache...")
+
+    detector = MateThreatDetector()
+    board = chess.Board("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    first = detector.find_mate_in_one(board)
+    second = detector.find_mate_in_one(board)
+    stats = detector.get_stats()
+    if first != second or stats['mate_threat_hits'] != 1 or stats['mate_threat_misses'] != 1:
+        print(f"✗ Unexpected cache behaviour {stats}")
+        return False
+
+    print("✓ Mate threat cache working")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Mate Threat Test")
+    print("=" * 50)
+
+    results = [
+        test_mate_in_one(),
+        test_threat_sign(),
+        test_cache()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Mate threat detection working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Mate threat detection needs adjustment")
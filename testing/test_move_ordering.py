@@ -0,0 +1,175 @@
+# testing/test_move_ordering.py
+
+"""Move Ordering Tests for V7P3R Chess Engine
+Tests the staged move picker used by the search and the killer and history
+tables the search fills in.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_engine import V7P3REngine
+from v7p3r_search import SearchController
+from v7p3r_move_ordering import MoveOrdering, KILLER_SLOTS
+
+MIDDLEGAME_FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8"
+
+def test_staged_moves_complete():
+    """Test that the staged picker yields every legal move exactly once"""
+    print("Testing staged move generation covers all legal moves...")
+
+    move_ordering = MoveOrdering()
+    fens = [
+        chess.STARTING_FEN,
+        "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+        "8/1P4k1/8/8/3p4/8/4PK2/8 w - - 0 1",  # Promotion
+        "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",  # En passant
+        "4k3/8/8/8/8/8/4r3/4K3 w - - 0 1"  # In check
+    ]
+
+    for fen in fens:
+        board = chess.Board(fen)
+        legal = list(board.legal_moves)
+        # Hash move is one of the legal moves, so it must not be repeated later
+        staged = list(move_ordering.staged_moves(board, 1, legal[-1]))
+        if len(staged) != len(legal) or set(staged) != set(legal):
+            print(f"✗ Staged moves differ from legal moves in {fen}")
+            return False
+
+    print("✓ Every legal move yielded exactly once")
+    return True
+
+def test_stage_order():
+    """Test hash move, winning captures, killers, quiets, then losing captures"""
+    print("\nTesting staged move order...")
+
+    move_ordering = MoveOrdering()
+    # Qxd5 loses the queen to the c6 pawn, exd5 wins a pawn
+    board = chess.Board("4k3/8/2p5/3p4/4P3/8/8/3QK2R w K - 0 1")
+    hash_move = chess.Move.from_uci("h1h7")
+    killer = chess.Move.from_uci("d1a4")
+    move_ordering.update_killer_move(1, killer)
+
+    staged = list(move_ordering.staged_moves(board, 1, hash_move))
+    expected_start = [hash_move, chess.Move.from_uci("e4d5"), killer]
+    losing_capture = chess.Move.from_uci("d1d5")
+
+    if staged[:3] == expected_start and staged[-1] == losing_capture:
+        print("✓ Stages yielded in order")
+        return True
+
+    print(f"✗ Unexpected order: {[move.uci() for move in staged]}")
+    return False
+
+def test_cutoffs_recorded():
+    """Test that the search records quiet cutoff moves in the killer and history tables"""
+    print("\nTesting killer and history updates...")
+
+    search = SearchController(V7P3RConfig("speed_config.json"))
+    board = chess.Board(MIDDLEGAME_FEN)
+    search._reset_search_stats()
+    if search.eval_state:
+        search.eval_state.reset(board)
+    if search.repetition:
+        search.repetition.reset(board)
+    search._negamax(board, 3, float('-inf'), float('inf'), board.turn)
+
+    move_ordering = search.move_ordering
+    killers = [killer for ply_killers in move_ordering.killer_moves for killer in ply_killers if killer]
+    history_moves = [(from_square, to_square) for from_square in range(64) for to_square in range(64)
+                     if move_ordering.history[from_square][to_square] > 0]
+    if search.cutoffs == 0 or not killers or not history_moves:
+        print(f"✗ Nothing recorded: {search.cutoffs} cutoffs, {len(killers)} killers, "
+              f"{len(history_moves)} history entries")
+        return False
+
+    # Every killer also has history (both are updated for the same quiet cutoff)
+    for killer in killers:
+        if move_ordering.history[killer.from_square][killer.to_square] == 0:
+            print(f"✗ Killer {killer} has no history")
+            return False
+    # Killers at ply 1 are moves in this position, none of them may be a capture
+    for killer in move_ordering.get_killer_moves(1):
+        if killer and board.is_capture(killer):
+            print(f"✗ Capture {killer} recorded as a killer")
+            return False
+
+    print(f"✓ {len(killers)} killers and {len(history_moves)} history entries from {search.cutoffs} cutoffs")
+    return True
+
+def test_tables_aged_between_moves():
+    """Test that killers are cleared and history halved at the start of each engine move"""
+    print("\nTesting table aging between find_move calls...")
+
+    engine = V7P3REngine("speed_config.json")
+    move_ordering = engine.main_search.move_ordering
+    board = chess.Board(MIDDLEGAME_FEN)
+    engine.find_move(board, time_limit=10.0)
+    history_before = [row[:] for row in move_ordering.history]
+    if not any(any(row) for row in history_before):
+        print("✗ First search left no history")
+        return False
+
+    # Look at the tables right after aging, before the second search fills them again
+    aged = {}
+    original_age_tables = move_ordering.age_tables
+    def spy_age_tables():
+        original_age_tables()
+        aged['killers'] = [killer for ply_killers in move_ordering.killer_moves for killer in ply_killers]
+        aged['history'] = [row[:] for row in move_ordering.history]
+    move_ordering.age_tables = spy_age_tables
+    engine.find_move(board, time_limit=10.0)
+
+    if not aged:
+        print("✗ Tables not aged by the second search")
+        return False
+    if any(aged['killers']) or len(aged['killers']) % KILLER_SLOTS:
+        print("✗ Killers not cleared")
+        return False
+    expected = [[value // 2 for value in row] for row in history_before]
+    if aged['history'] != expected:
+        print("✗ History not halved")
+        return False
+
+    print("✓ Killers cleared and history halved")
+    return True
+
+def test_first_move_cutoff_stats():
+    """Test that the share of first-move cutoffs is reported"""
+    print("\nTesting first-move cutoff statistics...")
+
+    search = SearchController(V7P3RConfig("speed_config.json"))
+    board = chess.Board(MIDDLEGAME_FEN)
+    search.find_best_move(board, board.turn)
+    stats = search.get_search_stats()
+    percentage = stats.get('first_move_cutoff_pct')
+    if percentage is None or stats['cutoffs'] == 0 or not 0 < percentage <= 100:
+        print(f"✗ Unexpected cutoff stats: {stats.get('cutoffs')} cutoffs, {percentage}%")
+        return False
+    if abs(percentage - search.first_move_cutoffs / search.cutoffs * 100) > 1e-9:
+        print("✗ Percentage doesn't match the counters")
+        return False
+
+    print(f"✓ {percentage:.1f}% of {stats['cutoffs']} cutoffs on the first move")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Move Ordering Test")
+    print("=" * 50)
+
+    results = [
+        test_staged_moves_complete(),
+        test_stage_order(),
+        test_cutoffs_recorded(),
+        test_tables_aged_between_moves(),
+        test_first_move_cutoff_stats()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Move ordering working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Move ordering needs adjustment")
@@ -0,0 +1,143 @@
+# testing/test_null_move.py
+
+"""Null Move Pruning Tests for V7P3R Chess Engine
+Tests when the search tries a null move, the config switch, and that mate
+scores from a null move search are not trusted.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_transposition import MATE_THRESHOLD
+
+MIDDLEGAME_FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8"
+ENDGAME_FEN = "8/5pk1/6p1/8/7P/6P1/5PK1/8 w - - 0 40"
+IN_CHECK_FEN = "rnbqkbnr/ppppp1pp/5p2/7Q/4P3/8/PPPP1PPP/RNB1KBNR b KQkq - 1 2"
+
+# Score of the opponent after our pass when the null search says they get mated
+OPPONENT_MATED = -(MATE_THRESHOLD + 10)
+
+def make_search(use_null_move=True, use_incremental_eval=True):
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['use_null_move'] = use_null_move
+    config.config['engine_config']['use_incremental_eval'] = use_incremental_eval
+    return SearchController(config)
+
+def prepare(search, board):
+    """Set up the per-search state _negamax expects"""
+    search._reset_search_stats()
+    if search.eval_state:
+        search.eval_state.reset(board)
+    if search.repetition:
+        search.repetition.reset(board)
+
+def test_null_move_conditions():
+    """Test that no null move is tried in check or in the endgame"""
+    print("Testing null move conditions...")
+
+    for use_incremental_eval in (True, False):
+        search = make_search(use_incremental_eval=use_incremental_eval)
+        cases = [
+            (MIDDLEGAME_FEN, 3, False, True),
+            (MIDDLEGAME_FEN, 3, True, False),   # In check
+            (MIDDLEGAME_FEN, 2, False, False),  # Too shallow for the reduction
+            (ENDGAME_FEN, 3, False, False)      # Zugzwang risk
+        ]
+        for fen, depth, in_check, expected in cases:
+            board = chess.Board(fen)
+            prepare(search, board)
+            if search._can_try_null_move(board, depth, 100, in_check) != expected:
+                print(f"✗ Null move at {fen}, depth {depth}, in check {in_check} "
+                      f"should be {expected} (incremental eval {use_incremental_eval})")
+                return False
+
+    # A real search never passes while in check
+    search = make_search()
+    board = chess.Board(IN_CHECK_FEN)
+    prepare(search, board)
+    attempts = []
+    original_can_try = search._can_try_null_move
+    def spy_can_try(board, depth, beta, in_check):
+        result = original_can_try(board, depth, beta, in_check)
+        if result:
+            attempts.append(board.is_check())
+        return result
+    search._can_try_null_move = spy_can_try
+    search._negamax(board, 4, -50, 50, board.turn)
+    if any(attempts):
+        print("✗ Null move tried in check")
+        return False
+
+    print("✓ Null move skipped in check, at shallow depth and in the endgame")
+    return True
+
+def test_null_move_disabled():
+    """Test that use_null_move=false turns null move pruning off"""
+    print("\nTesting null move config switch...")
+
+    attempts = []
+    for use_null_move in (True, False):
+        search = make_search(use_null_move)
+        board = chess.Board(MIDDLEGAME_FEN)
+        search.find_best_move(board, board.turn)
+        attempts.append(search.get_search_stats()['null_move_attempts'])
+
+    if attempts[0] == 0 or attempts[1] != 0:
+        print(f"✗ Null move attempts with and without the switch: {attempts}")
+        return False
+
+    print(f"✓ {attempts[0]} null move attempts when enabled, none when disabled")
+    return True
+
+def test_null_mate_score_not_trusted():
+    """Test that a mate score from the null move search returns beta"""
+    print("\nTesting mate scores from the null move search...")
+
+    results = {}
+    for null_child_score in (OPPONENT_MATED, -500):
+        search = make_search()
+        board = chess.Board(MIDDLEGAME_FEN)
+        prepare(search, board)
+
+        # The null move search returns the given score for the opponent after our pass
+        original_negamax = search._negamax
+        def fake_null_search(board, depth, alpha, beta, our_color, ply=1, allow_null=True):
+            if not allow_null and board.move_stack and board.move_stack[-1] == chess.Move.null():
+                return null_child_score
+            return original_negamax(board, depth, alpha, beta, our_color, ply, allow_null)
+        search._negamax = fake_null_search
+
+        results[null_child_score] = search._negamax(board, 3, 0, 1, board.turn)
+        if search.null_move_cutoffs != 1 or board.fen() != MIDDLEGAME_FEN:
+            print(f"✗ Null move didn't cut off cleanly ({search.null_move_cutoffs} cutoffs)")
+            return False
+
+    if results[OPPONENT_MATED] != 1:
+        print(f"✗ Mate score from the null search returned {results[OPPONENT_MATED]} instead of beta")
+        return False
+    if results[-500] != 500:
+        print(f"✗ Ordinary null search score returned as {results[-500]}")
+        return False
+
+    print("✓ Mate scores replaced by beta, other scores kept")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Null Move Pruning Test")
+    print("=" * 50)
+
+    results = [
+        test_null_move_conditions(),
+        test_null_move_disabled(),
+        test_null_mate_score_not_trusted()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Null move pruning working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Null move pruning needs adjustment")
@@ -0,0 +1,190 @@
+# testing/test_parallel_search.py
+
+"""Parallel Search Tests for V7P3R Chess Engine
+Tests the lazy SMP search with helper processes sharing the transposition
+table, and the root split search with its process pool.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import chess
+import v7p3r_parallel
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_parallel import LazySMPSearch, RootSplitPool
+
+MIDDLEGAME_FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8"
+ROOT_SPLIT_POSITIONS = [
+    MIDDLEGAME_FEN,
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "8/5pk1/6p1/3R4/7P/6P1/r4PK1/8 w - - 0 40"
+]
+ROOT_SPLIT_DEPTH = 3
+
+def root_search(root_pool, board):
+    """Fixed-depth root search from fresh tables, with or without the pool"""
+    search = SearchController(V7P3RConfig("speed_config.json"), root_pool=root_pool)
+    search._reset_search_stats()
+    search.eval_state.reset(board)
+    search.repetition.reset(board)
+    move, score = search._negamax_root(board, board.turn, list(board.legal_moves), ROOT_SPLIT_DEPTH)
+    return search, move, score
+
+def test_lazy_smp_search():
+    """Test that lazy SMP returns a legal move, sums helper nodes and stops its helpers"""
+    print("Testing lazy SMP search...")
+
+    config = V7P3RConfig("speed_config.json")
+    search = LazySMPSearch(config, 2)
+    processes = []
+    try:
+        board = chess.Board(MIDDLEGAME_FEN)
+        move = search.find_best_move(board, board.turn, time_limit=5.0)
+        processes = list(search.processes)
+        stats = search.get_search_stats()
+
+        if move not in board.legal_moves:
+            print(f"✗ Illegal move {move}")
+            return False
+        if len(processes) != 2 or len(stats['helper_depths']) != 2:
+            print(f"✗ Expected 2 helper reports, got {stats['helper_depths']}")
+            return False
+        if stats['helper_nodes_searched'] == 0 or \
+           stats['nodes_searched'] != stats['main_nodes_searched'] + stats['helper_nodes_searched']:
+            print(f"✗ Node counts not summed: {stats['main_nodes_searched']} main, "
+                  f"{stats['helper_nodes_searched']} helpers, {stats['nodes_searched']} total")
+            return False
+        if stats['search_time'] > 0 and abs(stats['nps'] - stats['nodes_searched'] / stats['search_time']) > 1e-6:
+            print(f"✗ NPS {stats['nps']} not taken from the summed nodes")
+            return False
+    finally:
+        search.shutdown()
+
+    if any(process.is_alive() for process in processes) or search.processes:
+        print("✗ Helpers still running after shutdown")
+        return False
+
+    print(f"✓ {move} with {stats['main_nodes_searched']} main and "
+          f"{stats['helper_nodes_searched']} helper nodes, helpers stopped")
+    return True
+
+def test_root_split_matches_serial():
+    """Test that root split finds the serial move and score, and its pool shuts down"""
+    print("\nTesting root split search...")
+
+    pool = RootSplitPool("speed_config.json", 2)
+    try:
+        for fen in ROOT_SPLIT_POSITIONS:
+            board = chess.Board(fen)
+            _, serial_move, serial_score = root_search(None, board)
+            search, split_move, split_score = root_search(pool, board)
+            if (split_move, split_score) != (serial_move, serial_score):
+                print(f"✗ Root split gave {split_move} ({split_score}), "
+                      f"serial {serial_move} ({serial_score}) at {fen}")
+                return False
+            if search.root_split_batches == 0 or board.fen() != fen:
+                print(f"✗ No batches sent to the pool at {fen}")
+                return False
+        processes = list(pool.executor._processes.values())
+    finally:
+        pool.shutdown()
+
+    if any(process.is_alive() for process in processes):
+        print("✗ Pool workers still running after shutdown")
+        return False
+    try:
+        pool.executor.submit(time.time)
+        print("✗ Pool still accepts work after shutdown")
+        return False
+    except RuntimeError:
+        pass
+
+    print("✓ Same moves and scores as the serial search, pool shut down")
+    return True
+
+def test_root_split_stops_at_deadline():
+    """Test that no batch is sent once the hard deadline has passed or a stop was requested"""
+    print("\nTesting root split deadline...")
+
+    pool = RootSplitPool("speed_config.json", 2)
+    try:
+        for use_stop_event in (False, True):
+            board = chess.Board(MIDDLEGAME_FEN)
+            search = SearchController(V7P3RConfig("speed_config.json"), root_pool=pool)
+            search._reset_search_stats()
+            search.eval_state.reset(board)
+            search.repetition.reset(board)
+            search.stop_event = v7p3r_parallel.multiprocessing.Event()
+
+            # Stop once the first move (searched in this process) is done, with the node
+            # counter off the clock-check interval so only the batch loop can notice
+            original_search_move = search._search_move
+            def search_move_then_stop(*args):
+                score = original_search_move(*args)
+                if use_stop_event:
+                    search.stop_event.set()
+                else:
+                    search.hard_deadline = time.time() - 1
+                search.nodes_searched = 1
+                return score
+            search._search_move = search_move_then_stop
+
+            legal_moves = list(board.legal_moves)
+            search._negamax_root_split(board, board.turn, legal_moves, ROOT_SPLIT_DEPTH,
+                                       float('-inf'), float('inf'), False)
+            if search.root_split_batches != 0:
+                print(f"✗ {search.root_split_batches} batches sent after the stop "
+                      f"({'stop event' if use_stop_event else 'deadline'})")
+                return False
+    finally:
+        pool.shutdown()
+
+    print("✓ No batches after the deadline or a stop request")
+    return True
+
+def test_root_worker_ages_tables():
+    """Test that a pool worker ages its killers and history once per main search"""
+    print("\nTesting root split worker table aging...")
+
+    v7p3r_parallel._init_root_worker("speed_config.json")
+    v7p3r_parallel._root_worker_search_id = None
+    move_ordering = v7p3r_parallel._root_worker_search.move_ordering
+    board = chess.Board(MIDDLEGAME_FEN)
+
+    # Entries a shallow search never touches: a deep ply killer and a null from/to pair
+    killer = chess.Move.from_uci("a2a3")
+    move_ordering.history[0][0] = 8
+    tables = []
+    for search_id in (1, 1, 2):
+        move_ordering.killer_moves[60][0] = killer
+        v7p3r_parallel._search_root_move(board.fen(), [], "a2a3", 1, 2, float('-inf'), float('inf'),
+                                         None, search_id)
+        tables.append((move_ordering.history[0][0], move_ordering.killer_moves[60][0]))
+
+    # A new search id ages the tables, the same id leaves them alone
+    if tables != [(4, None), (4, killer), (2, None)]:
+        print(f"✗ Unexpected aging: {tables}")
+        return False
+
+    print("✓ Worker tables aged once per search")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Parallel Search Test")
+    print("=" * 50)
+
+    results = [
+        test_lazy_smp_search(),
+        test_root_split_matches_serial(),
+        test_root_split_stops_at_deadline(),
+        test_root_worker_ages_tables()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Parallel search working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Parallel search needs adjustment")
@@ -0,0 +1,90 @@
+# testing/test_pawn_structure.py
+
+"""Pawn Structure Tests for V7P3R Chess Engine
+Tests passed, doubled and isolated pawn detection and the pawn hash table.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import chess
+from v7p3r_pawn_structure import (
+    PawnStructure, get_pawn_key,
+    DOUBLED_PAWN_PENALTY, ISOLATED_PAWN_PENALTY, PASSED_PAWN_BONUS
+)
+
+def test_pawn_terms():
+    """Test scores and passed pawn masks on known structures"""
+    print("Testing pawn structure terms...")
+
+    structure = PawnStructure(1)
+
+    # White: doubled, isolated c-pawns and a passed a-pawn on a6; Black: a single h-pawn
+    board = chess.Board("4k3/7p/P7/8/2P5/2P5/8/4K3 w - - 0 1")
+    expected = (
+        - DOUBLED_PAWN_PENALTY - 2 * ISOLATED_PAWN_PENALTY   # c3/c4
+        - ISOLATED_PAWN_PENALTY + PASSED_PAWN_BONUS[5]        # a6
+        + PASSED_PAWN_BONUS[2] + PASSED_PAWN_BONUS[3]         # c3/c4 have no black pawn in front
+        - (-ISOLATED_PAWN_PENALTY + PASSED_PAWN_BONUS[1])     # h7
+    )
+    score = structure.evaluate(board, chess.WHITE)
+    if score != expected or structure.evaluate(board, chess.BLACK) != -expected:
+        print(f"✗ Expected {expected}, got {score}")
+        return False
+
+    passed = structure.get_passed_pawns(board, chess.WHITE)
+    if passed != chess.BB_A6 | chess.BB_C3 | chess.BB_C4:
+        print(f"✗ Unexpected passed pawns {chess.SquareSet(passed)}")
+        return False
+
+    # A blocker on an adjacent file stops the a-pawn being passed
+    board = chess.Board("4k3/1p6/P7/8/8/8/8/4K3 w - - 0 1")
+    if structure.get_passed_pawns(board, chess.WHITE):
+        print("✗ Blocked pawn reported as passed")
+        return False
+
+    print("✓ Pawn structure terms correct")
+    return True
+
+def test_hash_table():
+    """Test that cached entries match a fresh computation and are reused"""
+    print("\nTesting pawn hash table...")
+
+    structure = PawnStructure(1)
+    rng = random.Random(9)
+    for game in range(10):
+        board = chess.Board()
+        for ply in range(80):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            board.push(rng.choice(moves))
+            cached = structure._probe(board, get_pawn_key(board))
+            if cached != structure._compute(board):
+                print(f"✗ Cached pawn entry differs at {board.fen()}")
+                return False
+
+    # Most random moves are not pawn moves, so the table should be hit
+    if structure.table.hits == 0:
+        print("✗ Pawn hash table never hit")
+        return False
+
+    print(f"✓ Pawn hash table working ({structure.table.get_stats()['pawn_hash_hit_rate']:.0%} hit rate)")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Pawn Structure Test")
+    print("=" * 50)
+
+    results = [
+        test_pawn_terms(),
+        test_hash_table()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Pawn structure evaluation working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Pawn structure evaluation needs adjustment")
@@ -0,0 +1,103 @@
+# testing/test_pvs.py
+
+"""Principal Variation Search Tests for V7P3R Chess Engine
+Tests aspiration window re-searches and the principal variation collected by
+the search.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController, ASPIRATION_WINDOW
+
+POSITIONS = [
+    "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8",
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "8/5pk1/6p1/3R4/7P/6P1/r4PK1/8 w - - 0 40"
+]
+
+SEARCH_DEPTH = 3
+
+def make_search(board):
+    """Search controller with the per-search state set up and the root moves ordered"""
+    search = SearchController(V7P3RConfig("speed_config.json"))
+    search._reset_search_stats()
+    search.eval_state.reset(board)
+    search.repetition.reset(board)
+    root_moves = search.move_ordering.order_moves(board, list(board.legal_moves), search.move_limit)
+    return search, root_moves
+
+def test_aspiration_research():
+    """Test that a score outside the aspiration window is re-searched to the full-window result"""
+    print("Testing aspiration window re-searches...")
+
+    for fen in POSITIONS:
+        board = chess.Board(fen)
+        search, root_moves = make_search(board)
+        full_move, full_score = search._negamax_root(board, board.turn, root_moves, SEARCH_DEPTH, presorted=True)
+
+        # A previous score far above the real one fails low, far below fails high
+        for offset in (4 * ASPIRATION_WINDOW, -4 * ASPIRATION_WINDOW):
+            search, root_moves = make_search(board)
+            move, score = search._search_iteration(board, board.turn, root_moves, SEARCH_DEPTH,
+                                                   full_score + offset)
+            if search.aspiration_researches != 1:
+                print(f"✗ No re-search with previous score {full_score + offset} at {fen}")
+                return False
+            if move != full_move or score != full_score:
+                print(f"✗ Re-search gave {move} ({score}), full window {full_move} ({full_score}) at {fen}")
+                return False
+
+        # Inside the window no re-search is needed (pruning depends on the window, so the move may differ)
+        search, root_moves = make_search(board)
+        move, score = search._search_iteration(board, board.turn, root_moves, SEARCH_DEPTH, full_score)
+        if search.aspiration_researches != 0 or abs(score - full_score) >= ASPIRATION_WINDOW:
+            print(f"✗ Unexpected re-search inside the window at {fen} ({score})")
+            return False
+
+    print("✓ Fail-high and fail-low re-searches match the full-window search")
+    return True
+
+def test_principal_variation():
+    """Test that the principal variation is a legal line starting with the best move"""
+    print("\nTesting principal variation...")
+
+    for fen in POSITIONS:
+        board = chess.Board(fen)
+        search = SearchController(V7P3RConfig("speed_config.json"))
+        best_move = search.find_best_move(board, board.turn)
+        line = search.get_principal_variation()
+        if not line or line[0] != best_move:
+            print(f"✗ Line {[move.uci() for move in line]} doesn't start with {best_move} at {fen}")
+            return False
+
+        line_board = board.copy()
+        for move in line:
+            if not line_board.is_legal(move):
+                print(f"✗ Illegal move {move} in line {[m.uci() for m in line]} at {fen}")
+                return False
+            line_board.push(move)
+        if search.get_search_stats()['principal_variation'] != [move.uci() for move in line]:
+            print("✗ Search stats report a different line")
+            return False
+
+    print("✓ Lines are legal and start with the best move")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Principal Variation Search Test")
+    print("=" * 50)
+
+    results = [
+        test_aspiration_research(),
+        test_principal_variation()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Principal variation search working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Principal variation search needs adjustment")
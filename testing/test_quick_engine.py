@@ -56,7 +56,30 @@ def quick_engine_test():
         traceback.print_exc()
         return False
 
+def test_fast_evaluation():
+    """Test that the fast int evaluation matches the on-demand breakdown"""
+    print("=== Fast Evaluation Test ===")
+    
+    scoring = ScoringSystem(V7P3RConfig("config.json"))
+    board = chess.Board("r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8")
+    
+    fast_score = scoring.evaluate_position(board, board.turn)
+    breakdown = scoring.get_evaluation_breakdown(board, board.turn)
+    if not isinstance(fast_score, int) or fast_score != breakdown['total']:
+        print(f"✗ Fast evaluation {fast_score} differs from breakdown {breakdown['total']}")
+        return False
+    
+    for move in board.legal_moves:
+        detailed_score, details, detailed_critical = scoring.evaluate_move(board, move, board.turn, depth=1)
+        fast_score, fast_critical = scoring.score_move(board, move, board.turn, depth=1)
+        if (detailed_score, detailed_critical) != (fast_score, fast_critical):
+            print(f"✗ score_move differs from evaluate_move for {move}")
+            return False
+    
+    print("✓ Fast evaluation matches the detailed breakdown")
+    return True
+
 if __name__ == "__main__":
-    success = quick_engine_test()
+    success = quick_engine_test() and test_fast_evaluation()
     print(f"\nResult: {'SUCCESS' if success else 'FAILED'}")
     sys.exit(0 if success else 1)
@@ -0,0 +1,113 @@
+# testing/test_quiescence.py
+
+"""Quiescence Search Tests for V7P3R Chess Engine
+Tests SEE and delta pruning, make/unmake through the incremental state, and the
+quiescence search at the negamax horizon.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_quiescence import QuiescenceSearch
+from v7p3r_primary_scoring import PrimaryScoring
+from v7p3r_incremental import IncrementalEvaluation
+from v7p3r_transposition import TranspositionTable
+
+def test_pruning():
+    """Test that losing captures are skipped by SEE and hopeless ones by delta pruning"""
+    print("Testing SEE and delta pruning...")
+
+    primary = PrimaryScoring()
+    quiescence = QuiescenceSearch()
+
+    # Qxd5 loses the queen to cxd5, exd5 is an even trade
+    board = chess.Board("4k3/8/2p5/3p4/4P3/8/8/3QK3 w - - 0 1")
+    quiescence.quiescence_search(board, -10000, 10000, chess.WHITE, primary)
+    if quiescence.see_prunes == 0:
+        print("✗ Losing queen capture was searched")
+        return False
+
+    # Well below alpha, winning a pawn can't reach it
+    board = chess.Board("4k3/r7/8/3p4/4P3/8/8/4K3 w - - 0 1")
+    quiescence.reset_stats()
+    quiescence.quiescence_search(board, 500, 10000, chess.WHITE, primary)
+    if quiescence.delta_prunes == 0:
+        print("✗ Hopeless capture was not delta pruned")
+        return False
+
+    print("✓ Pruning working correctly")
+    return True
+
+def test_incremental_state():
+    """Test that searching through the incremental state gives the same scores and restores it"""
+    print("\nTesting quiescence with incremental evaluation...")
+
+    primary = PrimaryScoring()
+    quiescence = QuiescenceSearch()
+    state = IncrementalEvaluation(primary.pst)
+    tt = TranspositionTable(1)
+    rng = random.Random(4)
+
+    for game in range(5):
+        board = chess.Board()
+        for ply in range(40):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            board.push(rng.choice(moves))
+            fen = board.fen()
+            state.reset(board)
+
+            expected = quiescence.quiescence_search(board, -10000, 10000, board.turn, primary)
+            actual = quiescence.quiescence_search(board, -10000, 10000, board.turn, primary, incremental=state)
+            if actual != expected:
+                print(f"✗ Incremental score {actual} != {expected} at {fen}")
+                return False
+
+            quiescence.quiescence_search(board, -10000, 10000, board.turn, primary, incremental=state, tt=tt)
+            if board.fen() != fen or state.stack:
+                print(f"✗ Board or incremental state not restored at {fen}")
+                return False
+
+    print("✓ Incremental quiescence matches and restores state")
+    return True
+
+def test_search_horizon():
+    """Test that negamax drops into quiescence at depth 0 and reports qnodes separately"""
+    print("\nTesting quiescence at the search horizon...")
+
+    config = V7P3RConfig("speed_config.json")
+    config.config['engine_config']['use_quiescence'] = True
+    search = SearchController(config)
+
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+    move = search.find_best_move(board, board.turn)
+    stats = search.get_search_stats()
+
+    if move not in board.legal_moves or stats['qnodes'] == 0:
+        print(f"✗ Unexpected result {move} with {stats['qnodes']} qnodes")
+        return False
+
+    print(f"✓ Searched {stats['nodes_searched']} nodes and {stats['qnodes']} qnodes")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Quiescence Search Test")
+    print("=" * 50)
+
+    results = [
+        test_pruning(),
+        test_incremental_state(),
+        test_search_horizon()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Quiescence search working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Quiescence search needs adjustment")
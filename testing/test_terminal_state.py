@@ -0,0 +1,86 @@
+# testing/test_terminal_state.py
+
+"""Terminal State Tests for V7P3R Chess Engine
+Tests the single-pass node classification against python-chess and the staged
+move generation that reuses the node's move list.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import chess
+from v7p3r_move_ordering import MoveOrdering
+from v7p3r_utils import (
+    get_terminal_state, is_insufficient_material,
+    ONGOING, CHECKMATE, STALEMATE, INSUFFICIENT_MATERIAL
+)
+
+def test_known_positions():
+    """Test checkmate, stalemate, insufficient material and ongoing positions"""
+    print("Testing terminal state classification...")
+
+    cases = {
+        "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3": CHECKMATE,
+        "7k/5Q2/6K1/8/8/8/8/8 b - - 0 1": STALEMATE,
+        "8/8/4k3/8/8/3BK3/8/8 w - - 0 1": INSUFFICIENT_MATERIAL,
+        "8/8/4k3/8/8/3RK3/8/8 w - - 0 1": ONGOING
+    }
+    for fen, expected in cases.items():
+        board = chess.Board(fen)
+        moves = list(board.generate_legal_moves())
+        if get_terminal_state(board) != expected or get_terminal_state(board, moves) != expected:
+            print(f"✗ Expected state {expected} at {fen}")
+            return False
+
+    print("✓ Terminal states correct")
+    return True
+
+def test_matches_board():
+    """Test the classification and staged moves from a move list along random games"""
+    print("\nTesting against python-chess...")
+
+    ordering = MoveOrdering()
+    rng = random.Random(2)
+    for game in range(40):
+        board = chess.Board()
+        for ply in range(200):
+            moves = list(board.generate_legal_moves())
+            if board.is_checkmate():
+                expected = CHECKMATE
+            elif board.is_stalemate():
+                expected = STALEMATE
+            elif board.is_insufficient_material():
+                expected = INSUFFICIENT_MATERIAL
+            else:
+                expected = ONGOING
+            if get_terminal_state(board, moves) != expected or \
+               is_insufficient_material(board) != board.is_insufficient_material():
+                print(f"✗ State differs from python-chess at {board.fen()}")
+                return False
+            if list(ordering.staged_moves(board, legal_moves=moves)) != list(ordering.staged_moves(board)):
+                print(f"✗ Staged moves from the move list differ at {board.fen()}")
+                return False
+            if not moves:
+                break
+            captures = [move for move in moves if board.is_capture(move)]
+            board.push(rng.choice(captures) if captures and rng.random() < 0.5 else rng.choice(moves))
+
+    print("✓ Classification and staged moves match")
+    return True
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Terminal State Test")
+    print("=" * 50)
+
+    results = [
+        test_known_positions(),
+        test_matches_board()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Terminal state detection working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Terminal state detection needs adjustment")
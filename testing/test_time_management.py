@@ -0,0 +1,79 @@
+# testing/test_time_management.py
+
+"""Time Management Tests for V7P3R Chess Engine
+Tests that iterative deepening respects the move time limit.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+import time
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+
+MIDDLEGAME_FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 w - - 4 8"
+
+def test_hard_deadline():
+    """Test that a depth 6 search stops within a short time limit"""
+    print("Testing hard deadline...")
+
+    config = V7P3RConfig("config.json")
+    search = SearchController(config)
+    board = chess.Board(MIDDLEGAME_FEN)
+    time_limit = 1.0
+
+    start_time = time.time()
+    move = search.find_best_move(board, board.turn, time_limit)
+    elapsed = time.time() - start_time
+    stats = search.get_search_stats()
+
+    print(f"  Move: {move}, time: {elapsed:.2f}s, depth reached: {stats['depth_reached']}")
+
+    if move not in board.legal_moves:
+        print("✗ Search returned an illegal move")
+        return False
+
+    # Allow some slack for the final node in flight
+    if elapsed > time_limit * 1.5:
+        print(f"✗ Search overran the time limit ({elapsed:.2f}s > {time_limit}s)")
+        return False
+
+    if stats['depth_reached'] >= search.max_depth:
+        print("✗ Expected the search to stop before max depth")
+        return False
+
+    print("✓ Search stopped at the deadline with a completed depth")
+    return True
+
+def test_completed_depth_without_limit():
+    """Test that the search reaches max depth when there is no time limit"""
+    print("\nTesting full depth without time limit...")
+
+    config = V7P3RConfig("speed_config.json")
+    search = SearchController(config)
+    board = chess.Board(MIDDLEGAME_FEN)
+
+    move = search.find_best_move(board, board.turn)
+    stats = search.get_search_stats()
+
+    if move in board.legal_moves and stats['depth_reached'] == search.max_depth:
+        print(f"✓ Reached depth {stats['depth_reached']} with move {move}")
+        return True
+
+    print(f"✗ Unexpected result: {move}, depth {stats['depth_reached']}")
+    return False
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Time Management Test")
+    print("=" * 50)
+
+    test1_pass = test_hard_deadline()
+    test2_pass = test_completed_depth_without_limit()
+
+    print("\n" + "=" * 50)
+    if test1_pass and test2_pass:
+        print("✓ ALL TESTS PASSED - Time management working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Time management needs adjustment")
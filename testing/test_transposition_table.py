@@ -0,0 +1,232 @@
+# testing/test_transposition_table.py
+
+"""Transposition Table Tests for V7P3R Chess Engine
+Tests storage, bound handling, replacement policy and search integration.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chess
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_transposition import (
+    TranspositionTable,
+    SharedTranspositionTable,
+    get_zobrist_key,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND
+)
+
+def test_store_and_probe():
+    """Test that stored entries are found and bounds are respected"""
+    print("Testing transposition table store/probe...")
+
+    tt = TranspositionTable(1)
+    board = chess.Board()
+    key = get_zobrist_key(board)
+    move = chess.Move.from_uci("e2e4")
+
+    tt.store(key, 4, 35, EXACT, move)
+    usable, score, best_move = tt.probe(key, 4, -100, 100)
+    if not (usable and score == 35 and best_move == move):
+        print(f"✗ Exact entry not returned: {usable}, {score}, {best_move}")
+        return False
+
+    # Shallower stored depth must not be trusted, but the move is still returned
+    usable, score, best_move = tt.probe(key, 6, -100, 100)
+    if usable or best_move != move:
+        print("✗ Shallow entry should only provide the hash move")
+        return False
+
+    # Lower bound only cuts when it is at least beta
+    tt.store(key, 4, 50, LOWER_BOUND, move)
+    if tt.probe(key, 4, -100, 100)[0] or not tt.probe(key, 4, -100, 40)[0]:
+        print("✗ Lower bound handling incorrect")
+        return False
+
+    # Upper bound only cuts when it is at most alpha
+    tt.store(key, 4, -50, UPPER_BOUND, move)
+    if tt.probe(key, 4, -100, 100)[0] or not tt.probe(key, 4, -40, 100)[0]:
+        print("✗ Upper bound handling incorrect")
+        return False
+
+    print("✓ Store/probe working correctly")
+    return True
+
+def test_replacement_policy():
+    """Test depth-preferred / always-replace bucket behaviour"""
+    print("\nTesting replacement policy...")
+
+    tt = TranspositionTable(1)
+    # Three keys mapping to the same bucket
+    key_a = 7
+    key_b = 7 + tt.num_buckets
+    key_c = 7 + tt.num_buckets * 2
+
+    tt.store(key_a, 6, 10, EXACT, None)
+    tt.store(key_b, 2, 20, EXACT, None)  # Shallower - goes to always-replace slot
+    tt.store(key_c, 3, 30, EXACT, None)  # Shallower - overwrites always-replace slot
+
+    deep_kept = tt.probe(key_a, 6, -100, 100)[0]
+    shallow_replaced = not tt.probe(key_b, 2, -100, 100)[0]
+    newest_kept = tt.probe(key_c, 3, -100, 100)[0]
+
+    if deep_kept and shallow_replaced and newest_kept and tt.overwrites == 1:
+        print("✓ Replacement policy working correctly")
+        return True
+
+    print(f"✗ Replacement policy incorrect (overwrites: {tt.overwrites})")
+    return False
+
+def test_shallow_bound_keeps_deep_entry():
+    """Test that a shallower bound for the same position doesn't replace the deeper entry"""
+    print("\nTesting shallow stores of the same position...")
+
+    tt = TranspositionTable(1)
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+    key = get_zobrist_key(board)
+    move = chess.Move.from_uci("f3g5")
+
+    # Main search result, then a quiescence fail-low for the same position
+    tt.store(key, 5, 40, LOWER_BOUND, move)
+    tt.store(key, 0, -30, UPPER_BOUND, None)
+    usable, score, best_move = tt.probe(key, 5, -100, 20)
+    if not usable or score != 40 or best_move != move:
+        print(f"✗ Deep entry lost: {usable}, {score}, {best_move}")
+        return False
+
+    # The shallow bound is still available from the always-replace slot
+    index = tt._bucket_index(key)
+    shallow = tt._read_slot(index + 1)
+    if shallow is None or shallow[0] != key or shallow[1] != 0 or shallow[3] != UPPER_BOUND:
+        print(f"✗ Shallow bound not kept in the always-replace slot: {shallow}")
+        return False
+
+    # A shallower exact result (e.g. a quiescence stand-pat) goes beside it too
+    tt.store(key, 0, 15, EXACT, None)
+    entry = tt._read_slot(index)
+    shallow = tt._read_slot(index + 1)
+    if entry[1] != 5 or entry[2] != 40 or entry[4] != move:
+        print(f"✗ Shallow exact store replaced the deep entry: {entry}")
+        return False
+    if shallow[1] != 0 or shallow[2] != 15 or shallow[3] != EXACT:
+        print(f"✗ Shallow exact result not kept in the always-replace slot: {shallow}")
+        return False
+
+    # A result at least as deep still takes the depth-preferred slot
+    tt.store(key, 5, 25, EXACT, None)
+    entry = tt._read_slot(index)
+    if entry[1] != 5 or entry[2] != 25 or entry[3] != EXACT or entry[4] != move:
+        print(f"✗ Equally deep store didn't replace the entry: {entry}")
+        return False
+
+    print("✓ Deeper entry kept, shallow bound stored beside it")
+    return True
+
+def test_mate_score_adjustment():
+    """Test that mate scores are stored relative to the node"""
+    print("\nTesting mate score ply adjustment...")
+
+    tt = TranspositionTable(1)
+    # Mate found 5 plies from root, stored at ply 2
+    tt.store(99, 3, 999999 - 5, EXACT, None, ply=2)
+    # Same position reached at ply 4 should report mate 7 plies from root
+    usable, score, _ = tt.probe(99, 3, -1000000, 1000000, ply=4)
+
+    if usable and score == 999999 - 7:
+        print("✓ Mate scores adjusted correctly")
+        return True
+
+    print(f"✗ Unexpected mate score: {score}")
+    return False
+
+def test_shared_table():
+    """Test that a table attached by name sees entries from the owner"""
+    print("\nTesting shared memory table...")
+
+    owner = SharedTranspositionTable(1)
+    helper = SharedTranspositionTable(*owner.get_attach_args())
+    try:
+        board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+        key = get_zobrist_key(board)
+        move = chess.Move.from_uci("f3g5")
+
+        owner.store(key, 5, -250, LOWER_BOUND, move)
+        usable, score, best_move = helper.probe(key, 5, -400, -300)
+
+        if usable and score == -250 and best_move == move:
+            print("✓ Entry written by one table is visible through the other")
+            return True
+
+        print(f"✗ Shared entry not found: {usable}, {score}, {best_move}")
+        return False
+    finally:
+        helper.close()
+        owner.close()
+
+def test_shared_table_score_rounding():
+    """Test that fractional scores come back rounded, not truncated"""
+    print("\nTesting shared table score rounding...")
+
+    table = SharedTranspositionTable(1)
+    try:
+        board = chess.Board()
+        for score, expected in ((37.6, 38), (-12.7, -13), (12.4, 12), (-250, -250)):
+            key = get_zobrist_key(board)
+            table.store(key, 3, score, EXACT, None)
+            usable, stored_score, _ = table.probe(key, 3, float('-inf'), float('inf'))
+            if not usable or stored_score != expected:
+                print(f"✗ Stored {score}, probed {stored_score} (expected {expected})")
+                return False
+            board.push(next(iter(board.legal_moves)))
+
+        print("✓ Fractional scores rounded to the nearest centipawn")
+        return True
+    finally:
+        table.close()
+
+def test_search_statistics():
+    """Test that the search reports transposition table statistics"""
+    print("\nTesting search statistics...")
+
+    config = V7P3RConfig("speed_config.json")
+    search = SearchController(config)
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+
+    move = search.find_best_move(board, board.turn)
+    stats = search.get_search_stats()
+
+    for key in ('tt_hits', 'tt_misses', 'tt_overwrites'):
+        if key not in stats:
+            print(f"✗ Missing search stat: {key}")
+            return False
+
+    if move in board.legal_moves and stats['tt_stores'] > 0:
+        print(f"✓ Search used table: {stats['tt_hits']} hits, {stats['tt_misses']} misses")
+        return True
+
+    print(f"✗ Unexpected search result: {move}, {stats}")
+    return False
+
+if __name__ == "__main__":
+    print("V7P3R Chess Engine - Transposition Table Test")
+    print("=" * 50)
+
+    results = [
+        test_store_and_probe(),
+        test_replacement_policy(),
+        test_shallow_bound_keeps_deep_entry(),
+        test_mate_score_adjustment(),
+        test_shared_table(),
+        test_shared_table_score_rounding(),
+        test_search_statistics()
+    ]
+
+    print("\n" + "=" * 50)
+    if all(results):
+        print("✓ ALL TESTS PASSED - Transposition table working correctly!")
+    else:
+        print("✗ SOME TESTS FAILED - Transposition table needs adjustment")
@@ -0,0 +1,118 @@
+# v7p3r_attack_map.py
+
+"""Attack Map for V7P3R Chess Engine
+Computes which squares each side attacks once per position, so hanging piece,
+escape check and capture safety checks share the work instead of calling
+board.attackers square by square. Maps are cached by Zobrist key in a small LRU.
+"""
+
+import chess
+from collections import OrderedDict
+from v7p3r_transposition import get_zobrist_key
+from v7p3r_utils import PIECE_VALUES
+
+# Positions kept in the attack map cache
+ATTACK_MAP_CACHE_SIZE = 64
+
+
+class AttackMap:
+    def __init__(self, board):
+        self.board = board
+        self.occupied_co = list(board.occupied_co)
+        self.kings = board.kings
+
+        # Squares attacked by each color, indexed by chess.BLACK / chess.WHITE
+        self.attacked = [0, 0]
+        for color in chess.COLORS:
+            attacked = 0
+            for square in chess.scan_forward(board.occupied_co[color]):
+                attacked |= board.attacks_mask(square)
+            self.attacked[color] = attacked
+
+        # Per-square attacker bitboards, filled on first use
+        self._attackers = [{}, {}]
+
+    def attackers(self, color, square):
+        """Bitboard of a color's pieces attacking a square"""
+        if not self.attacked[color] & chess.BB_SQUARES[square]:
+            return 0
+        cache = self._attackers[color]
+        mask = cache.get(square)
+        if mask is None:
+            mask = self.board.attackers_mask(color, square)
+            cache[square] = mask
+        return mask
+
+    def is_attacked(self, color, square):
+        """Check if a color attacks a square"""
+        return bool(self.attacked[color] & chess.BB_SQUARES[square])
+
+    def least_valuable_attacker_value(self, color, square):
+        """Value of the cheapest piece of a color attacking a square (inf when none)"""
+        mask = self.attackers(color, square)
+        for piece_type in chess.PIECE_TYPES:
+            if mask & self.board.pieces_mask(piece_type, color):
+                return PIECE_VALUES[piece_type]
+        return float('inf')
+
+    def defended(self, color):
+        """A color's pieces that are defended by their own side"""
+        return self.occupied_co[color] & self.attacked[color]
+
+    def undefended(self, color):
+        """A color's pieces that no piece of their own side defends"""
+        return self.occupied_co[color] & ~self.attacked[color]
+
+    def hanging(self, color):
+        """A color's non-king pieces attacked by the other side and not defended"""
+        return self.undefended(color) & self.attacked[not color] & ~self.kings
+
+
+class AttackMapCache:
+    def __init__(self, size=ATTACK_MAP_CACHE_SIZE):
+        self.size = size
+        self.maps = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, board, key=None):
+        """Get the attack map for the board's position, building it on a miss"""
+        if key is None:
+            key = get_zobrist_key(board)
+        attack_map = self.maps.get(key)
+        if attack_map is not None:
+            self.hits += 1
+            self.maps.move_to_end(key)
+            # Same position, but lazy per-square lookups must read the caller's board
+            attack_map.board = board
+            return attack_map
+
+        self.misses += 1
+        attack_map = AttackMap(board)
+        self.maps[key] = attack_map
+        if len(self.maps) > self.size:
+            self.maps.popitem(last=False)
+        return attack_map
+
+    def get_stats(self):
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'attack_map_hits': self.hits,
+            'attack_map_misses': self.misses,
+            'attack_map_hit_rate': self.hits / lookups if lookups > 0 else 0
+        }
+
+
+# Shared by every scoring module
+_attack_map_cache = AttackMapCache()
+
+
+def get_attack_map(board, key=None):
+    """Get the cached attack map for a position"""
+    return _attack_map_cache.get(board, key)
+
+
+def get_attack_map_stats():
+    """Get statistics of the shared attack map cache"""
+    return _attack_map_cache.get_stats()
@@ -9,9 +9,11 @@ import chess
 import time
 from v7p3r_config import V7P3RConfig
 from v7p3r_search import SearchController
+from v7p3r_parallel import LazySMPSearch, RootSplitPool
 from v7p3r_scoring import ScoringSystem
 from v7p3r_rules import GameRules
 from v7p3r_book import OpeningBook
+from v7p3r_utils import get_board_copy_count, reset_board_copy_count
 
 class V7P3REngine:
     def __init__(self, config_file="config.json"):
@@ -24,26 +26,43 @@ class V7P3REngine:
         self.version = engine_config.get('version', '1.0.0')
         self.engine_id = engine_config.get('engine_id', 'v7p3r_default')
         
-        # Initialize components
-        self.search = SearchController(self.config)
+        # Initialize components (lazy SMP helpers share the search when workers are configured)
+        smp_workers = engine_config.get('smp_workers', 0)
+        if smp_workers > 0:
+            self.search = LazySMPSearch(self.config, smp_workers)
+        else:
+            self.search = SearchController(self.config)
+        
+        # Persistent process pool for root split search, created once per engine
+        root_split_workers = engine_config.get('root_split_workers', 0)
+        self.root_pool = RootSplitPool(config_file, root_split_workers) if root_split_workers > 0 else None
+        self.main_search = self.search.main if smp_workers > 0 else self.search
+        self.main_search.root_pool = self.root_pool
+        self.use_mate_search = self.config.is_enabled('engine_config', 'use_mate_search')
         self.scoring = ScoringSystem(self.config)
         self.rules = GameRules(self.config)
         self.book = OpeningBook() if engine_config.get('use_opening_book', True) else None
         
         # Move history and statistics
+        self.last_principal_variation = []
+        self.last_board_copies = 0
         self.move_history = []
         self.position_history = []
         self.game_stats = {
             'moves_played': 0,
             'book_moves': 0,
             'search_time_total': 0,
-            'nodes_searched_total': 0
+            'nodes_searched_total': 0,
+            'board_copies_total': 0
         }
     
     def find_move(self, board, time_limit=30.0):
         """Find the best move for the current position"""
         start_time = time.time()
         our_color = board.turn
+        self.last_principal_variation = []
+        self.last_board_copies = 0
+        reset_board_copy_count()
         
         # Validate board state
         if board.is_game_over():
@@ -57,8 +76,19 @@ class V7P3REngine:
                 self.game_stats['book_moves'] += 1
                 return book_move
         
-        # Use search to find best move
-        best_move = self.search.find_best_move(board, our_color)
+        # Critical positions first try to prove a forced mate (the mate algorithm does this itself)
+        mate_move = None
+        if self.use_mate_search and self.main_search.search_algorithm != 'mate' and \
+           self.rules.is_critical_position(board):
+            mate_move = self.find_mate(board)
+        
+        # Use search to find best move within the remaining time budget
+        if mate_move:
+            best_move = mate_move
+        else:
+            remaining_time = max(time_limit - (time.time() - start_time), 0.1)
+            best_move = self.search.find_best_move(board, our_color, remaining_time)
+        self.last_principal_variation = self.search.get_principal_variation()
         
         # Validate the selected move
         if best_move:
@@ -73,12 +103,13 @@ class V7P3REngine:
                     fallback_move = legal_moves[0]
                     
                     for move in legal_moves:
-                        score, _, _ = self.scoring.evaluate_move(board, move, our_color, depth=1)
+                        score, _ = self.scoring.score_move(board, move, our_color, depth=1)
                         if score > best_score:
                             best_score = score
                             fallback_move = move
                     
                     best_move = fallback_move
+                    self.last_principal_variation = [fallback_move]
         
         # Check time limit
         elapsed_time = time.time() - start_time
@@ -86,13 +117,25 @@ class V7P3REngine:
             print(f"Warning: Move selection took {elapsed_time:.2f}s (limit: {time_limit}s)")
         
         # Update statistics
-        search_stats = self.search.get_search_stats()
+        search_stats = self.main_search.get_search_stats() if mate_move else self.search.get_search_stats()
         self.game_stats['moves_played'] += 1
         self.game_stats['search_time_total'] += search_stats['search_time']
         self.game_stats['nodes_searched_total'] += search_stats['nodes_searched']
         
+        # Debug counter: scoring and ordering work on the board with push/pop, so this should stay near zero
+        self.last_board_copies = get_board_copy_count()
+        self.game_stats['board_copies_total'] += self.last_board_copies
+        
         return best_move
     
+    def find_mate(self, board, max_nodes=None):
+        """Try to prove a forced mate for the side to move within a node budget (None if unproven)"""
+        return self.main_search.find_mate(board, max_nodes)
+    
+    def get_principal_variation(self):
+        """Get the principal variation behind the last move found (empty for book moves)"""
+        return list(self.last_principal_variation)
+    
     def make_move(self, board, move):
         """Make a move and update internal state"""
         if move in board.legal_moves:
@@ -111,14 +154,20 @@ class V7P3REngine:
         our_color = board.turn
         return self.scoring.evaluate_position(board, our_color)
     
+    def get_evaluation_details(self, board):
+        """Get the evaluation broken down by component (slower, for analysis and metrics)"""
+        return self.scoring.get_evaluation_breakdown(board, board.turn)
+    
     def get_position_analysis(self, board):
         """Get detailed analysis of current position"""
         our_color = board.turn
         guidelines = self.rules.get_position_guidelines(board, our_color)
+        evaluation_details = self.get_evaluation_details(board)
         
         analysis = {
             'guidelines': guidelines,
-            'evaluation': self.get_evaluation(board),
+            'evaluation': evaluation_details['total'],
+            'evaluation_details': evaluation_details,
             'in_book': self.book.is_in_book(board) if self.book else False,
             'legal_moves_count': len(list(board.legal_moves))
         }
@@ -127,15 +176,25 @@ class V7P3REngine:
     
     def reset_game(self):
         """Reset engine state for a new game"""
+        self.search.clear_tables()
         self.move_history = []
         self.position_history = []
         self.game_stats = {
             'moves_played': 0,
             'book_moves': 0,
             'search_time_total': 0,
-            'nodes_searched_total': 0
+            'nodes_searched_total': 0,
+            'board_copies_total': 0
         }
     
+    def shutdown(self):
+        """Release search resources such as helper processes"""
+        if hasattr(self.search, 'shutdown'):
+            self.search.shutdown()
+        if self.root_pool:
+            self.root_pool.shutdown()
+            self.root_pool = None
+    
     def get_engine_info(self):
         """Get engine information"""
         book_stats = self.book.get_book_statistics() if self.book else {}
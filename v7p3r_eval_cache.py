@@ -0,0 +1,73 @@
+# v7p3r_eval_cache.py
+
+"""Evaluation Cache for V7P3R Chess Engine
+Remembers static evaluations by Zobrist key so positions reached again through
+transpositions, re-searches and quiescence are not scored twice.
+"""
+
+import chess
+
+# Approximate memory cost of one entry (key, base score, capture score slots)
+EVAL_ENTRY_SIZE_BYTES = 32
+
+
+class EvaluationCache:
+    def __init__(self, size_mb=4):
+        self.num_entries = max(1, int(size_mb * 1024 * 1024) // EVAL_ENTRY_SIZE_BYTES)
+        self._allocate()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _allocate(self):
+        """Allocate empty entry storage"""
+        # Flat parallel arrays, one always-replace slot per index
+        self.keys = [None] * self.num_entries
+        self.base_scores = [0] * self.num_entries
+        self.capture_scores = [0] * self.num_entries
+
+    @staticmethod
+    def make_key(zobrist_key, our_color):
+        """Cache key for a position scored from our_color's side
+        The Zobrist key already covers the side to move."""
+        return (zobrist_key << 1) | (our_color == chess.WHITE)
+
+    def probe(self, key):
+        """Look up an evaluation as (base_score, capture_score), or None on a miss"""
+        index = key % self.num_entries
+        if self.keys[index] == key:
+            self.hits += 1
+            return self.base_scores[index], self.capture_scores[index]
+        self.misses += 1
+        return None
+
+    def store(self, key, base_score, capture_score):
+        """Store an evaluation, replacing whatever was in the slot"""
+        index = key % self.num_entries
+        self.keys[index] = key
+        self.base_scores[index] = base_score
+        self.capture_scores[index] = capture_score
+        self.stores += 1
+
+    def clear(self):
+        """Clear all entries and statistics"""
+        self._allocate()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset statistics (entries are kept)"""
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def get_stats(self):
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'eval_cache_hits': self.hits,
+            'eval_cache_misses': self.misses,
+            'eval_cache_stores': self.stores,
+            'eval_cache_hit_rate': self.hits / lookups if lookups > 0 else 0
+        }
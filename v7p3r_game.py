@@ -93,15 +93,29 @@ class ChessGame:
             
             print(f"Selected move: {move} (took {move_time:.2f}s)")
             
+            # Show the line the engine expects
+            if current_player == 'v7p3r':
+                principal_variation = self.v7p3r_engine.get_principal_variation()
+                if principal_variation:
+                    try:
+                        print(f"Principal variation: {self.board.variation_san(principal_variation)}")
+                    except ValueError:
+                        print(f"Principal variation: {' '.join(m.uci() for m in principal_variation)}")
+            
             # Make the move
             if move in self.board.legal_moves:
                 # Record move analysis
-                evaluation = self.v7p3r_engine.get_evaluation(self.board) if current_player == 'v7p3r' else None
+                evaluation = None
+                evaluation_details = None
+                if current_player == 'v7p3r':
+                    evaluation_details = self.v7p3r_engine.get_evaluation_details(self.board)
+                    evaluation = evaluation_details['total']
                 player_color = 'white' if self.board.turn == chess.WHITE else 'black'
                 
                 self.metrics.record_move(
                     self.game_id, self.move_number, player_color, move.uci(),
-                    evaluation_score=evaluation, search_time=move_time
+                    evaluation_score=evaluation, search_time=move_time,
+                    evaluation_details=evaluation_details
                 )
                 
                 self.board.push(move)
@@ -249,6 +263,7 @@ class ChessGame:
         """Clean up resources"""
         if self.stockfish_handler:
             self.stockfish_handler.quit()
+        self.v7p3r_engine.shutdown()
         
         # Print final statistics
         self.print_final_stats()
@@ -431,6 +446,7 @@ class ChessGame:
         """Clean up resources"""
         if self.stockfish_handler:
             self.stockfish_handler.quit()
+        self.v7p3r_engine.shutdown()
         
         # Print final statistics
         self.print_final_stats()
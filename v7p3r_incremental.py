@@ -0,0 +1,153 @@
+# v7p3r_incremental.py
+
+"""Incremental Evaluation for V7P3R Chess Engine
+Keeps material, piece counts, piece square table sums, game phase and the
+Zobrist keys (full and pawn-only) up to date across make/unmake, so leaf
+evaluation and cache lookups read them instead of scanning the board.
+"""
+
+import chess
+import chess.polyglot
+from v7p3r_utils import PIECE_VALUES
+from v7p3r_pst import ENDGAME_MATERIAL_THRESHOLD
+from v7p3r_pawn_structure import get_pawn_key
+
+# Squares touched by castling besides the king's from/to squares (rook from/to)
+KINGSIDE_CASTLING_FILES = (5, 6, 7)
+QUEENSIDE_CASTLING_FILES = (0, 2, 3)
+
+# Polyglot hashing of castling rights, en passant and side to move
+ZOBRIST_HASHER = chess.polyglot.ZobristHasher(chess.polyglot.POLYGLOT_RANDOM_ARRAY)
+
+
+class IncrementalEvaluation:
+    def __init__(self, pst, debug=False):
+        self.pst = pst
+        self.debug = debug
+
+        # Precomputed PST values [color][piece_type][square], Black squares mirrored
+        self.pst_mid_table = self._build_pst_table(False)
+        self.pst_end_table = self._build_pst_table(True)
+
+        # Per-color sums indexed by chess.BLACK (0) / chess.WHITE (1)
+        self.material = [0, 0]
+        self.piece_count = [0, 0]
+        self.pst_mid = [0, 0]
+        self.pst_end = [0, 0]
+        self.piece_hash = 0  # Piece-square part of the polyglot Zobrist key
+        self.pawn_hash = 0  # Pawn-only key for the pawn hash table
+        self.stack = []
+
+    def _build_pst_table(self, is_endgame):
+        """Build PST lookups for both colors"""
+        table = [[[0] * 64 for _ in range(7)] for _ in range(2)]
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                for square in chess.SQUARES:
+                    pst_square = square if color == chess.WHITE else chess.square_mirror(square)
+                    table[color][piece_type][square] = self.pst.get_pst_value(piece_type, pst_square, is_endgame)
+        return table
+
+    def reset(self, board):
+        """Recompute everything from the board (called at the root of each search)"""
+        self.material = [0, 0]
+        self.piece_count = [0, 0]
+        self.pst_mid = [0, 0]
+        self.pst_end = [0, 0]
+        self.piece_hash = 0
+        self.pawn_hash = 0
+        self.stack = []
+        for square, piece in board.piece_map().items():
+            self._add_piece(piece, square, 1)
+
+    def _add_piece(self, piece, square, sign):
+        """Add (sign 1) or remove (sign -1) a piece's contribution"""
+        color = piece.color
+        piece_type = piece.piece_type
+        if piece_type != chess.KING:
+            self.material[color] += sign * PIECE_VALUES[piece_type]
+            self.piece_count[color] += sign
+        self.pst_mid[color] += sign * self.pst_mid_table[color][piece_type][square]
+        self.pst_end[color] += sign * self.pst_end_table[color][piece_type][square]
+        # XOR is its own inverse, so adding and removing are the same
+        piece_key = chess.polyglot.POLYGLOT_RANDOM_ARRAY[64 * ((piece_type - 1) * 2 + color) + square]
+        self.piece_hash ^= piece_key
+        if piece_type == chess.PAWN:
+            self.pawn_hash ^= piece_key
+
+    def _changed_squares(self, board, move):
+        """Squares whose contents change when the move is made"""
+        squares = {move.from_square, move.to_square}
+        if board.is_en_passant(move):
+            squares.add(move.to_square ^ 8)  # Captured pawn sits behind the target square
+        elif board.is_castling(move):
+            rank = chess.square_rank(move.from_square)
+            files = KINGSIDE_CASTLING_FILES if board.is_kingside_castling(move) else QUEENSIDE_CASTLING_FILES
+            for file in files:
+                squares.add(chess.square(file, rank))
+        return squares
+
+    def push(self, board, move):
+        """Make a move on the board and update the evaluation state"""
+        self.stack.append((self.material[:], self.piece_count[:], self.pst_mid[:], self.pst_end[:],
+                           self.piece_hash, self.pawn_hash))
+        squares = self._changed_squares(board, move)
+
+        for square in squares:
+            piece = board.piece_at(square)
+            if piece:
+                self._add_piece(piece, square, -1)
+        board.push(move)
+        for square in squares:
+            piece = board.piece_at(square)
+            if piece:
+                self._add_piece(piece, square, 1)
+
+    def pop(self, board):
+        """Take back the last move and restore the evaluation state"""
+        board.pop()
+        self.material, self.piece_count, self.pst_mid, self.pst_end, self.piece_hash, self.pawn_hash = self.stack.pop()
+
+    def is_endgame(self):
+        """Same rule as PieceSquareTables.is_endgame, from the running material total"""
+        return self.material[chess.WHITE] + self.material[chess.BLACK] < ENDGAME_MATERIAL_THRESHOLD
+
+    def get_material_count(self, our_color):
+        """Piece count difference (kings excluded)"""
+        return self.piece_count[our_color] - self.piece_count[not our_color]
+
+    def get_material_score(self, our_color):
+        """Material value difference"""
+        return self.material[our_color] - self.material[not our_color]
+
+    def get_pst_score(self, our_color):
+        """Piece square table difference for the current game phase"""
+        pst = self.pst_end if self.is_endgame() else self.pst_mid
+        return pst[our_color] - pst[not our_color]
+
+    def get_zobrist_key(self, board):
+        """Polyglot Zobrist key of the board, same value as chess.polyglot.zobrist_hash"""
+        return (self.piece_hash ^ ZOBRIST_HASHER.hash_castling(board)
+                ^ ZOBRIST_HASHER.hash_ep_square(board) ^ ZOBRIST_HASHER.hash_turn(board))
+
+    def verify(self, board, our_color, primary):
+        """Debug check: compare the running values with a full recompute by primary scoring"""
+        expected = (
+            primary._get_material_count(board, our_color),
+            primary._get_material_score(board, our_color),
+            primary._get_pst_score(board, our_color),
+            self.pst.is_endgame(board),
+            chess.polyglot.zobrist_hash(board),
+            get_pawn_key(board)
+        )
+        actual = (
+            self.get_material_count(our_color),
+            self.get_material_score(our_color),
+            self.get_pst_score(our_color),
+            self.is_endgame(),
+            self.get_zobrist_key(board),
+            self.pawn_hash
+        )
+        if actual != expected:
+            raise RuntimeError(f"Incremental evaluation mismatch at {board.fen()}: "
+                               f"{actual} != {expected} (count, material, pst, endgame, key, pawn key)")
@@ -0,0 +1,173 @@
+# v7p3r_mate_search.py
+
+"""Proof-Number Mate Search for V7P3R Chess Engine
+Proves or disproves a forced mate in N moves for the side to move with a
+best-first proof-number search under a node budget. The attacker's last move
+is answered by the mate-in-one detector instead of being expanded.
+"""
+
+from v7p3r_mate_threat import MateThreatDetector
+
+# Default mate length (attacker moves) and node budget
+MATE_SEARCH_DEPTH = 3
+MATE_SEARCH_NODES = 20000
+
+# Proof and disproof numbers of a solved node
+INFINITY = 10 ** 9
+
+
+class ProofNode:
+    __slots__ = ('move', 'parent', 'children', 'attacker', 'depth', 'proof', 'disproof', 'distance')
+
+    def __init__(self, move, parent, attacker, depth):
+        self.move = move
+        self.parent = parent
+        self.children = None
+        self.attacker = attacker    # Attacker to move (OR node), otherwise defender (AND node)
+        self.depth = depth          # Plies from the root
+        self.proof = 1
+        self.disproof = 1
+        self.distance = 0           # Plies to mate once proven
+
+    def set_proven(self, distance):
+        self.proof = 0
+        self.disproof = INFINITY
+        self.distance = distance
+
+    def set_disproven(self):
+        self.proof = INFINITY
+        self.disproof = 0
+
+    def update(self):
+        """Recompute proof and disproof numbers from the children"""
+        children = self.children
+        if self.attacker:
+            self.proof = min(child.proof for child in children)
+            self.disproof = min(sum(child.disproof for child in children), INFINITY)
+            if self.proof == 0:
+                self.distance = min(child.distance for child in children if child.proof == 0) + 1
+        else:
+            self.proof = min(sum(child.proof for child in children), INFINITY)
+            self.disproof = min(child.disproof for child in children)
+            if self.proof == 0:
+                self.distance = max(child.distance for child in children) + 1
+
+
+class MateSearch:
+    def __init__(self, max_depth=MATE_SEARCH_DEPTH):
+        self.max_depth = max_depth
+        self.detector = MateThreatDetector()
+        self.principal_variation = []
+        self.mate_in = 0
+        self.nodes = 0
+
+    def solve(self, board, max_nodes=MATE_SEARCH_NODES):
+        """First move of a forced mate for the side to move, or None if not proven in budget"""
+        self.reset_stats()
+        if board.is_game_over():
+            return None
+
+        last_ply = 2 * self.max_depth - 1   # Defender to move after the attacker's last move
+        root = ProofNode(None, None, True, 0)
+        self._evaluate(board, root, last_ply)
+
+        while root.proof and root.disproof and self.nodes < max_nodes:
+            # Walk down to the most-proving node
+            node = root
+            while node.children:
+                node = min(node.children, key=self._selection_key(node))
+                board.push(node.move)
+
+            self._expand(board, node, last_ply)
+
+            # Back up the new numbers and return to the root position
+            while node is not root:
+                node.update()
+                board.pop()
+                node = node.parent
+            root.update()
+
+        if root.proof:
+            return None
+
+        # Attacker plays the quickest mate, defender the longest resistance
+        node = root
+        while node.children:
+            if node.attacker:
+                node = min((child for child in node.children if child.proof == 0), key=lambda child: child.distance)
+            else:
+                node = max(node.children, key=lambda child: child.distance)
+            self.principal_variation.append(node.move)
+        self.mate_in = (root.distance + 1) // 2
+        return self.principal_variation[0]
+
+    def _selection_key(self, node):
+        """Most-proving child: least proof at attacker nodes, least disproof at defender nodes"""
+        if node.attacker:
+            return lambda child: child.proof
+        return lambda child: child.disproof
+
+    def _expand(self, board, node, last_ply):
+        """Create and evaluate the children of a leaf, stopping once one of them solves it"""
+        node.children = []
+        for move in board.legal_moves:
+            child = ProofNode(move, node, not node.attacker, node.depth + 1)
+            board.push(move)
+            self._evaluate(board, child, last_ply)
+            board.pop()
+            node.children.append(child)
+            self.nodes += 1
+            # A mating move proves an attacker node, an escape disproves a defender node
+            if (child.proof if node.attacker else child.disproof) == 0:
+                break
+        node.update()
+
+    def _evaluate(self, board, node, last_ply):
+        """Terminal status of a new node, or initial numbers from the side to move's mobility"""
+        if node.depth >= last_ply:
+            # The attacker is out of moves
+            if board.is_checkmate():
+                node.set_proven(0)
+            else:
+                node.set_disproven()
+            return
+
+        if node.attacker and node.depth == last_ply - 1:
+            # Last attacker move: only a mate in one will do
+            move = None
+            if node.depth == 0 or not board.is_repetition(2):
+                move = self.detector.find_mate_in_one(board)
+            if move is None:
+                node.set_disproven()
+            else:
+                child = ProofNode(move, node, False, node.depth + 1)
+                child.set_proven(0)
+                node.children = [child]
+                node.set_proven(1)
+            return
+
+        mobility = board.legal_moves.count()
+        if mobility == 0:
+            if board.is_check() and not node.attacker:
+                node.set_proven(0)
+            else:
+                node.set_disproven()
+        elif board.is_insufficient_material() or (node.depth > 0 and board.is_repetition(2)):
+            node.set_disproven()
+        elif node.attacker:
+            node.disproof = mobility
+        else:
+            node.proof = mobility
+
+    def reset_stats(self):
+        """Reset the result and node count of the last solve"""
+        self.principal_variation = []
+        self.mate_in = 0
+        self.nodes = 0
+
+    def get_stats(self):
+        """Get statistics of the last solve"""
+        return {
+            'mate_search_nodes': self.nodes,
+            'mate_search_mate_in': self.mate_in
+        }
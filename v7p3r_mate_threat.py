@@ -0,0 +1,239 @@
+# v7p3r_mate_threat.py
+
+"""Mate Threat Detection for V7P3R Chess Engine
+Finds mate-in-one moves without pushing every legal move: only moves that can
+give check are generated, and a checking move is only played out when the
+enemy king has no escape square that is certainly safe. Results are cached by
+Zobrist key.
+"""
+
+import chess
+from collections import OrderedDict
+from v7p3r_transposition import get_zobrist_key
+from v7p3r_utils import pushed_move, CHECKMATE_SCORE
+
+# Positions kept in the mate-in-one cache
+MATE_CACHE_SIZE = 4096
+
+# Cached "no mate" result (None means not cached)
+NO_MATE = chess.Move.null()
+
+
+def piece_attacks(piece_type, color, square, occupied):
+    """Squares a piece attacks from a square with the given occupancy"""
+    if piece_type == chess.PAWN:
+        return chess.BB_PAWN_ATTACKS[color][square]
+    if piece_type == chess.KNIGHT:
+        return chess.BB_KNIGHT_ATTACKS[square]
+    if piece_type == chess.KING:
+        return chess.BB_KING_ATTACKS[square]
+    attacks = 0
+    if piece_type in (chess.BISHOP, chess.QUEEN):
+        attacks |= chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+    if piece_type in (chess.ROOK, chess.QUEEN):
+        attacks |= (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied]
+                    | chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied])
+    return attacks
+
+
+def find_discoverers(board, us, king_square):
+    """Our pieces that are the only blocker between one of our sliders and their
+    king, so moving them can give discovered check"""
+    occupied = board.occupied
+    our_pieces = board.occupied_co[us]
+    discoverers = 0
+    for square in chess.scan_forward(our_pieces & (board.bishops | board.rooks | board.queens)):
+        piece_type = board.piece_type_at(square)
+        if piece_attacks(piece_type, us, king_square, 0) & chess.BB_SQUARES[square]:
+            blockers = chess.between(king_square, square) & occupied
+            if blockers & our_pieces and chess.popcount(blockers) == 1:
+                discoverers |= blockers
+    return discoverers
+
+
+def get_check_masks(board):
+    """Squares each piece type of the side to move gives check from (indexed by
+    piece type), and its pieces that can give discovered check"""
+    us = board.turn
+    king_square = board.king(not us)
+    if king_square is None:
+        return None
+    occupied = board.occupied
+    check_squares = [0] * 7
+    for piece_type in (chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN):
+        check_squares[piece_type] = piece_attacks(piece_type, not us, king_square, occupied)
+    return check_squares, find_discoverers(board, us, king_square)
+
+
+def may_give_check(board, move, check_masks):
+    """Cheap filter in front of board.gives_check: False only when the move can't give check
+    A piece that was blocking the check square's line would already be giving
+    check, so the masks from before the move are exact for direct checks."""
+    if check_masks is None:
+        return True
+    check_squares, discoverers = check_masks
+    if chess.BB_SQUARES[move.from_square] & discoverers:
+        return True
+    if move.promotion or board.is_castling(move) or board.is_en_passant(move):
+        return True
+    return bool(check_squares[board.piece_type_at(move.from_square)] & chess.BB_SQUARES[move.to_square])
+
+
+class MateThreatDetector:
+    def __init__(self, cache_size=MATE_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def find_mate_in_one(self, board, key=None):
+        """Mating move for the side to move, or None"""
+        if key is None:
+            key = get_zobrist_key(board)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return None if cached == NO_MATE else cached
+
+        self.misses += 1
+        move = self._search_mate_in_one(board)
+        self.cache[key] = move or NO_MATE
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return move
+
+    def find_mate_threat(self, board, max_depth):
+        """Mate threat after our move, with the opponent to move
+        Negative when the opponent can mate at once, positive when the
+        opponent is in check with a single reply and we mate after it."""
+        if max_depth <= 0:
+            return None
+
+        if self.find_mate_in_one(board) is not None:
+            return -CHECKMATE_SCORE + max_depth  # Opponent mates us
+
+        if board.is_check():
+            replies = list(board.legal_moves)
+            if len(replies) == 1:
+                with pushed_move(board, replies[0]):
+                    if self.find_mate_in_one(board) is not None:
+                        return CHECKMATE_SCORE - max_depth  # We mate opponent
+        return None
+
+    def _search_mate_in_one(self, board):
+        """Play out only the checking moves that could be mate"""
+        us = board.turn
+        them = not us
+        king_square = board.king(them)
+        if king_square is None:
+            return None
+
+        king_mask = chess.BB_SQUARES[king_square]
+        occupied = board.occupied
+        their_pieces = board.occupied_co[them]
+        sliders = board.bishops | board.rooks | board.queens
+        discoverers = find_discoverers(board, us, king_square)
+
+        escape_squares = chess.BB_KING_ATTACKS[king_square]
+        coverage = None
+
+        for move in self._checking_candidates(board, us, king_square, discoverers):
+            special = move.promotion or board.is_castling(move) or board.is_en_passant(move)
+            if not special:
+                from_mask = chess.BB_SQUARES[move.from_square]
+                to_mask = chess.BB_SQUARES[move.to_square]
+                piece_type = board.piece_type_at(move.from_square)
+                after = (occupied & ~from_mask) | to_mask
+
+                # Direct or discovered check is needed for mate
+                gives_check = piece_attacks(piece_type, us, move.to_square, after) & king_mask
+                if not gives_check and not from_mask & discoverers:
+                    continue
+
+                # A king move to a free square we can't possibly attack refutes it.
+                # Skipped when the move uncovers one of our sliders (its new reach is unknown).
+                if coverage is None:
+                    coverage = self._coverage(board, us, king_mask)
+                covered, slider_attacks = coverage
+                if not from_mask & slider_attacks:
+                    reach = covered | piece_attacks(piece_type, us, move.to_square, after & ~king_mask)
+                    free = escape_squares & ~(their_pieces & ~to_mask)
+                    if free & ~reach:
+                        continue
+
+                # A single direct check is answered by capturing the checker, with the king
+                # when nothing else of ours guards it, or with a piece that isn't pinned
+                # once the move is made
+                if not from_mask & discoverers:
+                    capturers = board.attackers_mask(them, move.to_square, after)
+                    if capturers & king_mask and \
+                       not board.attackers_mask(us, move.to_square, after & ~king_mask) & ~from_mask:
+                        continue
+                    if any(not board.attackers_mask(us, king_square, after & ~chess.BB_SQUARES[square])
+                           & sliders & ~from_mask
+                           for square in chess.scan_forward(capturers & ~king_mask)):
+                        continue
+
+            # Candidates are pseudo-legal, legality is only checked for the survivors
+            if board.is_into_check(move):
+                continue
+            with pushed_move(board, move):
+                if board.is_checkmate():
+                    return move
+        return None
+
+    def _coverage(self, board, us, king_mask):
+        """Our attacked squares and our sliders' attacked squares
+        Their king is lifted off the board, so squares behind it on a checking
+        line count as covered."""
+        occupied = board.occupied & ~king_mask
+        sliders = board.bishops | board.rooks | board.queens
+        covered = 0
+        slider_attacks = 0
+        for square in chess.scan_forward(board.occupied_co[us]):
+            attacks = piece_attacks(board.piece_type_at(square), us, square, occupied)
+            covered |= attacks
+            if chess.BB_SQUARES[square] & sliders:
+                slider_attacks |= attacks
+        return covered, slider_attacks
+
+    def _checking_candidates(self, board, us, king_square, discoverers):
+        """Pseudo-legal moves that might give check, generated by destination masks"""
+        occupied = board.occupied
+        not_ours = ~board.occupied_co[us]
+        for piece_type in (chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT):
+            # Squares from which this piece type would attack the king
+            check_squares = piece_attacks(piece_type, not us, king_square, occupied) & not_ours
+            if not check_squares:
+                continue
+            for square in chess.scan_forward(board.pieces_mask(piece_type, us) & ~discoverers):
+                for target in chess.scan_forward(piece_attacks(piece_type, us, square, occupied) & check_squares):
+                    yield chess.Move(square, target)
+
+        pawns = board.pawns & board.occupied_co[us] & ~discoverers
+        pawn_checks = chess.BB_PAWN_ATTACKS[not us][king_square]
+        if pawns and pawn_checks:
+            yield from board.generate_pseudo_legal_moves(pawns, pawn_checks)
+
+        # Discovered checks (any destination), promotions, castling and en passant
+        if discoverers:
+            yield from board.generate_pseudo_legal_moves(discoverers)
+        promoting = pawns & (chess.BB_RANK_7 if us == chess.WHITE else chess.BB_RANK_2)
+        if promoting:
+            for move in board.generate_pseudo_legal_moves(promoting):
+                if move.promotion:
+                    yield move
+        if board.has_castling_rights(us):
+            yield from board.generate_castling_moves()
+        if board.ep_square is not None:
+            yield from board.generate_pseudo_legal_ep()
+
+    def get_stats(self):
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'mate_threat_hits': self.hits,
+            'mate_threat_misses': self.misses,
+            'mate_threat_hit_rate': self.hits / lookups if lookups > 0 else 0
+        }
@@ -5,14 +5,35 @@ Prioritizes moves for better alpha-beta pruning and search efficiency.
 """
 
 import chess
-from v7p3r_mvv_lva import MVVLVA
-from v7p3r_utils import is_capture_that_escapes_check, evaluate_exchange
+from v7p3r_mvv_lva import MVVLVA, LOSING_CAPTURE_THRESHOLD
+from v7p3r_utils import is_capture_that_escapes_check, evaluate_exchange, pushed_move
+
+# Killer and history heuristic settings
+MAX_KILLER_PLY = 64
+KILLER_SLOTS = 2
+KILLER_BONUSES = [4000, 3500]  # Below captures and checks, above ordinary quiet moves
+HISTORY_MAX = 2000  # Cap so history never outranks killers
+
+PROMOTION_VALUES = {
+    chess.QUEEN: 900,
+    chess.ROOK: 500,
+    chess.KNIGHT: 300,
+    chess.BISHOP: 325
+}
 
 class MoveOrdering:
     def __init__(self):
         self.mvv_lva = MVVLVA()
+        
+        # Quiet moves that caused beta cutoffs, per ply from the root
+        self.killer_moves = [[None] * KILLER_SLOTS for _ in range(MAX_KILLER_PLY)]
+        # Cutoff history indexed [from_square][to_square]
+        self.history = [[0] * 64 for _ in range(64)]
+        
+        # Repetition history of the search using this ordering (None replays the move stack)
+        self.repetition = None
     
-    def order_moves(self, board, moves, max_moves=None):
+    def order_moves(self, board, moves, max_moves=None, ply=None):
         """Order moves for optimal search (best moves first)"""
         if not moves:
             return []
@@ -20,7 +41,7 @@ class MoveOrdering:
         scored_moves = []
         
         for move in moves:
-            score = self._score_move(board, move)
+            score = self._score_move(board, move, ply)
             scored_moves.append((move, score))
         
         # Sort by score (highest first)
@@ -34,18 +55,22 @@ class MoveOrdering:
     
     # Using is_capture_that_escapes_check from v7p3r_utils
     
-    def _score_move(self, board, move):
+    def _score_move(self, board, move, ply=None):
         """Score a move for ordering purposes"""
         score = 0
         
         # 1. Checkmate gets highest priority
-        board_copy = board.copy()
-        board_copy.push(move)
-        if board_copy.is_checkmate():
-            return 1000000
+        with pushed_move(board, move):
+            if board.is_checkmate():
+                return 1000000
+            
+            # 2. Avoid repetition (heavy penalty)
+            if self.repetition is None and board.is_repetition(2):
+                return -500000
+            
+            gives_check = board.is_check()
         
-        # 2. Avoid repetition (heavy penalty)
-        if board_copy.is_repetition(2):  # Check for threefold repetition
+        if self.repetition is not None and self.repetition.is_repetition_after(board, move):
             return -500000
         
         # 3. FREE MATERIAL CAPTURES - Extremely high priority!
@@ -76,18 +101,12 @@ class MoveOrdering:
             score += 10000 + mvv_lva_score
         
         # 6. Checks get medium priority
-        if board_copy.is_check():
+        if gives_check:
             score += 5000
         
         # 4. Promotions get high priority
         if move.promotion:
-            promotion_values = {
-                chess.QUEEN: 900,
-                chess.ROOK: 500,
-                chess.KNIGHT: 300,
-                chess.BISHOP: 325
-            }
-            score += 8000 + promotion_values.get(move.promotion, 0)
+            score += 8000 + PROMOTION_VALUES.get(move.promotion, 0)
         
         # 5. Castling gets medium priority
         if board.is_castling(move):
@@ -117,18 +136,154 @@ class MoveOrdering:
         # 8. Avoid moving same piece twice in opening
         # This would require move history - simplified version
         
+        # 9. Killer moves and history heuristic for quiet moves
+        if not board.is_capture(move):
+            if ply is not None:
+                killers = self.get_killer_moves(ply)
+                if move in killers:
+                    score += KILLER_BONUSES[killers.index(move)]
+            score += self.get_history_score(move)
+        
+        return score
+    
+    def staged_moves(self, board, ply=None, hash_move=None, legal_moves=None):
+        """Yield legal moves lazily in stages: hash move, winning captures, killers,
+        quiet moves, then losing captures. Each stage is generated and scored only
+        once the previous one is exhausted, so a cutoff skips the remaining work.
+        With the node's legal moves already generated the stages filter that list."""
+        # 1. Hash move (checked for legality, the table can hold a colliding entry)
+        if hash_move is not None and board.is_legal(hash_move):
+            yield hash_move
+        else:
+            hash_move = None
+        
+        # 2. Captures and promotions, winning ones by MVV-LVA score
+        winning = []
+        losing = []
+        if legal_moves is None:
+            noisy_moves = self._generate_noisy_moves(board)
+        else:
+            noisy_moves = self._filter_noisy_moves(board, legal_moves)
+        for move in noisy_moves:
+            if move == hash_move:
+                continue
+            if board.is_capture(move):
+                score, material_gain = self.mvv_lva.score_capture(board, move)
+                if move.promotion:
+                    score += 8000 + PROMOTION_VALUES.get(move.promotion, 0)
+                elif material_gain < LOSING_CAPTURE_THRESHOLD:
+                    losing.append((move, score))
+                    continue
+            else:
+                score = 8000 + PROMOTION_VALUES.get(move.promotion, 0)
+            winning.append((move, score))
+        
+        winning.sort(key=lambda x: x[1], reverse=True)
+        for move, score in winning:
+            yield move
+        
+        # 3. Killer moves that are quiet and legal here
+        killers = []
+        if ply is not None:
+            for killer in self.get_killer_moves(ply):
+                if killer is None or killer == hash_move:
+                    continue
+                if board.is_capture(killer) or killer.promotion or not board.is_legal(killer):
+                    continue
+                killers.append(killer)
+                yield killer
+        
+        # 4. Remaining quiet moves by cheap static score and history
+        quiets = []
+        for move in board.generate_legal_moves() if legal_moves is None else legal_moves:
+            if move.promotion or board.is_capture(move) or move == hash_move or move in killers:
+                continue
+            quiets.append((move, self._score_quiet_move(board, move)))
+        
+        quiets.sort(key=lambda x: x[1], reverse=True)
+        for move, score in quiets:
+            yield move
+        
+        # 5. Losing captures last
+        losing.sort(key=lambda x: x[1], reverse=True)
+        for move, score in losing:
+            yield move
+    
+    def _generate_noisy_moves(self, board):
+        """Generate legal captures and non-capturing promotions"""
+        yield from board.generate_legal_captures()
+        promotion_rank = chess.BB_RANK_7 if board.turn == chess.WHITE else chess.BB_RANK_2
+        from_mask = board.pawns & board.occupied_co[board.turn] & promotion_rank
+        if from_mask:
+            yield from board.generate_legal_moves(from_mask, ~board.occupied)
+    
+    def _filter_noisy_moves(self, board, legal_moves):
+        """Captures then non-capturing promotions from a generated move list
+        (the same order _generate_noisy_moves produces)"""
+        captures = [move for move in legal_moves if board.is_capture(move)]
+        promotions = [move for move in legal_moves if move.promotion and not board.is_capture(move)]
+        return captures + promotions
+    
+    def _score_quiet_move(self, board, move):
+        """Score a quiet move without making it on the board"""
+        score = self.get_history_score(move)
+        
+        if board.gives_check(move):
+            score += 5000
+        if board.is_castling(move):
+            score += 3000
+        
+        # Center control
+        to_file = chess.square_file(move.to_square)
+        to_rank = chess.square_rank(move.to_square)
+        if 3 <= to_file <= 4 and 3 <= to_rank <= 4:
+            score += 100
+        elif 2 <= to_file <= 5 and 2 <= to_rank <= 5:
+            score += 50
+        
+        # Minor piece development from the back rank
+        piece_type = board.piece_type_at(move.from_square)
+        if piece_type in (chess.KNIGHT, chess.BISHOP):
+            back_rank = 0 if board.turn == chess.WHITE else 7
+            if chess.square_rank(move.from_square) == back_rank:
+                score += 200
+        
         return score
     
-    def get_killer_moves(self, depth):
-        """Get killer moves for this depth (placeholder for future implementation)"""
-        # Killer moves are non-capture moves that caused beta cutoffs
-        # This would require maintaining a killer move table
-        return []
+    def get_killer_moves(self, ply):
+        """Get killer moves (quiet moves that caused beta cutoffs) for this ply"""
+        if ply >= MAX_KILLER_PLY:
+            return []
+        return self.killer_moves[ply]
     
     def get_history_score(self, move):
-        """Get history heuristic score (placeholder for future implementation)"""
-        # History heuristic tracks how often moves cause cutoffs
-        return 0
+        """Get history heuristic score (how often this move caused cutoffs)"""
+        return min(self.history[move.from_square][move.to_square], HISTORY_MAX)
+    
+    def update_killer_move(self, ply, move):
+        """Record a quiet move that caused a beta cutoff at this ply"""
+        if ply >= MAX_KILLER_PLY:
+            return
+        killers = self.killer_moves[ply]
+        if killers[0] != move:
+            # Shift the older killer down and keep the newest in the first slot
+            killers[1] = killers[0]
+            killers[0] = move
+    
+    def update_history(self, move, depth):
+        """Reward a quiet move that caused a beta cutoff, deeper cutoffs count more"""
+        self.history[move.from_square][move.to_square] += depth * depth
+    
+    def age_tables(self):
+        """Age heuristic tables between searches
+        Killers are ply-relative to the old root so they are cleared,
+        history is halved so recent cutoffs dominate."""
+        for killers in self.killer_moves:
+            for slot in range(KILLER_SLOTS):
+                killers[slot] = None
+        for from_row in self.history:
+            for to_square in range(64):
+                from_row[to_square] //= 2
     
     def get_hanging_piece_captures(self, board):
         """Get moves that capture hanging (undefended) pieces"""
@@ -152,7 +307,7 @@ class MoveOrdering:
         hanging_captures.sort(key=lambda x: x[1], reverse=True)
         return [move for move, value in hanging_captures]
     
-    def order_moves_with_material_priority(self, board, moves):
+    def order_moves_with_material_priority(self, board, moves, ply=None):
         """Enhanced move ordering that prioritizes free material captures"""
         if not moves:
             return []
@@ -166,7 +321,7 @@ class MoveOrdering:
             # Skip hanging captures (we'll add them first)
             if move in hanging_captures:
                 continue
-            score = self._score_move(board, move)
+            score = self._score_move(board, move, ply)
             scored_moves.append((move, score))
         
         # Sort non-hanging moves by score
@@ -7,6 +7,9 @@ Evaluates capture moves for move ordering and scoring.
 import chess
 from v7p3r_utils import PIECE_VALUES, evaluate_exchange
 
+# Captures losing more than this in the exchange are ordered after quiet moves
+LOSING_CAPTURE_THRESHOLD = -50
+
 class MVVLVA:
     def __init__(self):
         # Use standardized piece values from utils
@@ -33,21 +36,25 @@ class MVVLVA:
     
     def get_capture_score(self, board, move):
         """Get MVV-LVA score for a capture move with free material detection"""
+        return self.score_capture(board, move)[0]
+    
+    def score_capture(self, board, move):
+        """Get (MVV-LVA score, exchange material gain) for a capture move"""
         if not board.is_capture(move):
-            return 0
+            return 0, 0
         
         # Get the capturing piece
         capturing_piece = board.piece_at(move.from_square)
         if not capturing_piece:
-            return 0
+            return 0, 0
         
         # Get the captured piece
         captured_piece = board.piece_at(move.to_square)
         if not captured_piece:
             # En passant capture
             if board.is_en_passant(move):
-                return self.mvv_lva_table[chess.PAWN][capturing_piece.piece_type]
-            return 0
+                return self.mvv_lva_table[chess.PAWN][capturing_piece.piece_type], evaluate_exchange(board, move)
+            return 0, 0
         
         # Basic MVV-LVA score
         base_score = self.mvv_lva_table[captured_piece.piece_type][capturing_piece.piece_type]
@@ -58,15 +65,15 @@ class MVVLVA:
         # SHORT CIRCUIT: If we win significant free material, prioritize massively
         if material_gain >= 100:  # At least a pawn worth of material
             if material_gain >= 300:  # Knight/Bishop or higher
-                return 50000 + material_gain  # Extremely high priority
+                return 50000 + material_gain, material_gain  # Extremely high priority
             else:  # Pawn-level material
-                return 30000 + material_gain  # Very high priority
+                return 30000 + material_gain, material_gain  # Very high priority
         
         # If it's a losing capture, heavily penalize
-        if material_gain < -50:
-            return base_score - 5000  # Low priority for losing material
+        if material_gain < LOSING_CAPTURE_THRESHOLD:
+            return base_score - 5000, material_gain  # Low priority for losing material
         
-        return base_score + material_gain
+        return base_score + material_gain, material_gain
     
     # Using standardized evaluate_exchange function from v7p3r_utils
 
@@ -0,0 +1,224 @@
+# v7p3r_parallel.py
+
+"""Parallel Search for V7P3R Chess Engine
+Lazy SMP: helper processes run the same search on the same position and share
+a transposition table in shared memory, so the main search finds more of the
+tree already searched. The main process always picks the move.
+Root split: root moves are searched in batches by a persistent process pool,
+with the best score so far (alpha) passed to each batch.
+"""
+
+import chess
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from v7p3r_config import V7P3RConfig
+from v7p3r_search import SearchController
+from v7p3r_transposition import SharedTranspositionTable
+from v7p3r_utils import copy_board
+
+# Seconds to wait for helpers to report back after the main search finishes
+HELPER_REPORT_TIMEOUT = 2.0
+
+
+def _lazy_smp_helper(worker_id, config_file, tt_args, job_queue, result_queue, stop_event):
+    """Helper process loop: search each job until the main search asks to stop"""
+    config = V7P3RConfig(config_file)
+    tt = SharedTranspositionTable(*tt_args)
+    search = SearchController(config, tt=tt)
+    search.stop_event = stop_event
+    # Stagger start depths so helpers are not all searching the same iteration
+    search.start_depth = 1 + (worker_id % 2)
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+
+        job_id, board, time_limit = job
+        search.find_best_move(board, board.turn, time_limit)
+        result_queue.put((job_id, worker_id, search.nodes_searched, search.depth_reached))
+
+    tt.close()
+
+
+class LazySMPSearch:
+    def __init__(self, config, workers):
+        self.config = config
+        self.workers = workers
+
+        # The main search and all helpers share one table
+        tt_size_mb = config.get_setting('engine_config', 'tt_size_mb', 16)
+        self.tt = SharedTranspositionTable(tt_size_mb)
+        self.main = SearchController(config, tt=self.tt)
+
+        # Helpers are started on the first search
+        self.processes = []
+        self.job_queues = []
+        self.result_queue = None
+        self.stop_event = None
+        self.job_id = 0
+
+        # Search statistics
+        self.helper_nodes = 0
+        self.helper_depths = []
+
+    def _start_helpers(self):
+        """Spawn the helper processes"""
+        self.result_queue = multiprocessing.Queue()
+        self.stop_event = multiprocessing.Event()
+        tt_args = self.tt.get_attach_args()
+
+        for worker_id in range(self.workers):
+            job_queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=_lazy_smp_helper,
+                args=(worker_id, self.config.config_file, tt_args, job_queue, self.result_queue, self.stop_event),
+                daemon=True
+            )
+            process.start()
+            self.job_queues.append(job_queue)
+            self.processes.append(process)
+
+    def find_best_move(self, board, our_color, time_limit=None):
+        """Find the best move with the main search while helpers fill the shared table"""
+        if not self.processes:
+            self._start_helpers()
+
+        self.job_id += 1
+        self.stop_event.clear()
+        for job_queue in self.job_queues:
+            job_queue.put((self.job_id, copy_board(board), time_limit))
+
+        best_move = self.main.find_best_move(board, our_color, time_limit)
+
+        # Stop the helpers and collect their node counts for this job
+        self.stop_event.set()
+        self.helper_nodes = 0
+        self.helper_depths = []
+        deadline = time.time() + HELPER_REPORT_TIMEOUT
+        reports = 0
+        while reports < self.workers and time.time() < deadline:
+            try:
+                job_id, worker_id, nodes, depth = self.result_queue.get(timeout=max(deadline - time.time(), 0.01))
+            except queue.Empty:
+                break
+            if job_id != self.job_id:
+                continue  # Late report from an earlier search
+            reports += 1
+            self.helper_nodes += nodes
+            self.helper_depths.append(depth)
+
+        return best_move
+
+    def get_principal_variation(self):
+        """Get the principal variation of the main search"""
+        return self.main.get_principal_variation()
+
+    def clear_tables(self):
+        """Clear persistent search tables (e.g. for a new game)"""
+        self.main.clear_tables()
+
+    def get_search_stats(self):
+        """Get search statistics, with node counts and NPS summed across processes"""
+        stats = self.main.get_search_stats()
+        search_time = stats['search_time']
+        total_nodes = stats['nodes_searched'] + self.helper_nodes
+
+        stats['main_nodes_searched'] = stats['nodes_searched']
+        stats['helper_nodes_searched'] = self.helper_nodes
+        stats['helper_depths'] = list(self.helper_depths)
+        stats['smp_workers'] = self.workers
+        stats['nodes_searched'] = total_nodes
+        stats['nps'] = total_nodes / search_time if search_time > 0 else 0
+        return stats
+
+    def shutdown(self):
+        """Stop the helper processes and release the shared table"""
+        if self.stop_event is not None:
+            self.stop_event.set()
+        for job_queue in self.job_queues:
+            job_queue.put(None)
+        for process in self.processes:
+            process.join(timeout=HELPER_REPORT_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+        self.job_queues = []
+        self.tt.close()
+
+
+# Per-process search used by root split pool workers (built once by the pool initializer),
+# and the id of the main search it last worked for
+_root_worker_search = None
+_root_worker_search_id = None
+
+
+def _init_root_worker(config_file):
+    """Pool initializer: build the worker's own search controller"""
+    global _root_worker_search
+    _root_worker_search = SearchController(V7P3RConfig(config_file))
+
+
+def _search_root_move(fen, history, move_uci, move_index, depth, alpha, beta, hard_deadline, search_id):
+    """Search one root move's subtree in a pool worker
+    Returns (score, nodes, stopped, principal variation as uci strings)."""
+    global _root_worker_search_id
+    search = _root_worker_search
+    # Age killers and history once per main search, as the serial search does
+    if search_id != _root_worker_search_id:
+        search.move_ordering.age_tables()
+        _root_worker_search_id = search_id
+    board = chess.Board(fen)
+    for history_move in history:
+        board.push_uci(history_move)
+    move = chess.Move.from_uci(move_uci)
+
+    search.nodes_searched = 0
+    search.search_stopped = False
+    search.hard_deadline = hard_deadline
+    search.root_depth = depth
+    if search.eval_state:
+        search.eval_state.reset(board)
+    if search.repetition:
+        search.repetition.reset(board)
+
+    score = search._search_move(board, move, move_index, depth, alpha, beta,
+                                board.turn, 0, board.is_check())
+    principal_variation = [pv_move.uci() for pv_move in search.pv_table[1]]
+    return score, search.nodes_searched, search.search_stopped, principal_variation
+
+
+class RootSplitPool:
+    def __init__(self, config_file, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_root_worker,
+            initargs=(config_file,)
+        )
+
+    def _root_history(self, board):
+        """Get a starting FEN and the reversible moves since then, so workers can detect repetitions"""
+        history_board = copy_board(board)
+        history = []
+        while history_board.move_stack and len(history) < board.halfmove_clock:
+            history.append(history_board.pop().uci())
+        history.reverse()
+        return history_board.fen(), history
+
+    def search_batch(self, board, moves, depth, alpha, beta, hard_deadline, search_id):
+        """Search a batch of (move_index, move) root moves in parallel with the same window
+        search_id changes with every main search so workers age their tables."""
+        fen, history = self._root_history(board)
+        futures = [
+            self.executor.submit(_search_root_move, fen, history, move.uci(), move_index,
+                                 depth, alpha, beta, hard_deadline, search_id)
+            for move_index, move in moves
+        ]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,167 @@
+# v7p3r_pawn_structure.py
+
+"""Pawn Structure Evaluation for V7P3R Chess Engine
+Scores passed, doubled and isolated pawns. Pawn structure changes rarely, so
+results are cached in a pawn hash table keyed by a pawn-only Zobrist key and
+most leaves pay a single lookup.
+"""
+
+import chess
+import chess.polyglot
+
+# Approximate memory cost of one entry (key, score, two passed pawn mask slots)
+PAWN_ENTRY_SIZE_BYTES = 40
+
+# Pawn structure weights (centipawns)
+DOUBLED_PAWN_PENALTY = 15
+ISOLATED_PAWN_PENALTY = 12
+PASSED_PAWN_BONUS = [0, 5, 10, 20, 35, 60, 100, 0]  # By rank from the pawn's own side
+
+# Files next to each file
+ADJACENT_FILES = [
+    (chess.BB_FILES[file - 1] if file > 0 else 0) | (chess.BB_FILES[file + 1] if file < 7 else 0)
+    for file in range(8)
+]
+
+
+def _build_passed_spans():
+    """Squares ahead of a pawn on its own and adjacent files, per color and square"""
+    spans = [[0] * 64 for _ in range(2)]
+    for square in chess.SQUARES:
+        file = chess.square_file(square)
+        rank = chess.square_rank(square)
+        files = chess.BB_FILES[file] | ADJACENT_FILES[file]
+        ahead_white = 0
+        ahead_black = 0
+        for r in range(8):
+            if r > rank:
+                ahead_white |= chess.BB_RANKS[r]
+            elif r < rank:
+                ahead_black |= chess.BB_RANKS[r]
+        spans[chess.WHITE][square] = files & ahead_white
+        spans[chess.BLACK][square] = files & ahead_black
+    return spans
+
+PASSED_SPANS = _build_passed_spans()
+
+
+def get_pawn_key(board):
+    """Zobrist key over the pawns only (polyglot piece-square values)"""
+    key = 0
+    for color in chess.COLORS:
+        offset = 64 * color  # Pawns are piece type 1, so (1 - 1) * 2 + color
+        for square in chess.scan_forward(board.pawns & board.occupied_co[color]):
+            key ^= chess.polyglot.POLYGLOT_RANDOM_ARRAY[offset + square]
+    return key
+
+
+class PawnHashTable:
+    def __init__(self, size_mb=1):
+        self.num_entries = max(1, int(size_mb * 1024 * 1024) // PAWN_ENTRY_SIZE_BYTES)
+        self._allocate()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def _allocate(self):
+        """Allocate empty entry storage"""
+        # Flat parallel arrays, one always-replace slot per index
+        self.keys = [None] * self.num_entries
+        self.scores = [0] * self.num_entries
+        self.passed = [[0] * self.num_entries for _ in range(2)]
+
+    def probe(self, key):
+        """Look up a pawn structure as (white_score, passed_masks), or None on a miss"""
+        index = key % self.num_entries
+        if self.keys[index] == key:
+            self.hits += 1
+            return self.scores[index], (self.passed[chess.BLACK][index], self.passed[chess.WHITE][index])
+        self.misses += 1
+        return None
+
+    def store(self, key, score, passed_masks):
+        """Store a pawn structure, replacing whatever was in the slot"""
+        index = key % self.num_entries
+        self.keys[index] = key
+        self.scores[index] = score
+        self.passed[chess.BLACK][index] = passed_masks[chess.BLACK]
+        self.passed[chess.WHITE][index] = passed_masks[chess.WHITE]
+
+    def clear(self):
+        """Clear all entries and statistics"""
+        self._allocate()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset statistics (entries are kept)"""
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Get table statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'pawn_hash_hits': self.hits,
+            'pawn_hash_misses': self.misses,
+            'pawn_hash_hit_rate': self.hits / lookups if lookups > 0 else 0
+        }
+
+
+class PawnStructure:
+    def __init__(self, size_mb=1):
+        self.table = PawnHashTable(size_mb)
+
+    def evaluate(self, board, our_color, pawn_key=None):
+        """Pawn structure score from our_color's perspective"""
+        score, _ = self._probe(board, pawn_key)
+        return score if our_color == chess.WHITE else -score
+
+    def get_passed_pawns(self, board, color, pawn_key=None):
+        """Bitboard of a color's passed pawns"""
+        _, passed_masks = self._probe(board, pawn_key)
+        return passed_masks[color]
+
+    def _probe(self, board, pawn_key):
+        """Cached (white_score, passed_masks), computed on a miss"""
+        if pawn_key is None:
+            pawn_key = get_pawn_key(board)
+        entry = self.table.probe(pawn_key)
+        if entry is None:
+            entry = self._compute(board)
+            self.table.store(pawn_key, *entry)
+        return entry
+
+    def _compute(self, board):
+        """Score the pawn structure from White's perspective and find passed pawns"""
+        pawns = [board.pawns & board.occupied_co[chess.BLACK], board.pawns & board.occupied_co[chess.WHITE]]
+        passed_masks = [0, 0]
+        score = 0
+
+        for color in chess.COLORS:
+            our_pawns = pawns[color]
+            their_pawns = pawns[not color]
+            color_score = 0
+
+            for file in range(8):
+                on_file = chess.popcount(our_pawns & chess.BB_FILES[file])
+                if not on_file:
+                    continue
+                if on_file > 1:
+                    color_score -= (on_file - 1) * DOUBLED_PAWN_PENALTY
+                if not our_pawns & ADJACENT_FILES[file]:
+                    color_score -= on_file * ISOLATED_PAWN_PENALTY
+
+            for square in chess.scan_forward(our_pawns):
+                if not their_pawns & PASSED_SPANS[color][square]:
+                    passed_masks[color] |= chess.BB_SQUARES[square]
+                    rank = chess.square_rank(square)
+                    color_score += PASSED_PAWN_BONUS[rank if color == chess.WHITE else 7 - rank]
+
+            score += color_score if color == chess.WHITE else -color_score
+
+        return score, tuple(passed_masks)
+
+    def clear(self):
+        """Clear the pawn hash table"""
+        self.table.clear()
@@ -1,7 +1,7 @@
 # v7p3r_primary_scoring.py
 
 """Primary Scoring for V7P3R Chess Engine
-Handles material count, material score, and piece square table evaluation.
+Handles material count, material score, piece square table and pawn structure evaluation.
 """
 
 import chess
@@ -9,44 +9,101 @@ from v7p3r_pst import PieceSquareTables
 from v7p3r_mvv_lva import MVVLVA
 from v7p3r_utils import (
     get_material_balance, 
-    evaluate_exchange,
     find_hanging_pieces,
     PIECE_VALUES
 )
+from v7p3r_transposition import get_zobrist_key
+
+# Lazy evaluation: the capture term is always capped at this size, so a leaf whose
+# material + PST score is this far outside the search window can skip it
+LAZY_EVAL_MARGIN = 600
 
 class PrimaryScoring:
-    def __init__(self):
+    def __init__(self, eval_cache=None, pawn_structure=None, lazy_eval=False):
         self.pst = PieceSquareTables()
         self.mvv_lva = MVVLVA()
+        self.eval_cache = eval_cache
+        self.pawn_structure = pawn_structure
+        self.lazy_eval = lazy_eval
+        self.lazy_eval_skips = 0
     
-    def evaluate_primary_score(self, board, our_color):
-        """Calculate primary scoring components"""
-        material_count = self._get_material_count(board, our_color)
-        material_score = self._get_material_score(board, our_color)
-        pst_score = self._get_pst_score(board, our_color)
+    def evaluate(self, board, our_color, incremental=None, alpha=None, beta=None):
+        """Primary score as a plain int, the same total as evaluate_primary_score without the breakdown
+        With lazy evaluation the capture term is capped with or without a window, so
+        every caller gets the same scale; a window only lets the term be skipped
+        when the rest of the score already decides the node."""
+        cache_key = None
+        if self.eval_cache is not None:
+            zobrist_key = incremental.get_zobrist_key(board) if incremental is not None else get_zobrist_key(board)
+            cache_key = self.eval_cache.make_key(zobrist_key, our_color)
+            cached = self.eval_cache.probe(cache_key)
+            if cached is not None:
+                base_score, capture_score = cached
+                return self._combine(base_score, capture_score, alpha, beta)
+        
+        if incremental is not None:
+            base_score = incremental.get_material_score(our_color) + incremental.get_pst_score(our_color)
+        else:
+            base_score = self._get_material_score(board, our_color) + self._get_pst_score(board, our_color)
+        base_score += self._get_pawn_structure_score(board, our_color, incremental)
+        
+        if self._lazy_cutoff(base_score, alpha, beta):
+            self.lazy_eval_skips += 1
+            return base_score
+        
         capture_score = self._get_capture_potential(board, our_color)
+        if cache_key is not None:
+            # Both parts are cached so a hit gives the same result under any window
+            self.eval_cache.store(cache_key, base_score, capture_score)
+        return self._combine(base_score, capture_score, alpha, beta)
+    
+    def _lazy_cutoff(self, base_score, alpha, beta):
+        """Check if material + PST alone decides the node for this window"""
+        if not self.lazy_eval or alpha is None or beta is None:
+            return False
+        return base_score - LAZY_EVAL_MARGIN >= beta or base_score + LAZY_EVAL_MARGIN <= alpha
+    
+    def _cap_capture_score(self, capture_score):
+        """Capture term as it enters the total, capped when lazy evaluation is on"""
+        if not self.lazy_eval:
+            return capture_score
+        return max(-LAZY_EVAL_MARGIN, min(capture_score, LAZY_EVAL_MARGIN))
+    
+    def _combine(self, base_score, capture_score, alpha, beta):
+        """Total score, skipping the capture term when the window allows it"""
+        if self._lazy_cutoff(base_score, alpha, beta):
+            return base_score
+        return base_score + self._cap_capture_score(capture_score)
+    
+    def evaluate_primary_score(self, board, our_color, incremental=None):
+        """Calculate primary scoring components
+        With an incremental evaluation state, material and PST are read from it
+        instead of scanning the board."""
+        if incremental is not None:
+            material_count = incremental.get_material_count(our_color)
+            material_score = incremental.get_material_score(our_color)
+            pst_score = incremental.get_pst_score(our_color)
+        else:
+            material_count = self._get_material_count(board, our_color)
+            material_score = self._get_material_score(board, our_color)
+            pst_score = self._get_pst_score(board, our_color)
+        pawn_structure_score = self._get_pawn_structure_score(board, our_color, incremental)
+        capture_score = self._cap_capture_score(self._get_capture_potential(board, our_color))
         
         return {
             'material_count': material_count,
             'material_score': material_score,
             'pst_score': pst_score,
+            'pawn_structure_score': pawn_structure_score,
             'capture_score': capture_score,
-            'total': material_score + pst_score + capture_score
+            'total': material_score + pst_score + pawn_structure_score + capture_score
         }
     
     def _get_material_count(self, board, our_color):
         """Get raw piece count difference"""
-        our_pieces = 0
-        their_pieces = 0
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type != chess.KING:
-                if piece.color == our_color:
-                    our_pieces += 1
-                else:
-                    their_pieces += 1
-        
+        non_kings = ~board.kings
+        our_pieces = chess.popcount(board.occupied_co[our_color] & non_kings)
+        their_pieces = chess.popcount(board.occupied_co[not our_color] & non_kings)
         return our_pieces - their_pieces
     
     def _get_material_score(self, board, our_color):
@@ -59,50 +116,50 @@ class PrimaryScoring:
         their_pst = 0
         is_endgame = self.pst.is_endgame(board)
         
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                # Mirror squares for Black pieces so they're evaluated from their perspective
-                if piece.color == chess.WHITE:
-                    pst_square = square
-                else:
-                    pst_square = chess.square_mirror(square)
-                    
-                pst_value = self.pst.get_pst_value(piece.piece_type, pst_square, is_endgame)
-                
-                if piece.color == our_color:
-                    our_pst += pst_value
-                else:
-                    their_pst += pst_value
+        # Only occupied squares are looked up, one piece bitboard at a time
+        for color in chess.COLORS:
+            color_pst = 0
+            for piece_type in chess.PIECE_TYPES:
+                for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                    # Mirror squares for Black pieces so they're evaluated from their perspective
+                    pst_square = square if color == chess.WHITE else chess.square_mirror(square)
+                    color_pst += self.pst.get_pst_value(piece_type, pst_square, is_endgame)
+            
+            if color == our_color:
+                our_pst = color_pst
+            else:
+                their_pst = color_pst
         
         return our_pst - their_pst
     
+    def _get_pawn_structure_score(self, board, our_color, incremental=None):
+        """Get passed/doubled/isolated pawn score (one pawn hash lookup at most leaves)"""
+        if self.pawn_structure is None:
+            return 0
+        pawn_key = incremental.pawn_hash if incremental is not None else None
+        return self.pawn_structure.evaluate(board, our_color, pawn_key)
+    
     def _get_capture_potential(self, board, our_color):
-        """Evaluate immediate capture opportunities using enhanced logic"""
-        # Look for immediate favorable exchanges
+        """Evaluate immediate capture opportunities in one pass over our legal captures
+        Each capture's exchange is evaluated once and feeds both the favorable
+        exchange and MVV-LVA terms."""
         exchange_score = 0
-        for move in board.legal_moves:
-            if board.is_capture(move):
-                # Only consider captures by our pieces
-                moving_piece = board.piece_at(move.from_square)
-                if moving_piece and moving_piece.color == our_color:
-                    # Calculate exchange value
-                    exchange_value = evaluate_exchange(board, move)
-                    if exchange_value > 0:
-                        exchange_score += exchange_value
+        mvv_lva_score = 0
+        
+        # Only the side to move has legal captures
+        if board.turn == our_color:
+            for move in board.generate_legal_captures():
+                capture_score, exchange_value = self.mvv_lva.score_capture(board, move)
+                # Look for immediate favorable exchanges
+                if exchange_value > 0:
+                    exchange_score += exchange_value
+                # MVV-LVA score for additional insight
+                mvv_lva_score += capture_score // 100  # Scale down
         
         # Find hanging pieces (undefended or underdefended pieces)
         hanging_pieces = find_hanging_pieces(board, our_color)
         hanging_score = sum(value for _, _, value in hanging_pieces)
         
-        # MVV-LVA score for additional insight
-        mvv_lva_score = 0
-        for move in board.legal_moves:
-            if board.is_capture(move):
-                moving_piece = board.piece_at(move.from_square)
-                if moving_piece and moving_piece.color == our_color:
-                    mvv_lva_score += self.mvv_lva.get_capture_score(board, move) // 100  # Scale down
-        
         # Total capture potential
         return exchange_score + hanging_score + mvv_lva_score
     
@@ -5,6 +5,10 @@ Provides position-based evaluation for pieces in different game phases.
 """
 
 import chess
+from v7p3r_utils import get_total_material
+
+# Endgame when total non-king material is below this (centipawns)
+ENDGAME_MATERIAL_THRESHOLD = 1300
 
 class PieceSquareTables:
     def __init__(self):
@@ -127,11 +131,5 @@ class PieceSquareTables:
     
     def is_endgame(self, board):
         """Simple endgame detection based on material"""
-        material = 0
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type != chess.KING:
-                material += self.piece_values[piece.piece_type]
-        
         # Endgame when total material < 1300 centipawns
-        return material < 1300
+        return get_total_material(board) < ENDGAME_MATERIAL_THRESHOLD
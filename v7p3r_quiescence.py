@@ -6,138 +6,201 @@ Searches capture sequences to quiet positions for better evaluation.
 
 import chess
 from v7p3r_mvv_lva import MVVLVA
+from v7p3r_transposition import get_zobrist_key, EXACT, LOWER_BOUND, UPPER_BOUND
+from v7p3r_utils import (
+    PIECE_VALUES, see_ge, get_terminal_state, is_insufficient_material, CHECKMATE, ONGOING
+)
+
+# Delta pruning: skip a capture when even winning the victim plus this margin can't reach alpha
+DELTA_MARGIN = 200
 
 class QuiescenceSearch:
-    def __init__(self):
+    def __init__(self, config=None):
         self.mvv_lva = MVVLVA()
         self.max_quiescence_depth = 5
+        self.use_lazy_eval = config.is_enabled('engine_config', 'use_lazy_eval') if config else False
+        
+        # Statistics
+        self.nodes = 0
+        self.delta_prunes = 0
+        self.see_prunes = 0
+    
+    def reset_stats(self):
+        """Reset statistics (called at the start of each search)"""
+        self.nodes = 0
+        self.delta_prunes = 0
+        self.see_prunes = 0
+    
+    def get_stats(self):
+        """Get quiescence statistics"""
+        return {
+            'qnodes': self.nodes,
+            'quiescence_delta_prunes': self.delta_prunes,
+            'quiescence_see_prunes': self.see_prunes
+        }
     
-    def quiescence_search(self, board, alpha, beta, our_color, primary_scorer, depth=0):
-        """Search captures and checks to reach a quiet position"""
+    def quiescence_search(self, board, alpha, beta, our_color, primary_scorer, depth=0,
+                          incremental=None, tt=None, ply=0):
+        """Search captures (every evasion when in check) to reach a quiet position
+        With an incremental evaluation state moves are made through it, and with
+        a transposition table results are probed and stored at depth 0."""
+        self.nodes += 1
         if depth >= self.max_quiescence_depth:
-            return self._evaluate_quiet_position(board, our_color, primary_scorer)
-        
-        # Stand-pat evaluation
-        stand_pat = self._evaluate_quiet_position(board, our_color, primary_scorer)
-        
-        # Beta cutoff
-        if stand_pat >= beta:
-            return beta
-        
-        # Alpha update
-        if alpha < stand_pat:
-            alpha = stand_pat
-        
-        # Generate and order capture moves
-        captures = self._get_capture_moves(board)
-        if not captures:
-            return stand_pat
-        
-        # Order captures by MVV-LVA
-        captures = self.mvv_lva.sort_captures(board, captures)
+            return self._evaluate_quiet_position(board, our_color, primary_scorer, incremental, alpha, beta, ply)
+        
+        # Probe the transposition table, any stored depth covers a quiescence node
+        zobrist_key = None
+        hash_move = None
+        original_alpha = alpha
+        if tt is not None:
+            zobrist_key = incremental.get_zobrist_key(board) if incremental is not None else get_zobrist_key(board)
+            usable, tt_score, hash_move = tt.probe(zobrist_key, 0, alpha, beta, ply)
+            if usable:
+                return tt_score
         
-        # Search captures
-        for move in captures:
-            # Skip obviously bad captures (SEE - Static Exchange Evaluation would go here)
-            if self._is_bad_capture(board, move):
-                continue
+        if board.is_check():
+            # No standing pat in check: every evasion is searched, none means mate
+            moves = list(board.legal_moves)
+            if not moves:
+                mate_score = -999999 + ply
+                self._store(tt, zobrist_key, mate_score, EXACT, None, ply)
+                return mate_score
+            stand_pat = None
+        else:
+            # Stand-pat evaluation
+            stand_pat = self._stand_pat(board, our_color, primary_scorer, incremental, alpha, beta)
             
-            board.push(move)
+            # Beta cutoff
+            if stand_pat >= beta:
+                self._store(tt, zobrist_key, beta, LOWER_BOUND, None, ply)
+                return beta
             
-            # Recursively search this capture
-            score = -self.quiescence_search(board, -beta, -alpha, not our_color, primary_scorer, depth + 1)
+            # Alpha update
+            if alpha < stand_pat:
+                alpha = stand_pat
             
-            board.pop()
+            # Generate capture moves
+            moves = self._get_capture_moves(board)
+            if not moves:
+                self._store(tt, zobrist_key, alpha, EXACT if alpha > original_alpha else UPPER_BOUND, None, ply)
+                return alpha
+        
+        # Order by MVV-LVA table value (hash move first), SEE is only run on captures we reach
+        moves.sort(key=lambda move: self._order_key(board, move, hash_move), reverse=True)
+        
+        best_move = None
+        for move in moves:
+            # Evasions are never pruned
+            if stand_pat is not None:
+                # Delta pruning: the victim can't lift the score to alpha
+                if stand_pat + self._capture_gain(board, move) + DELTA_MARGIN <= alpha:
+                    self.delta_prunes += 1
+                    continue
+                
+                # Skip captures that lose material in the exchange
+                if not see_ge(board, move, 0):
+                    self.see_prunes += 1
+                    continue
+            
+            self._push(board, move, incremental)
+            
+            # Recursively search this move
+            score = -self.quiescence_search(board, -beta, -alpha, not our_color, primary_scorer, depth + 1,
+                                            incremental, tt, ply + 1)
+            
+            self._pop(board, incremental)
             
             if score >= beta:
+                self._store(tt, zobrist_key, beta, LOWER_BOUND, move, ply)
                 return beta  # Beta cutoff
             
             if score > alpha:
                 alpha = score
+                best_move = move
         
+        self._store(tt, zobrist_key, alpha, EXACT if alpha > original_alpha else UPPER_BOUND, best_move, ply)
         return alpha
     
-    def _get_capture_moves(self, board):
-        """Get all capture moves from current position"""
-        captures = []
-        for move in board.legal_moves:
-            if board.is_capture(move):
-                captures.append(move)
-        return captures
+    def _store(self, tt, zobrist_key, score, flag, move, ply):
+        """Store a quiescence result at depth 0"""
+        if tt is not None:
+            tt.store(zobrist_key, 0, score, flag, move, ply)
     
-    def _is_bad_capture(self, board, move):
-        """Simple check to avoid obviously bad captures"""
-        # This is a simplified version - full SEE would be better
-        if not board.is_capture(move):
-            return False
-        
-        # Get pieces involved
-        capturing_piece = board.piece_at(move.from_square)
-        captured_piece = board.piece_at(move.to_square)
-        
-        if not capturing_piece:
-            return True
-        
-        # If no piece captured, check for en passant
-        if not captured_piece and board.is_en_passant(move):
-            captured_piece = chess.Piece(chess.PAWN, not capturing_piece.color)
-        
-        if not captured_piece:
-            return True
-        
-        # Simple material exchange check
-        piece_values = {
-            chess.PAWN: 100,
-            chess.KNIGHT: 300,
-            chess.BISHOP: 325,
-            chess.ROOK: 500,
-            chess.QUEEN: 900,
-            chess.KING: 10000
-        }
-        
-        capturing_value = piece_values[capturing_piece.piece_type]
-        captured_value = piece_values[captured_piece.piece_type]
-        
-        # Don't capture less valuable pieces with more valuable pieces
-        # unless the captured piece is undefended
-        if capturing_value > captured_value:
-            # Check if the target square is defended
+    def _push(self, board, move, incremental):
+        """Make a move, keeping the incremental evaluation in step"""
+        if incremental is not None:
+            incremental.push(board, move)
+        else:
             board.push(move)
-            is_defended = board.is_attacked_by(not capturing_piece.color, move.to_square)
+    
+    def _pop(self, board, incremental):
+        """Take back a move, keeping the incremental evaluation in step"""
+        if incremental is not None:
+            incremental.pop(board)
+        else:
             board.pop()
-            
-            if is_defended:
-                return True  # Bad capture - we'll likely lose material
-        
-        return False
     
-    def _evaluate_quiet_position(self, board, our_color, primary_scorer):
+    def _order_key(self, board, move, hash_move):
+        """MVV-LVA ordering value without running the exchange evaluation"""
+        if move == hash_move:
+            return float('inf')
+        victim = board.piece_type_at(move.to_square)
+        if victim is None:
+            if not board.is_en_passant(move):
+                return -1  # Quiet evasion, after every capture
+            victim = chess.PAWN
+        attacker = board.piece_type_at(move.from_square)
+        return self.mvv_lva.mvv_lva_table[victim][attacker]
+    
+    def _capture_gain(self, board, move):
+        """Most material a capture can win: the victim plus any promotion"""
+        victim = board.piece_type_at(move.to_square) or chess.PAWN  # En passant
+        gain = PIECE_VALUES[victim]
+        if move.promotion:
+            gain += PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+        return gain
+    
+    def _get_capture_moves(self, board):
+        """Get all capture moves from current position"""
+        return list(board.generate_legal_captures())
+    
+    def _evaluate_quiet_position(self, board, our_color, primary_scorer, incremental=None,
+                                 alpha=None, beta=None, ply=0):
         """Evaluate position when it's quiet (no more tactical sequences)"""
-        if board.is_checkmate():
-            return -999999 if board.turn == our_color else 999999
+        state = get_terminal_state(board)
+        if state == CHECKMATE:
+            return -999999 + ply if board.turn == our_color else 999999 - ply
         
-        if board.is_stalemate() or board.is_insufficient_material():
+        if state != ONGOING:
+            return 0  # Stalemate or insufficient material
+        
+        return self._stand_pat(board, our_color, primary_scorer, incremental, alpha, beta)
+    
+    def _stand_pat(self, board, our_color, primary_scorer, incremental=None, alpha=None, beta=None):
+        """Static score of a position that is not in check (stalemate is left to the main search)"""
+        if is_insufficient_material(board):
             return 0
         
+        # Lazy evaluation needs a finite window to compare against
+        if not self.use_lazy_eval or alpha == float('-inf') or beta == float('inf'):
+            alpha = beta = None
+        
         # Use primary scoring for quiet evaluation
-        primary_eval = primary_scorer.evaluate_primary_score(board, our_color)
-        return primary_eval['total']
+        return primary_scorer.evaluate(board, our_color, incremental, alpha, beta)
     
     def is_quiet_position(self, board):
         """Check if position is quiet (no immediate tactical threats)"""
-        # Position is not quiet if:
-        # 1. In check
+        # Position is not quiet if in check
         if board.is_check():
             return False
         
-        # 2. Has captures available
-        for move in board.legal_moves:
-            if board.is_capture(move):
-                return False
-        
-        # 3. Has promotion moves available
-        for move in board.legal_moves:
-            if move.promotion:
+        # Or if it has a capture or promotion: one pass over moves to enemy pieces,
+        # the en passant square and the back ranks, stopping at the first one
+        targets = board.occupied_co[not board.turn] | chess.BB_BACKRANKS
+        if board.ep_square is not None:
+            targets |= chess.BB_SQUARES[board.ep_square]
+        for move in board.generate_legal_moves(to_mask=targets):
+            if move.promotion or board.is_capture(move):
                 return False
         
         return True
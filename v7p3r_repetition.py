@@ -0,0 +1,77 @@
+# v7p3r_repetition.py
+
+"""Repetition Tracking for V7P3R Chess Engine
+Keeps the Zobrist keys of the positions on the game and search path, so a
+repetition check compares the keys since the last pawn move or capture
+instead of replaying the board's move stack.
+"""
+
+import chess
+import chess.polyglot
+from v7p3r_transposition import get_zobrist_key
+
+# Polyglot key of White to move, and the hasher for the en passant part
+TURN_KEY = chess.polyglot.POLYGLOT_RANDOM_ARRAY[780]
+ZOBRIST_HASHER = chess.polyglot.ZobristHasher(chess.polyglot.POLYGLOT_RANDOM_ARRAY)
+
+
+def piece_key(piece_type, color, square):
+    """Polyglot key of one piece on one square"""
+    return chess.polyglot.POLYGLOT_RANDOM_ARRAY[64 * ((piece_type - 1) * 2 + color) + square]
+
+
+class RepetitionHistory:
+    def __init__(self):
+        self.keys = []  # Oldest first, the last entry is the current position
+
+    def reset(self, board):
+        """Rebuild the keys of the reversible plies leading to the board (called at the root)"""
+        keys = [get_zobrist_key(board)]
+        moves = []
+        reversible_plies = board.halfmove_clock
+        while board.move_stack and len(moves) < reversible_plies:
+            moves.append(board.pop())
+            keys.append(get_zobrist_key(board))
+        for move in reversed(moves):
+            board.push(move)
+        keys.reverse()
+        self.keys = keys
+
+    def push(self, key):
+        """Add the key of the position after a move"""
+        self.keys.append(key)
+
+    def pop(self):
+        """Drop the key of the position being unmade"""
+        self.keys.pop()
+
+    def current_key(self):
+        """Zobrist key of the current position"""
+        return self.keys[-1]
+
+    def is_repetition(self, halfmove_clock, count=2):
+        """Same answer as board.is_repetition(count) for the current position"""
+        return self._count(len(self.keys) - 1, self.keys[-1], halfmove_clock, count)
+
+    def is_repetition_after(self, board, move, count=2):
+        """board.is_repetition(count) of the position after a move, without making it
+        Only reversible moves can repeat: pawn moves, captures and moves that
+        lose castling rights lead to positions that can't have occurred before."""
+        if board.is_irreversible(move):
+            return False
+        piece_type = board.piece_type_at(move.from_square)
+        key = (self.keys[-1] ^ piece_key(piece_type, board.turn, move.from_square)
+               ^ piece_key(piece_type, board.turn, move.to_square)
+               ^ TURN_KEY ^ ZOBRIST_HASHER.hash_ep_square(board))
+        return self._count(len(self.keys), key, board.halfmove_clock + 1, count)
+
+    def _count(self, index, key, halfmove_clock, count):
+        """Look for earlier occurrences of a key, same side to move, within the reversible plies"""
+        seen = 1
+        stop = max(index - halfmove_clock, 0)
+        for earlier in range(index - 2, stop - 1, -2):
+            if self.keys[earlier] == key:
+                seen += 1
+                if seen >= count:
+                    return True
+        return False
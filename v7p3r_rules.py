@@ -5,7 +5,8 @@ Handles game rules, position validation, and decision guidelines.
 """
 
 import chess
-from v7p3r_utils import get_game_phase, is_draw_position
+from v7p3r_mate_threat import MateThreatDetector
+from v7p3r_utils import get_game_phase, is_draw_position, pushed_move
 
 class GameRules:
     def __init__(self, config):
@@ -13,6 +14,7 @@ class GameRules:
         self.use_stalemate_awareness = config.is_enabled('engine_config', 'use_stalemate_awarness')
         self.use_draw_prevention = config.is_enabled('engine_config', 'use_draw_prevention')
         self.use_checkmate_detection = config.is_enabled('engine_config', 'use_checkmate_detection')
+        self.mate_detector = MateThreatDetector()
     
     def validate_move(self, board, move):
         """Validate that a move is legal and acceptable"""
@@ -22,10 +24,9 @@ class GameRules:
         
         # Check for stalemate creation
         if self.use_stalemate_awareness:
-            board_copy = board.copy()
-            board_copy.push(move)
-            if board_copy.is_stalemate():
-                return False, "Move causes stalemate"
+            with pushed_move(board, move):
+                if board.is_stalemate():
+                    return False, "Move causes stalemate"
         
         return True, "Move is valid"
     
@@ -36,12 +37,10 @@ class GameRules:
         
         # If we're ahead in material, avoid draws
         if material_balance > 200:  # Ahead by more than 2 pawns
-            board_copy = board.copy()
-            board_copy.push(move)
-            
-            # Check for various draw conditions using utility function
-            if is_draw_position(board_copy):
-                return True
+            with pushed_move(board, move):
+                # Check for various draw conditions using utility function
+                if is_draw_position(board):
+                    return True
         
         return False
     
@@ -70,15 +69,7 @@ class GameRules:
         if not self.use_checkmate_detection:
             return False
         
-        # Simple mate threat detection
-        for move in board.legal_moves:
-            board.push(move)
-            if board.is_checkmate():
-                board.pop()
-                return True
-            board.pop()
-        
-        return False
+        return self.mate_detector.find_mate_in_one(board) is not None
     
     def _has_major_imbalance(self, board):
         """Check for major material imbalances"""
@@ -9,14 +9,30 @@ from v7p3r_tempo import TempoCalculation
 from v7p3r_primary_scoring import PrimaryScoring
 from v7p3r_secondary_scoring import SecondaryScoring
 from v7p3r_quiescence import QuiescenceSearch
+from v7p3r_eval_cache import EvaluationCache
+from v7p3r_pawn_structure import PawnStructure
+from v7p3r_utils import pushed_move
 
 class ScoringSystem:
     def __init__(self, config):
         self.config = config
         self.tempo = TempoCalculation()
-        self.primary = PrimaryScoring()
+        
+        # Evaluation cache shared by leaf evaluation and the quiescence stand-pat
+        self.eval_cache = None
+        if config.is_enabled('engine_config', 'use_eval_cache'):
+            eval_cache_size_mb = config.get_setting('engine_config', 'eval_cache_size_mb', 4)
+            self.eval_cache = EvaluationCache(eval_cache_size_mb)
+        
+        # Pawn structure terms, cached in a pawn hash table
+        self.pawn_structure = None
+        if config.is_enabled('engine_config', 'use_pawn_structure'):
+            pawn_hash_size_mb = config.get_setting('engine_config', 'pawn_hash_size_mb', 1)
+            self.pawn_structure = PawnStructure(pawn_hash_size_mb)
+        self.primary = PrimaryScoring(self.eval_cache, self.pawn_structure,
+                                      config.is_enabled('engine_config', 'use_lazy_eval'))
         self.secondary = SecondaryScoring(config)
-        self.quiescence = QuiescenceSearch()
+        self.quiescence = QuiescenceSearch(config)
         
         # Configuration flags
         self.use_tempo = config.is_enabled('engine_config', 'use_tempo_scoring')
@@ -25,59 +41,88 @@ class ScoringSystem:
         self.use_quiescence = config.is_enabled('engine_config', 'use_quiescence')
     
     def evaluate_move(self, board, move, our_color, depth=0, alpha=None, beta=None):
-        """Comprehensive move evaluation"""
-        total_score = 0
+        """Comprehensive move evaluation with a per-component breakdown"""
         evaluation_details = {}
+        total_score, critical_move = self._evaluate_move(board, move, our_color, depth, alpha, beta, evaluation_details)
+        return total_score, evaluation_details, critical_move
+    
+    def score_move(self, board, move, our_color, depth=0, alpha=None, beta=None):
+        """Fast move evaluation: (score, critical_move) without building the breakdown"""
+        return self._evaluate_move(board, move, our_color, depth, alpha, beta, None)
+    
+    def _evaluate_move(self, board, move, our_color, depth, alpha, beta, evaluation_details):
+        """Shared move evaluation, the breakdown is only filled when a dict is passed"""
+        total_score = 0
         critical_move = False
-        
-        # Make the move to evaluate resulting position
-        board_copy = board.copy()
-        board_copy.push(move)
+        primary_total = 0
+        material_score = 0
         
         # 1. Tempo Calculation (critical moves)
         if self.use_tempo:
             tempo_score, is_critical = self.tempo.evaluate_tempo(board, move, depth)
             total_score += tempo_score
-            evaluation_details['tempo'] = tempo_score
             critical_move = is_critical
+            if evaluation_details is not None:
+                evaluation_details['tempo'] = tempo_score
             
             # Short circuit for critical moves
             if self.tempo.should_short_circuit(tempo_score):
-                evaluation_details['short_circuit'] = True
-                return total_score, evaluation_details, critical_move
+                if evaluation_details is not None:
+                    evaluation_details['short_circuit'] = True
+                return total_score, critical_move
         
         # 2. Primary Scoring
         if self.use_primary:
-            primary_eval = self.primary.evaluate_primary_score(board_copy, our_color)
-            total_score += primary_eval['total']
-            evaluation_details['primary'] = primary_eval
+            with pushed_move(board, move):
+                if evaluation_details is not None:
+                    primary_eval = self.primary.evaluate_primary_score(board, our_color)
+                    evaluation_details['primary'] = primary_eval
+                    primary_total = primary_eval['total']
+                    material_score = primary_eval['material_score']
+                else:
+                    primary_total = self.primary.evaluate(board, our_color)
+                    if self.use_secondary:
+                        material_score = self.primary.get_material_balance(board, our_color)
+            total_score += primary_total
         
         # 3. Secondary Scoring
         if self.use_secondary:
-            material_score = evaluation_details.get('primary', {}).get('material_score', 0)
-            secondary_eval = self.secondary.evaluate_secondary_score(board, move, our_color, material_score)
-            total_score += secondary_eval['total']
-            evaluation_details['secondary'] = secondary_eval
+            if evaluation_details is not None:
+                secondary_eval = self.secondary.evaluate_secondary_score(board, move, our_color, material_score)
+                evaluation_details['secondary'] = secondary_eval
+                total_score += secondary_eval['total']
+            else:
+                total_score += self.secondary.evaluate(board, move, our_color, material_score)
         
         # 4. Quiescence Search (if position is not quiet)
-        if self.use_quiescence and not self.quiescence.is_quiet_position(board_copy):
-            if alpha is not None and beta is not None:
-                quies_score = self.quiescence.quiescence_search(
-                    board_copy, alpha, beta, our_color, self.primary
-                )
-                # Adjust total score based on quiescence result
-                total_score += (quies_score - evaluation_details.get('primary', {}).get('total', 0)) // 2
-                evaluation_details['quiescence'] = quies_score
+        if self.use_quiescence and alpha is not None and beta is not None:
+            with pushed_move(board, move):
+                if not self.quiescence.is_quiet_position(board):
+                    quies_score = self.quiescence.quiescence_search(
+                        board, alpha, beta, our_color, self.primary
+                    )
+                    # Adjust total score based on quiescence result
+                    total_score += (quies_score - primary_total) // 2
+                    if evaluation_details is not None:
+                        evaluation_details['quiescence'] = quies_score
         
-        return total_score, evaluation_details, critical_move
+        return total_score, critical_move
     
-    def evaluate_position(self, board, our_color):
-        """Static position evaluation without move"""
+    def evaluate_position(self, board, our_color, incremental=None, alpha=None, beta=None):
+        """Static position evaluation without move (fast path, plain int)
+        Passing the search window allows lazy evaluation."""
         if self.use_primary:
-            primary_eval = self.primary.evaluate_primary_score(board, our_color)
-            return primary_eval['total']
+            return self.primary.evaluate(board, our_color, incremental, alpha, beta)
         return 0
     
+    def get_evaluation_breakdown(self, board, our_color):
+        """Detailed static evaluation by component, built on demand for analysis and metrics"""
+        breakdown = {'total': 0}
+        if self.use_primary:
+            breakdown['primary'] = self.primary.evaluate_primary_score(board, our_color)
+            breakdown['total'] = breakdown['primary']['total']
+        return breakdown
+    
     def get_material_balance(self, board, our_color):
         """Get current material balance"""
         return self.primary.get_material_balance(board, our_color)
@@ -9,9 +9,40 @@ import time
 import random
 from v7p3r_move_ordering import MoveOrdering
 from v7p3r_scoring import ScoringSystem
+from v7p3r_incremental import IncrementalEvaluation
+from v7p3r_mate_search import MateSearch, MATE_SEARCH_DEPTH, MATE_SEARCH_NODES
+from v7p3r_mate_threat import get_check_masks, may_give_check
+from v7p3r_repetition import RepetitionHistory
+from v7p3r_utils import get_terminal_state, CHECKMATE, ONGOING
+from v7p3r_transposition import (
+    TranspositionTable,
+    get_zobrist_key,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    MATE_THRESHOLD
+)
+
+# Time management for iterative deepening (fractions of the move time limit)
+SOFT_TIME_FRACTION = 0.5   # Don't start a new depth after this point
+HARD_TIME_FRACTION = 0.9   # Abort the current depth after this point
+TIME_CHECK_INTERVAL = 32   # Nodes between clock checks
+
+# Late move reductions
+LMR_MIN_DEPTH = 2          # Frontier nodes reduce late moves straight to a static evaluation
+LMR_FULL_DEPTH_MOVES = 3   # Moves searched at full depth before reducing
+
+# Futility pruning and razoring (margins in centipawns per remaining ply)
+FRONTIER_DEPTH = 2         # Deepest node where the static evaluation can prune
+FUTILITY_MARGIN = 150
+RAZOR_MARGIN = 300
+
+# Principal variation search
+ASPIRATION_WINDOW = 50     # Centipawns either side of the previous iteration's score
+MAX_PV_LENGTH = 64
 
 class SearchController:
-    def __init__(self, config):
+    def __init__(self, config, tt=None, root_pool=None):
         self.config = config
         self.move_ordering = MoveOrdering()
         self.scoring = ScoringSystem(config)
@@ -22,28 +53,109 @@ class SearchController:
         self.use_ab_pruning = config.is_enabled('engine_config', 'use_ab_pruning')
         self.use_move_ordering = config.is_enabled('engine_config', 'use_move_ordering')
         self.max_ordered_moves = config.get_setting('engine_config', 'max_ordered_moves', 10)
+        self.use_staged_move_generation = config.is_enabled('engine_config', 'use_staged_move_generation')
+        self.use_transposition_table = config.is_enabled('engine_config', 'use_transposition_table')
+        self.use_iterative_deepening = config.is_enabled('engine_config', 'use_iterative_deepening')
+        self.use_late_move_reduction = config.is_enabled('engine_config', 'use_late_move_reduction')
+        self.use_null_move = config.is_enabled('engine_config', 'use_null_move')
+        self.null_move_reduction = config.get_setting('engine_config', 'null_move_reduction', 2)
+        self.use_futility_pruning = config.is_enabled('engine_config', 'use_futility_pruning')
+        self.futility_margin = config.get_setting('engine_config', 'futility_margin', FUTILITY_MARGIN)
+        self.use_razoring = config.is_enabled('engine_config', 'use_razoring')
+        self.razor_margin = config.get_setting('engine_config', 'razor_margin', RAZOR_MARGIN)
+        self.use_pvs = config.is_enabled('engine_config', 'use_pvs')
+        self.use_lazy_eval = config.is_enabled('engine_config', 'use_lazy_eval')
+        self.use_quiescence = config.is_enabled('engine_config', 'use_quiescence')
+        
+        # Proof-number mate search, used by the mate search algorithm and the engine's mate pre-pass
+        self.mate_search_nodes = config.get_setting('engine_config', 'mate_search_nodes', MATE_SEARCH_NODES)
+        self.mate_search = MateSearch(config.get_setting('engine_config', 'mate_search_depth', MATE_SEARCH_DEPTH))
+        
+        # Late move reductions replace the hard move limit in the alpha-beta search
+        self.move_limit = self.max_ordered_moves
+        if self.use_late_move_reduction and self.use_ab_pruning:
+            self.move_limit = None
+        
+        # Transposition table persists between searches so later moves reuse earlier work
+        # (a parallel search passes in a table shared between processes)
+        tt_size_mb = config.get_setting('engine_config', 'tt_size_mb', 16)
+        self.tt = tt
+        if self.tt is None and self.use_transposition_table:
+            self.tt = TranspositionTable(tt_size_mb)
+        
+        # Material/PST state updated on make/unmake, read at the leaves
+        self.eval_state = None
+        if config.is_enabled('engine_config', 'use_incremental_eval'):
+            debug = config.is_enabled('engine_config', 'debug_incremental_eval')
+            self.eval_state = IncrementalEvaluation(self.scoring.primary.pst, debug)
+        
+        # Zobrist keys of the game and search path for repetition checks (shared with move ordering)
+        self.repetition = None
+        if config.is_enabled('engine_config', 'use_repetition_history'):
+            self.repetition = RepetitionHistory()
+        self.move_ordering.repetition = self.repetition
+        
+        # Process pool for searching root moves in parallel (owned by the engine)
+        self.root_pool = root_pool
         
         # Search statistics
         self.nodes_searched = 0
         self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.null_move_attempts = 0
+        self.null_move_cutoffs = 0
+        self.futility_prunes = 0
+        self.razor_attempts = 0
+        self.razor_cutoffs = 0
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        self.root_split_batches = 0
         self.search_time = 0
+        self.depth_reached = 0
+        
+        # Search state
+        self.root_depth = self.max_depth
+        self.start_depth = 1       # Helper searches in a parallel search start deeper
+        self.stop_event = None     # Set by a parallel search to stop helper searches
+        self.hard_deadline = None
+        self.search_stopped = False
+        self.search_id = 0         # Counts searches, so root split workers know when to age their tables
+        
+        # Principal variation collected per ply during the search
+        self.pv_table = [[] for _ in range(MAX_PV_LENGTH + 1)]
+        self.principal_variation = []
     
-    def find_best_move(self, board, our_color):
+    def find_best_move(self, board, our_color, time_limit=None):
         """Find the best move using configured search algorithm"""
         start_time = time.time()
-        self.nodes_searched = 0
-        self.cutoffs = 0
+        self._reset_search_stats()
+        self.search_id += 1
+        self.move_ordering.age_tables()
+        if self.eval_state:
+            self.eval_state.reset(board)
+        if self.repetition:
+            self.repetition.reset(board)
         
         legal_moves = list(board.legal_moves)
         if not legal_moves:
             return None
         
+        # Mate solving mode tries to prove a forced mate before anything else
+        if self.search_algorithm == 'mate':
+            mate_move = self._prove_mate(board, self.mate_search_nodes)
+            if mate_move:
+                self.search_time = time.time() - start_time
+                return mate_move
+        
         # FIRST PRIORITY: Check for free material captures
         hanging_captures = self.move_ordering.get_hanging_piece_captures(board)
         if hanging_captures:
             # Short circuit if we found hanging pieces to capture
             # No need for deep search - always take free material!
             self.search_time = time.time() - start_time
+            self.principal_variation = [hanging_captures[0]]
             return hanging_captures[0]
         
         # SECOND PRIORITY: Check for checkmate in one
@@ -53,11 +165,17 @@ class SearchController:
             board.pop()
             if is_checkmate:
                 self.search_time = time.time() - start_time
+                self.principal_variation = [move]
                 return move  # Immediate checkmate - no need to search further
         
-        # Choose search algorithm
-        if self.search_algorithm in ['negamax', 'minimax']:
-            best_move, score = self._negamax_root(board, our_color, legal_moves)
+        # Choose search algorithm (an unproven mate search falls back to negamax)
+        if self.search_algorithm in ['negamax', 'minimax', 'mate']:
+            if self.use_iterative_deepening:
+                best_move, score = self._iterative_deepening(board, our_color, legal_moves, start_time, time_limit)
+            else:
+                best_move, score = self._negamax_root(board, our_color, legal_moves)
+                self.depth_reached = self.max_depth
+                self.principal_variation = list(self.pv_table[0])
         elif self.search_algorithm == 'simple':
             best_move, score = self._simple_search(board, our_color, legal_moves)
         elif self.search_algorithm == 'random':
@@ -71,31 +189,155 @@ class SearchController:
         
         return best_move
     
-    def _negamax_root(self, board, our_color, legal_moves):
+    def find_mate(self, board, max_nodes=None):
+        """Try to prove a forced mate within a node budget, returns the first move or None"""
+        start_time = time.time()
+        self._reset_search_stats()
+        mate_move = self._prove_mate(board, max_nodes or self.mate_search_nodes)
+        self.search_time = time.time() - start_time
+        return mate_move
+    
+    def _prove_mate(self, board, max_nodes):
+        """Run the proof-number mate search and record its line"""
+        mate_move = self.mate_search.solve(board, max_nodes)
+        self.nodes_searched += self.mate_search.nodes
+        if mate_move:
+            self.principal_variation = list(self.mate_search.principal_variation)
+            self.depth_reached = len(self.principal_variation)
+        return mate_move
+    
+    def _reset_search_stats(self):
+        """Reset per-search counters and state"""
+        self.nodes_searched = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.null_move_attempts = 0
+        self.null_move_cutoffs = 0
+        self.futility_prunes = 0
+        self.razor_attempts = 0
+        self.razor_cutoffs = 0
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        self.root_split_batches = 0
+        self.principal_variation = []
+        self.depth_reached = 0
+        self.hard_deadline = None
+        self.search_stopped = False
+        if self.tt:
+            self.tt.reset_stats()
+        self.scoring.primary.lazy_eval_skips = 0
+        if self.scoring.eval_cache:
+            self.scoring.eval_cache.reset_stats()
+        if self.scoring.pawn_structure:
+            self.scoring.pawn_structure.table.reset_stats()
+        self.scoring.quiescence.reset_stats()
+        self.mate_search.reset_stats()
+    
+    def _iterative_deepening(self, board, our_color, legal_moves, start_time, time_limit):
+        """Search depth 1, 2, 3... until max depth or the time budget runs out"""
+        soft_deadline = None
+        if time_limit:
+            soft_deadline = start_time + time_limit * SOFT_TIME_FRACTION
+            self.hard_deadline = start_time + time_limit * HARD_TIME_FRACTION
+        
+        # Order root moves once, later iterations only promote the previous best move
+        root_moves = legal_moves
+        if self.use_move_ordering:
+            root_moves = self.move_ordering.order_moves(board, legal_moves, self.move_limit)
+        
+        best_move = root_moves[0]
+        best_score = float('-inf')
+        
+        for depth in range(min(self.start_depth, self.max_depth), self.max_depth + 1):
+            if best_move in root_moves:
+                root_moves.remove(best_move)
+                root_moves.insert(0, best_move)
+            
+            move, score = self._search_iteration(board, our_color, root_moves, depth, best_score)
+            
+            # Discard an iteration aborted at the hard deadline
+            if self.search_stopped or move is None:
+                break
+            
+            best_move = move
+            best_score = score
+            self.depth_reached = depth
+            self.principal_variation = list(self.pv_table[0])
+            
+            # A forced mate won't change with more depth
+            if abs(score) >= MATE_THRESHOLD:
+                break
+            
+            # Not enough time left to finish another iteration
+            if soft_deadline and time.time() >= soft_deadline:
+                break
+        
+        return best_move, best_score
+    
+    def _search_iteration(self, board, our_color, root_moves, depth, previous_score):
+        """Search one iteration, inside an aspiration window around the previous score when possible"""
+        if self.use_pvs and depth > 1 and abs(previous_score) < MATE_THRESHOLD:
+            alpha = previous_score - ASPIRATION_WINDOW
+            beta = previous_score + ASPIRATION_WINDOW
+            move, score = self._negamax_root(board, our_color, root_moves, depth, True, alpha, beta)
+            
+            # Inside the window the result is exact, otherwise re-search with the full window
+            if self.search_stopped or alpha < score < beta:
+                return move, score
+            self.aspiration_researches += 1
+        
+        return self._negamax_root(board, our_color, root_moves, depth, presorted=True)
+    
+    def _check_time(self):
+        """Stop the search once the hard deadline has passed (or a stop was requested)
+        The clock is only read every TIME_CHECK_INTERVAL nodes."""
+        if self.nodes_searched % TIME_CHECK_INTERVAL == 0:
+            self._poll_stop()
+        return self.search_stopped
+    
+    def _poll_stop(self):
+        """Read the clock and the stop event now, stopping the search if either says so"""
+        if self.hard_deadline and time.time() >= self.hard_deadline:
+            self.search_stopped = True
+        if self.stop_event is not None and self.stop_event.is_set():
+            self.search_stopped = True
+        return self.search_stopped
+    
+    def _negamax_root(self, board, our_color, legal_moves, depth=None, presorted=False,
+                      alpha=float('-inf'), beta=float('inf')):
         """Root level negamax search"""
         best_move = None
         best_score = float('-inf')
+        depth = depth or self.max_depth
+        self.root_depth = depth
+        self.pv_table[0] = []
         
         # Order moves for better search
-        if self.use_move_ordering:
-            legal_moves = self.move_ordering.order_moves(board, legal_moves, self.max_ordered_moves)
+        if self.use_move_ordering and not presorted:
+            legal_moves = self.move_ordering.order_moves(board, legal_moves, self.move_limit)
         
-        alpha = float('-inf')
-        beta = float('inf')
+        in_check = board.is_check()
         
-        for move in legal_moves:
-            board.push(move)
-            
+        if self.root_pool and self.use_ab_pruning and depth > 1 and len(legal_moves) > 1:
+            return self._negamax_root_split(board, our_color, legal_moves, depth, alpha, beta, in_check)
+        
+        for move_index, move in enumerate(legal_moves):
             if self.use_ab_pruning:
-                score = -self._negamax(board, self.max_depth - 1, -beta, -alpha, not our_color)
+                score = self._search_move(board, move, move_index, depth, alpha, beta, our_color, 0, in_check)
             else:
-                score = -self._negamax_no_pruning(board, self.max_depth - 1, not our_color)
-            
-            board.pop()
+                self._make_move(board, move)
+                score = -self._negamax_no_pruning(board, depth - 1, not our_color)
+                self._unmake_move(board)
             
+            if self.search_stopped:
+                break
+
             if score > best_score:
                 best_score = score
                 best_move = move
+                self.pv_table[0] = [move] + self.pv_table[1]
             
             if self.use_ab_pruning:
                 alpha = max(alpha, score)
@@ -105,69 +347,336 @@ class SearchController:
         
         return best_move, best_score
     
-    def _negamax(self, board, depth, alpha, beta, our_color):
+    def _negamax_root_split(self, board, our_color, legal_moves, depth, alpha, beta, in_check):
+        """Root search with moves after the first farmed out to the process pool in batches
+        The first move is searched here to set alpha; each batch shares the alpha
+        reached after the previous one."""
+        best_move = legal_moves[0]
+        best_score = self._search_move(board, best_move, 0, depth, alpha, beta, our_color, 0, in_check)
+        if self.search_stopped:
+            return None, float('-inf')
+        self.pv_table[0] = [best_move] + self.pv_table[1]
+        alpha = max(alpha, best_score)
+        
+        remaining = list(enumerate(legal_moves))[1:]
+        batch_size = self.root_pool.workers
+        
+        for batch_start in range(0, len(remaining), batch_size):
+            if beta <= alpha:
+                self.cutoffs += 1
+                break
+            # Worker node counts make the node-interval clock check unreliable, read the clock here
+            if self._poll_stop():
+                break
+            
+            batch = remaining[batch_start:batch_start + batch_size]
+            results = self.root_pool.search_batch(board, batch, depth, alpha, beta, self.hard_deadline,
+                                                  self.search_id)
+            self.root_split_batches += 1
+            
+            for (move_index, move), (score, nodes, stopped, principal_variation) in zip(batch, results):
+                self.nodes_searched += nodes
+                if stopped:
+                    self.search_stopped = True
+                    continue
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+                    self.pv_table[0] = [move] + [chess.Move.from_uci(uci) for uci in principal_variation]
+            
+            if self.search_stopped:
+                break
+            alpha = max(alpha, best_score)
+        
+        return best_move, best_score
+    
+    def _negamax(self, board, depth, alpha, beta, our_color, ply=1, allow_null=True):
         """Negamax search with alpha-beta pruning"""
         self.nodes_searched += 1
+        if ply <= MAX_PV_LENGTH:
+            self.pv_table[ply] = []
+        
+        if self._check_time():
+            return 0
         
         # Check for repetition (penalize heavily)
-        if board.is_repetition(2):  # Check for threefold repetition
+        if self._is_repetition(board):
             return -5000  # Penalize repetition
         
-        # Terminal conditions
+        # Terminal conditions: resolve captures past the horizon before evaluating
         if depth == 0:
-            return self.scoring.evaluate_position(board, our_color)
+            if self.use_quiescence:
+                return self._quiescence(board, alpha, beta, our_color, ply)
+            return self._evaluate(board, our_color, alpha, beta)
+        
+        # Probe the transposition table before generating any moves
+        hash_move = None
+        zobrist_key = None
+        original_alpha = alpha
+        if self.tt:
+            zobrist_key = self.repetition.current_key() if self.repetition else self._position_key(board)
+            usable, tt_score, hash_move = self.tt.probe(zobrist_key, depth, alpha, beta, ply)
+            if usable:
+                return tt_score
 
-        if board.is_checkmate():
-            return -999999 + (self.max_depth - depth)  # Prefer quicker mates
+        # Generate the legal moves once: they decide mate/stalemate and feed the move loop
+        node_moves = list(board.generate_legal_moves())
+        state = get_terminal_state(board, node_moves)
+        if state == CHECKMATE:
+            return -999999 + ply  # Prefer quicker mates
+        if state != ONGOING:
+            return 0  # Stalemate or insufficient material
         
-        if board.is_stalemate() or board.is_insufficient_material():
-            return 0
+        in_check = board.is_check()
+        
+        # Null move pruning: if passing still fails high, a real move will too
+        if allow_null and self._can_try_null_move(board, depth, beta, in_check):
+            self.null_move_attempts += 1
+            self._make_move(board, chess.Move.null())
+            null_score = -self._negamax(board, depth - 1 - self.null_move_reduction, -beta, -beta + 1,
+                                        not our_color, ply + 1, allow_null=False)
+            self._unmake_move(board)
+            
+            if self.search_stopped:
+                return 0
+            if null_score >= beta:
+                self.null_move_cutoffs += 1
+                # Don't trust mate scores from a position where we passed
+                return beta if null_score >= MATE_THRESHOLD else null_score
+        
+        # Frontier pruning: a static evaluation far below alpha leaves only tactical moves worth searching
+        futility_value = None
+        check_masks = None  # Check squares for the cheap filter in front of gives_check
+        if self._can_prune_frontier(depth, alpha, beta, in_check):
+            static_eval = self._evaluate(board, our_color)
+            if self.use_razoring and static_eval + self.razor_margin * depth <= alpha:
+                # Razoring: let quiescence confirm that no capture saves the node (it doesn't try quiet checks)
+                self.razor_attempts += 1
+                razor_score = self._quiescence(board, alpha, alpha + 1, our_color, ply)
+                check_masks = get_check_masks(board)
+                if razor_score <= alpha and not self._has_checking_move(board, node_moves, check_masks):
+                    self.razor_cutoffs += 1
+                    return razor_score
+            if self.use_futility_pruning and static_eval + self.futility_margin * depth <= alpha:
+                futility_value = static_eval + self.futility_margin * depth
         
         # Generate and order moves
-        legal_moves = list(board.legal_moves)
-        if self.use_move_ordering:
-            # Use the enhanced material-prioritized move ordering
-            legal_moves = self.move_ordering.order_moves_with_material_priority(board, legal_moves)
-            # Limit moves if needed
-            if self.max_ordered_moves and len(legal_moves) > self.max_ordered_moves:
-                legal_moves = legal_moves[:self.max_ordered_moves]
+        if self.use_move_ordering and self.use_staged_move_generation:
+            # Moves are generated stage by stage as the loop asks for them
+            legal_moves = self.move_ordering.staged_moves(board, ply, hash_move, node_moves)
+        else:
+            legal_moves = node_moves
+            if self.use_move_ordering:
+                # Use the enhanced material-prioritized move ordering
+                legal_moves = self.move_ordering.order_moves_with_material_priority(board, legal_moves, ply)
+                # Search the hash move first so it survives the move limit
+                if hash_move in legal_moves:
+                    legal_moves.remove(hash_move)
+                    legal_moves.insert(0, hash_move)
         
         best_score = float('-inf')
+        best_move = None
         
-        for move in legal_moves:
-            board.push(move)
-            score = -self._negamax(board, depth - 1, -beta, -alpha, not our_color)
-            board.pop()
+        for move_index, move in enumerate(legal_moves):
+            # Limit moves if needed (late move reductions search every move instead)
+            if self.move_limit and move_index >= self.move_limit:
+                break
             
-            best_score = max(best_score, score)
-            alpha = max(alpha, score)
+            # Futility pruning and late move reductions test for checks, the masks are built once per node
+            if check_masks is None and (futility_value is not None or move_index >= LMR_FULL_DEPTH_MOVES):
+                check_masks = get_check_masks(board)
+            
+            # Futility pruning: quiet moves can't lift the evaluation to alpha, captures, promotions and checks still can
+            if futility_value is not None and self._is_quiet_move(board, move, check_masks):
+                self.futility_prunes += 1
+                best_score = max(best_score, futility_value)
+                continue
+            
+            score = self._search_move(board, move, move_index, depth, alpha, beta, our_color, ply, in_check,
+                                      check_masks)
+            
+            # Abandon the node without storing a partial result
+            if self.search_stopped:
+                return 0
+            
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+                if ply < MAX_PV_LENGTH:
+                    self.pv_table[ply] = [move] + self.pv_table[ply + 1]
             
             if beta <= alpha:
                 self.cutoffs += 1
+                if move_index == 0:
+                    self.first_move_cutoffs += 1
+                # Remember quiet cutoff moves for ordering sibling nodes
+                if not board.is_capture(move):
+                    self.move_ordering.update_killer_move(ply, move)
+                    self.move_ordering.update_history(move, depth)
                 break
         
+        # Store the result with its bound type
+        if self.tt:
+            if best_score <= original_alpha:
+                flag = UPPER_BOUND
+            elif best_score >= beta:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            self.tt.store(zobrist_key, depth, best_score, flag, best_move, ply)
+        
         return best_score
     
+    def _can_try_null_move(self, board, depth, beta, in_check):
+        """Check if null move pruning is safe at this node"""
+        if not self.use_null_move or in_check:
+            return False
+        if depth <= self.null_move_reduction or beta == float('inf'):
+            return False
+        # Zugzwang is common with little material left, passing is not a safe lower bound there
+        if self.eval_state:
+            return not self.eval_state.is_endgame()
+        return not self.scoring.primary.pst.is_endgame(board)
+    
+    def _can_prune_frontier(self, depth, alpha, beta, in_check):
+        """Check if futility pruning or razoring may be tried at this node"""
+        if not (self.use_futility_pruning or self.use_razoring) or in_check:
+            return False
+        if depth > FRONTIER_DEPTH or alpha == float('-inf') or beta == float('inf'):
+            return False
+        # A static evaluation says nothing about mate scores
+        return abs(alpha) < MATE_THRESHOLD and abs(beta) < MATE_THRESHOLD
+    
+    def _is_quiet_move(self, board, move, check_masks=None):
+        """Check if a move is neither a capture, a promotion nor a check
+        With check masks gives_check only runs for moves that could give check."""
+        if board.is_capture(move) or move.promotion:
+            return False
+        return not (may_give_check(board, move, check_masks) and board.gives_check(move))
+    
+    def _has_checking_move(self, board, moves, check_masks=None):
+        """Check if any of the moves gives check"""
+        return any(may_give_check(board, move, check_masks) and board.gives_check(move) for move in moves)
+    
+    def _make_move(self, board, move):
+        """Push a move, keeping the incremental evaluation and repetition history in step"""
+        if self.eval_state:
+            self.eval_state.push(board, move)
+        else:
+            board.push(move)
+        if self.repetition:
+            self.repetition.push(self._position_key(board))
+    
+    def _unmake_move(self, board):
+        """Pop a move, keeping the incremental evaluation and repetition history in step"""
+        if self.eval_state:
+            self.eval_state.pop(board)
+        else:
+            board.pop()
+        if self.repetition:
+            self.repetition.pop()
+    
+    def _position_key(self, board):
+        """Zobrist key of the board, from the incremental state when available"""
+        return self.eval_state.get_zobrist_key(board) if self.eval_state else get_zobrist_key(board)
+    
+    def _is_repetition(self, board):
+        """Check whether the position occurred before since the last irreversible move"""
+        if self.repetition:
+            return self.repetition.is_repetition(board.halfmove_clock)
+        return board.is_repetition(2)
+    
+    def _evaluate(self, board, our_color, alpha=None, beta=None):
+        """Static evaluation at a leaf, using the incremental state and lazy evaluation when enabled"""
+        # Lazy evaluation needs a finite window to compare against
+        if not self.use_lazy_eval or alpha == float('-inf') or beta == float('inf'):
+            alpha = beta = None
+        if self.eval_state and self.eval_state.debug:
+            self.eval_state.verify(board, our_color, self.scoring.primary)
+        return self.scoring.evaluate_position(board, our_color, self.eval_state, alpha, beta)
+    
+    def _quiescence(self, board, alpha, beta, our_color, ply):
+        """Quiescence search at a horizon node with the node's real bounds"""
+        if self.eval_state and self.eval_state.debug:
+            self.eval_state.verify(board, our_color, self.scoring.primary)
+        return self.scoring.quiescence.quiescence_search(board, alpha, beta, our_color, self.scoring.primary,
+                                                         incremental=self.eval_state, tt=self.tt, ply=ply)
+    
+    def _search_move(self, board, move, move_index, depth, alpha, beta, our_color, ply, in_check,
+                     check_masks=None):
+        """Search one child move, reducing late quiet moves and re-searching them if they beat alpha
+        With PVS only the first move gets the full window, later moves are
+        searched with a null window and re-searched if they fail high."""
+        reduction = 0
+        if self.use_late_move_reduction:
+            reduction = self._get_reduction(board, move, move_index, depth, alpha, ply, in_check, check_masks)
+        null_window = self.use_pvs and move_index > 0 and alpha != float('-inf')
+        
+        self._make_move(board, move)
+        full_depth_needed = True
+        if reduction:
+            self.lmr_reductions += 1
+            # Reduced depth, null window: only need to know if the move beats alpha
+            score = -self._negamax(board, depth - 1 - reduction, -alpha - 1, -alpha, not our_color, ply + 1)
+            full_depth_needed = score > alpha and not self.search_stopped
+            if full_depth_needed:
+                self.lmr_researches += 1
+        
+        if full_depth_needed:
+            if null_window:
+                score = -self._negamax(board, depth - 1, -alpha - 1, -alpha, not our_color, ply + 1)
+                if alpha < score < beta and not self.search_stopped:
+                    self.pvs_researches += 1
+                    score = -self._negamax(board, depth - 1, -beta, -alpha, not our_color, ply + 1)
+            else:
+                score = -self._negamax(board, depth - 1, -beta, -alpha, not our_color, ply + 1)
+        self._unmake_move(board)
+        
+        return score
+    
+    def _get_reduction(self, board, move, move_index, depth, alpha, ply, in_check, check_masks=None):
+        """Get the late move reduction for a move (0 means search at full depth)"""
+        if depth < LMR_MIN_DEPTH or move_index < LMR_FULL_DEPTH_MOVES or in_check:
+            return 0
+        if alpha == float('-inf'):
+            return 0
+        
+        # Tactical moves are never reduced
+        if not self._is_quiet_move(board, move, check_masks):
+            return 0
+        if move in self.move_ordering.get_killer_moves(ply):
+            return 0
+        
+        # Moves past the old ordering limit are the least likely to matter
+        if self.max_ordered_moves and move_index >= self.max_ordered_moves and depth > LMR_MIN_DEPTH:
+            return 2
+        return 1
+    
     def _negamax_no_pruning(self, board, depth, our_color):
         """Negamax search without alpha-beta pruning"""
         self.nodes_searched += 1
         
+        if self._check_time():
+            return 0
+        
         # Check for repetition (penalize heavily)
-        if board.is_repetition(2):  # Check for threefold repetition
+        if self._is_repetition(board):
             return -5000  # Penalize repetition
         
         # Terminal conditions
         if depth == 0:
-            return self.scoring.evaluate_position(board, our_color)
-        
-        if board.is_checkmate():
-            return -999999 + (self.max_depth - depth)
+            return self._evaluate(board, our_color)
         
-        if board.is_stalemate() or board.is_insufficient_material():
+        legal_moves = list(board.generate_legal_moves())
+        state = get_terminal_state(board, legal_moves)
+        if state == CHECKMATE:
+            return -999999 + (self.root_depth - depth)
+        if state != ONGOING:
             return 0
         
-        # Generate moves
-        legal_moves = list(board.legal_moves)
+        # Order the generated moves
         if self.use_move_ordering:
             # Use the enhanced material-prioritized move ordering
             legal_moves = self.move_ordering.order_moves_with_material_priority(board, legal_moves)
@@ -178,9 +687,12 @@ class SearchController:
         best_score = float('-inf')
         
         for move in legal_moves:
-            board.push(move)
+            self._make_move(board, move)
             score = -self._negamax_no_pruning(board, depth - 1, not our_color)
-            board.pop()
+            self._unmake_move(board)
+            
+            if self.search_stopped:
+                return 0
             
             best_score = max(best_score, score)
         
@@ -208,7 +720,7 @@ class SearchController:
                     return move, 9000 + material_gain
             
             # Regular move evaluation if not a free capture
-            score, details, critical = self.scoring.evaluate_move(board, move, our_color, depth=1)
+            score, critical = self.scoring.score_move(board, move, our_color, depth=1)
             
             if score > best_score:
                 best_score = score
@@ -220,11 +732,47 @@ class SearchController:
         
         return best_move, best_score
     
+    def get_principal_variation(self):
+        """Get the principal variation of the last search as a list of moves"""
+        return list(self.principal_variation)
+    
+    def clear_tables(self):
+        """Clear persistent search tables (e.g. for a new game)"""
+        if self.tt:
+            self.tt.clear()
+        if self.scoring.eval_cache:
+            self.scoring.eval_cache.clear()
+        if self.scoring.pawn_structure:
+            self.scoring.pawn_structure.clear()
+    
     def get_search_stats(self):
         """Get search statistics"""
-        return {
+        stats = {
             'nodes_searched': self.nodes_searched,
             'cutoffs': self.cutoffs,
+            'first_move_cutoff_pct': self.first_move_cutoffs / self.cutoffs * 100 if self.cutoffs > 0 else 0,
+            'lmr_reductions': self.lmr_reductions,
+            'lmr_researches': self.lmr_researches,
+            'null_move_attempts': self.null_move_attempts,
+            'null_move_cutoffs': self.null_move_cutoffs,
+            'futility_prunes': self.futility_prunes,
+            'razor_attempts': self.razor_attempts,
+            'razor_cutoffs': self.razor_cutoffs,
+            'pvs_researches': self.pvs_researches,
+            'aspiration_researches': self.aspiration_researches,
+            'root_split_batches': self.root_split_batches,
+            'lazy_eval_skips': self.scoring.primary.lazy_eval_skips,
+            **self.scoring.quiescence.get_stats(),
+            **self.mate_search.get_stats(),
+            'principal_variation': [move.uci() for move in self.principal_variation],
             'search_time': self.search_time,
+            'depth_reached': self.depth_reached,
             'nps': self.nodes_searched / self.search_time if self.search_time > 0 else 0
         }
+        if self.tt:
+            stats.update(self.tt.get_stats())
+        if self.scoring.eval_cache:
+            stats.update(self.scoring.eval_cache.get_stats())
+        if self.scoring.pawn_structure:
+            stats.update(self.scoring.pawn_structure.table.get_stats())
+        return stats
@@ -5,9 +5,11 @@ Handles castling evaluation and tactical scoring.
 """
 
 import chess
+from v7p3r_attack_map import get_attack_map
 from v7p3r_utils import (
     is_capture_that_escapes_check, 
     evaluate_exchange,
+    pushed_move,
     PIECE_VALUES,
     CHECKMATE_SCORE,
     DRAW_PENALTY
@@ -27,6 +29,17 @@ class SecondaryScoring:
             self.use_tactics = config.is_enabled('engine_config', 'use_tactics')
             self.use_captures_to_escape_check = config.is_enabled('engine_config', 'use_captures_to_escape_check')
     
+    def evaluate(self, board, move, our_color, material_score):
+        """Secondary score as a plain int, the same total as evaluate_secondary_score without the breakdown"""
+        score = 0
+        if self.use_castling:
+            score += self._evaluate_castling(board, move, our_color, material_score)
+        if self.use_tactics:
+            score += self._evaluate_tactics(board, move, our_color)
+        if self.use_captures_to_escape_check:
+            score += self._evaluate_escape_check(board, move, our_color)
+        return score
+    
     def evaluate_secondary_score(self, board, move, our_color, material_score):
         """Calculate secondary scoring components"""
         castling_score = self._evaluate_castling(board, move, our_color, material_score) if self.use_castling else 0
@@ -79,22 +92,20 @@ class SecondaryScoring:
         """Basic tactical evaluation - pins, skewers, hanging pieces"""
         score = 0
         
-        # Make the move to evaluate the resulting position
-        board_copy = board.copy()
-        board_copy.push(move)
-        
-        # Check for discovered attacks
-        score += self._check_discovered_attacks(board, board_copy, move, our_color)
-        
-        # Check for pins and skewers
-        score += self._check_pins_and_skewers(board_copy, our_color)
+        # Check for discovered attacks (compared against the position before the move)
+        score += self._check_discovered_attacks(board, move, our_color)
         
-        # Check for hanging pieces (basic version)
-        score += self._check_hanging_pieces(board_copy, our_color)
+        # Make the move to evaluate the resulting position
+        with pushed_move(board, move):
+            # Check for pins and skewers
+            score += self._check_pins_and_skewers(board, our_color)
+            
+            # Check for hanging pieces (basic version)
+            score += self._check_hanging_pieces(board, our_color)
         
         return score
     
-    def _check_discovered_attacks(self, original_board, new_board, move, our_color):
+    def _check_discovered_attacks(self, original_board, move, our_color):
         """Check for discovered attacks created by the move"""
         score = 0
         
@@ -147,15 +158,11 @@ class SecondaryScoring:
             chess.QUEEN: 900
         }
         
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.color != our_color and piece.piece_type != chess.KING:
-                # Check if this opponent piece is attacked and undefended
-                if board.is_attacked_by(our_color, square):
-                    # Check if it's defended
-                    if not board.is_attacked_by(not our_color, square):
-                        # Hanging piece - we can capture it
-                        score += piece_values.get(piece.piece_type, 0) // 10
+        # Opponent pieces we attack that they don't defend
+        attack_map = get_attack_map(board)
+        for square in chess.scan_forward(attack_map.hanging(not our_color)):
+            # Hanging piece - we can capture it
+            score += piece_values.get(board.piece_type_at(square), 0) // 10
         
         return score
     
@@ -182,20 +189,16 @@ class SecondaryScoring:
                     score += 300
                 
                 # Check if this resolves the position favorably
-                board_copy = board.copy()
-                board_copy.push(move)
-                
-                # If after this we're no longer in check and have a good position
-                if not board_copy.is_check():
-                    # Further bonus for completely resolving the check situation
-                    score += 100
-                    
-                    # Check if we're attacking anything after this move
-                    for target_square in chess.SQUARES:
-                        target_piece = board_copy.piece_at(target_square)
-                        if target_piece and target_piece.color != our_color:
-                            if board_copy.is_attacked_by(our_color, target_square):
-                                # We're attacking their pieces after escaping check - great!
-                                score += PIECE_VALUES[target_piece.piece_type] // 10
+                with pushed_move(board, move):
+                    # If after this we're no longer in check and have a good position
+                    if not board.is_check():
+                        # Further bonus for completely resolving the check situation
+                        score += 100
+                        
+                        # Check if we're attacking anything after this move
+                        attack_map = get_attack_map(board)
+                        for target_square in chess.scan_forward(board.occupied_co[not our_color] & attack_map.attacked[our_color]):
+                            # We're attacking their pieces after escaping check - great!
+                            score += PIECE_VALUES[board.piece_type_at(target_square)] // 10
         
         return score
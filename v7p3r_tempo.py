@@ -5,13 +5,18 @@ Handles critical move detection including checkmate threats, stalemate avoidance
 """
 
 import chess
+from v7p3r_mate_threat import MateThreatDetector
 from v7p3r_utils import (
     get_material_balance,
     is_draw_position,
     is_capture_that_escapes_check,
+    get_terminal_state,
+    pushed_move,
     CHECKMATE_SCORE,
     STALEMATE_PENALTY,
-    DRAW_PENALTY
+    DRAW_PENALTY,
+    CHECKMATE,
+    STALEMATE
 )
 
 class TempoCalculation:
@@ -19,84 +24,60 @@ class TempoCalculation:
         self.checkmate_score = CHECKMATE_SCORE
         self.stalemate_penalty = STALEMATE_PENALTY
         self.mate_threat_bonus = 50000
+        self.mate_detector = MateThreatDetector()
     
     def evaluate_tempo(self, board, move, depth):
         """Evaluate tempo factors for a move"""
-        # Make the move on a copy to evaluate the resulting position
-        board_copy = board.copy()
-        board_copy.push(move)
-        
         tempo_score = 0
         critical_move = False
+        mover = board.turn
         
-        # Check for immediate checkmate
-        if board_copy.is_checkmate():
-            return self.checkmate_score, True
-        
-        # Check for stalemate (avoid this)
-        if board_copy.is_stalemate():
-            return self.stalemate_penalty, True
-        
-        # Check for draw conditions (avoid when ahead)
-        if is_draw_position(board_copy):
-            material_balance = get_material_balance(board_copy, board.turn)
-            if material_balance > 0:  # We're ahead, avoid draw
-                tempo_score += DRAW_PENALTY
+        # Special bonus: If in check and capturing the checking piece safely
+        escapes_check_by_capture = is_capture_that_escapes_check(board, move)
         
-        # Check for checkmate threats within mate horizon
-        mate_threat = self._find_mate_threat(board_copy, depth)
-        if mate_threat:
-            if mate_threat > 0:  # We have mate threat
-                tempo_score += self.mate_threat_bonus
-                critical_move = True
-            else:  # Opponent has mate threat
-                tempo_score += mate_threat
+        # Make the move to evaluate the resulting position
+        with pushed_move(board, move):
+            state = get_terminal_state(board)
+            
+            # Check for immediate checkmate
+            if state == CHECKMATE:
+                return self.checkmate_score, True
+            
+            # Check for stalemate (avoid this)
+            if state == STALEMATE:
+                return self.stalemate_penalty, True
+            
+            # Check for draw conditions (avoid when ahead)
+            if is_draw_position(board, state):
+                material_balance = get_material_balance(board, mover)
+                if material_balance > 0:  # We're ahead, avoid draw
+                    tempo_score += DRAW_PENALTY
+            
+            # Check for checkmate threats within mate horizon
+            mate_threat = self._find_mate_threat(board, depth)
+            if mate_threat:
+                if mate_threat > 0:  # We have mate threat
+                    tempo_score += self.mate_threat_bonus
+                    critical_move = True
+                else:  # Opponent has mate threat
+                    tempo_score += mate_threat
+            
+            # Check if move gives check (small bonus)
+            if board.is_check():
+                tempo_score += 100
         
-        # Check if move gives check (small bonus)
-        if board_copy.is_check():
-            tempo_score += 100
-        
-        # Special bonus: If in check and capturing the checking piece safely
-        if board.is_check() and board.is_capture(move):
-            if is_capture_that_escapes_check(board, move):
-                # Additional tempo bonus for resolving check via capture
-                tempo_score += 500
-                critical_move = True
+        if escapes_check_by_capture:
+            # Additional tempo bonus for resolving check via capture
+            tempo_score += 500
+            critical_move = True
         
         return tempo_score, critical_move
     
     # Using standardized utility functions from v7p3r_utils.py
     
     def _find_mate_threat(self, board, max_depth):
-        """Look for mate threats within specified depth"""
-        if max_depth <= 0:
-            return None
-        
-        # Simple mate threat detection - look for forced sequences
-        if board.is_check():
-            legal_moves = list(board.legal_moves)
-            if len(legal_moves) == 1:
-                # Only one legal move - might be forced
-                board.push(legal_moves[0])
-                if board.is_checkmate():
-                    board.pop()
-                    return -self.checkmate_score + max_depth  # Opponent mates us
-                
-                # Look deeper
-                deeper_threat = self._find_mate_threat(board, max_depth - 1)
-                board.pop()
-                if deeper_threat:
-                    return deeper_threat
-        
-        # Look for our mate threats
-        for move in board.legal_moves:
-            board.push(move)
-            if board.is_checkmate():
-                board.pop()
-                return self.checkmate_score - max_depth  # We mate opponent
-            board.pop()
-        
-        return None
+        """Look for mate threats within specified depth (board is after our move)"""
+        return self.mate_detector.find_mate_threat(board, max_depth)
     
     def should_short_circuit(self, score):
         """Determine if we should short circuit based on tempo score"""
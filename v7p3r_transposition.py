@@ -0,0 +1,255 @@
+# v7p3r_transposition.py
+
+"""Transposition Table for V7P3R Chess Engine
+Caches search results by Zobrist hash so transposed positions are not re-searched.
+"""
+
+import chess
+import chess.polyglot
+from multiprocessing import shared_memory
+from v7p3r_utils import CHECKMATE_SCORE
+
+# Bound types for stored scores
+EXACT = 0
+LOWER_BOUND = 1  # Score is at least this value (fail high / beta cutoff)
+UPPER_BOUND = 2  # Score is at most this value (fail low)
+
+# Approximate memory cost of one entry (key, depth, score, flag, move slots)
+ENTRY_SIZE_BYTES = 48
+
+# Shared table entries are two 64-bit words: (key ^ data, data)
+SHARED_ENTRY_SIZE_BYTES = 16
+SCORE_OFFSET = 1 << 31
+
+# Scores beyond this are mate scores and need ply adjustment when stored
+MATE_THRESHOLD = CHECKMATE_SCORE - 1000
+
+
+def get_zobrist_key(board):
+    """Get the Zobrist hash of the current position"""
+    return chess.polyglot.zobrist_hash(board)
+
+
+class TranspositionTable:
+    def __init__(self, size_mb=16):
+        # Each bucket holds two entries: slot 0 is depth-preferred, slot 1 is always-replace
+        self.num_buckets = max(1, (int(size_mb * 1024 * 1024) // self._entry_size()) // 2)
+        self._allocate()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.overwrites = 0
+        self.stores = 0
+
+    def _entry_size(self):
+        """Memory cost of one entry in bytes"""
+        return ENTRY_SIZE_BYTES
+
+    def _allocate(self):
+        """Allocate empty entry storage"""
+        # Flat parallel arrays instead of per-entry objects to keep memory bounded
+        num_entries = self.num_buckets * 2
+        self.keys = [None] * num_entries
+        self.depths = [0] * num_entries
+        self.scores = [0] * num_entries
+        self.flags = [EXACT] * num_entries
+        self.moves = [None] * num_entries
+
+    def _read_slot(self, slot):
+        """Read an entry as (key, depth, score, flag, move), or None when empty"""
+        key = self.keys[slot]
+        if key is None:
+            return None
+        return key, self.depths[slot], self.scores[slot], self.flags[slot], self.moves[slot]
+
+    def _write_slot(self, slot, key, depth, score, flag, move):
+        """Write an entry"""
+        self.keys[slot] = key
+        self.depths[slot] = depth
+        self.scores[slot] = score
+        self.flags[slot] = flag
+        self.moves[slot] = move
+
+    def _bucket_index(self, key):
+        """Get the index of the depth-preferred slot for this key"""
+        return (key % self.num_buckets) * 2
+
+    def probe(self, key, depth, alpha, beta, ply=0):
+        """Look up a position
+        Returns (usable, score, best_move). usable is True when the stored
+        bound lets the caller return score without searching."""
+        index = self._bucket_index(key)
+
+        for slot in (index, index + 1):
+            entry = self._read_slot(slot)
+            if entry and entry[0] == key:
+                self.hits += 1
+                _, stored_depth, stored_score, flag, best_move = entry
+
+                if stored_depth < depth:
+                    # Not deep enough to trust the score, but the move is still useful
+                    return False, 0, best_move
+
+                score = self._score_from_tt(stored_score, ply)
+
+                if flag == EXACT:
+                    return True, score, best_move
+                if flag == LOWER_BOUND and score >= beta:
+                    return True, score, best_move
+                if flag == UPPER_BOUND and score <= alpha:
+                    return True, score, best_move
+                return False, score, best_move
+
+        self.misses += 1
+        return False, 0, None
+
+    def get_move(self, key):
+        """Get the stored best move for a position without counting a probe"""
+        index = self._bucket_index(key)
+        for slot in (index, index + 1):
+            entry = self._read_slot(slot)
+            if entry and entry[0] == key:
+                return entry[4]
+        return None
+
+    def store(self, key, depth, score, flag, best_move, ply=0):
+        """Store a search result using the depth-preferred / always-replace policy"""
+        index = self._bucket_index(key)
+        score = self._score_to_tt(score, ply)
+        self.stores += 1
+
+        # Depth-preferred slot: take it when empty or the new search is at least as deep,
+        # any shallower result for the same position (e.g. from quiescence) keeps the deeper entry
+        entry = self._read_slot(index)
+        if entry is None or depth >= entry[1]:
+            slot = index
+        else:
+            # Otherwise fall back to the always-replace slot
+            slot = index + 1
+            entry = self._read_slot(slot)
+
+        if entry is not None and entry[0] != key:
+            self.overwrites += 1
+
+        # Keep the previous best move if this search did not produce one
+        if best_move is None and entry is not None and entry[0] == key:
+            best_move = entry[4]
+
+        self._write_slot(slot, key, depth, score, flag, best_move)
+
+    def _score_to_tt(self, score, ply):
+        """Convert a root-relative mate score into a node-relative one for storage"""
+        if score >= MATE_THRESHOLD:
+            return score + ply
+        if score <= -MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    def _score_from_tt(self, score, ply):
+        """Convert a stored node-relative mate score back to root-relative"""
+        if score >= MATE_THRESHOLD:
+            return score - ply
+        if score <= -MATE_THRESHOLD:
+            return score + ply
+        return score
+
+    def reset_stats(self):
+        """Reset probe statistics (called at the start of each search)"""
+        self.hits = 0
+        self.misses = 0
+        self.overwrites = 0
+        self.stores = 0
+
+    def clear(self):
+        """Clear all entries (e.g. for a new game)"""
+        self._allocate()
+        self.reset_stats()
+
+    def get_stats(self):
+        """Get table statistics"""
+        probes = self.hits + self.misses
+        return {
+            'tt_hits': self.hits,
+            'tt_misses': self.misses,
+            'tt_overwrites': self.overwrites,
+            'tt_stores': self.stores,
+            'tt_hit_rate': self.hits / probes if probes > 0 else 0
+        }
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """Transposition table in shared memory for multi-process search
+    Entries are written without locks: each one stores (key ^ data, data), so a
+    torn write from two processes fails the key check and reads as a miss.
+    Scores are packed as 32-bit integers, so fractional scores are rounded to
+    the nearest centipawn."""
+
+    def __init__(self, size_mb=16, name=None):
+        self.shm = None
+        self.owner = name is None
+        self.name = name
+        super().__init__(size_mb)
+
+    def _entry_size(self):
+        return SHARED_ENTRY_SIZE_BYTES
+
+    def _allocate(self):
+        """Create the shared memory block, or attach to an existing one by name"""
+        size = self.num_buckets * 2 * SHARED_ENTRY_SIZE_BYTES
+        if self.shm is None:
+            if self.owner:
+                self.shm = shared_memory.SharedMemory(create=True, size=size)
+                self.name = self.shm.name
+            else:
+                self.shm = shared_memory.SharedMemory(name=self.name)
+            self.words = self.shm.buf.cast('Q')
+
+    def clear(self):
+        """Zero every entry in the shared block"""
+        size = self.num_buckets * 2 * SHARED_ENTRY_SIZE_BYTES
+        self.shm.buf[:size] = bytes(size)
+        self.reset_stats()
+
+    def _read_slot(self, slot):
+        check = self.words[slot * 2]
+        data = self.words[slot * 2 + 1]
+        if data == 0:
+            return None
+        key = check ^ data
+        score = (data & 0xFFFFFFFF) - SCORE_OFFSET
+        depth = (data >> 32) & 0xFF
+        flag = (data >> 40) & 0x3
+        return key, depth, score, flag, self._decode_move(data >> 42)
+
+    def _write_slot(self, slot, key, depth, score, flag, move):
+        data = ((round(score) + SCORE_OFFSET) & 0xFFFFFFFF) | (min(depth, 255) << 32) \
+            | (flag << 40) | (self._encode_move(move) << 42)
+        self.words[slot * 2] = key ^ data
+        self.words[slot * 2 + 1] = data
+
+    def _encode_move(self, move):
+        """Pack a move into 16 bits (from, to, promotion piece type)"""
+        if move is None:
+            return 0
+        return move.from_square | (move.to_square << 6) | ((move.promotion or 0) << 12)
+
+    def _decode_move(self, packed):
+        if packed == 0:
+            return None
+        promotion = (packed >> 12) & 0x7
+        return chess.Move(packed & 0x3F, (packed >> 6) & 0x3F, promotion or None)
+
+    def get_attach_args(self):
+        """Arguments for a helper process to attach to this table"""
+        return self.num_buckets * 2 * SHARED_ENTRY_SIZE_BYTES / (1024 * 1024), self.name
+
+    def close(self):
+        """Detach from the shared memory block, and free it if this process created it"""
+        if self.shm is None:
+            return
+        self.words.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None
@@ -5,6 +5,7 @@ Provides common functions and constants used across multiple modules.
 """
 
 import chess
+from contextlib import contextmanager
 
 # Standardized piece values (in centipawns)
 PIECE_VALUES = {
@@ -22,30 +23,64 @@ STALEMATE_PENALTY = -999999
 DRAW_PENALTY = -5000
 REPETITION_PENALTY = -5000
 
+# Piece types that count as material (kings excluded)
+MATERIAL_PIECE_TYPES = (chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN)
+
+# Node states returned by get_terminal_state
+ONGOING = 0
+CHECKMATE = 1
+STALEMATE = 2
+INSUFFICIENT_MATERIAL = 3
+
+# Debug counter of boards copied through copy_board (reset by the engine per find_move)
+_board_copy_count = 0
+
+def copy_board(board):
+    """Copy a board, counting the copy for the debug statistics"""
+    global _board_copy_count
+    _board_copy_count += 1
+    return board.copy()
+
+def get_board_copy_count():
+    """Get the number of board copies made since the last reset"""
+    return _board_copy_count
+
+def reset_board_copy_count():
+    """Reset the board copy debug counter"""
+    global _board_copy_count
+    _board_copy_count = 0
+
+@contextmanager
+def pushed_move(board, move):
+    """Make a move on the board for the duration of a with block
+    The move is always taken back, even if the block raises."""
+    board.push(move)
+    try:
+        yield board
+    finally:
+        board.pop()
+
 def get_material_balance(board, color):
     """Get material balance from the perspective of the specified color"""
-    our_material = 0
-    their_material = 0
-    
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece and piece.piece_type != chess.KING:
-            value = PIECE_VALUES[piece.piece_type]
-            if piece.color == color:
-                our_material += value
-            else:
-                their_material += value
-    
-    return our_material - their_material
+    balance = 0
+    for piece_type in MATERIAL_PIECE_TYPES:
+        count = chess.popcount(board.pieces_mask(piece_type, color)) - \
+            chess.popcount(board.pieces_mask(piece_type, not color))
+        balance += count * PIECE_VALUES[piece_type]
+    return balance
+
+def get_total_material(board):
+    """Get the combined material of both sides (kings excluded)"""
+    total = 0
+    for piece_type in MATERIAL_PIECE_TYPES:
+        total += chess.popcount(board.pieces_mask(piece_type, chess.WHITE) |
+                                board.pieces_mask(piece_type, chess.BLACK)) * PIECE_VALUES[piece_type]
+    return total
 
 def get_game_phase(board):
     """Determine the current game phase based on material and development"""
     # Count total pieces (excluding kings)
-    piece_count = 0
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece and piece.piece_type != chess.KING:
-            piece_count += 1
+    piece_count = chess.popcount(board.occupied & ~board.kings)
     
     # Simple phase detection
     if piece_count >= 24:  # Most pieces on board
@@ -55,13 +90,39 @@ def get_game_phase(board):
     else:  # Few pieces left
         return "endgame"
 
-def is_draw_position(board):
-    """Check if position is a draw"""
-    return (board.is_stalemate() or 
-            board.is_insufficient_material() or
+def is_insufficient_material(board):
+    """Same result as board.is_insufficient_material(), with a material signature
+    fast path: any pawn, rook or queen on the board is enough to mate"""
+    if board.pawns | board.rooks | board.queens:
+        return False
+    return board.is_insufficient_material()
+
+def get_terminal_state(board, legal_moves=None):
+    """Classify a position once as checkmate, stalemate, insufficient material or ongoing
+    Mate and stalemate come from the legal moves plus the check status; pass the
+    node's generated move list to reuse it, otherwise only the first move is generated."""
+    has_moves = bool(legal_moves) if legal_moves is not None else any(board.generate_legal_moves())
+    if not has_moves:
+        return CHECKMATE if board.is_check() else STALEMATE
+    if is_insufficient_material(board):
+        return INSUFFICIENT_MATERIAL
+    return ONGOING
+
+# Three occurrences of a position span at least 8 reversible plies, so a
+# threefold claim (possibly after one more move) needs a halfmove clock of 7,
+# and five occurrences need 16
+MIN_REPETITION_CLAIM_PLIES = 7
+MIN_FIVEFOLD_PLIES = 16
+
+def is_draw_position(board, state=None):
+    """Check if position is a draw (state is the position's terminal state when already known)"""
+    if state is None:
+        state = get_terminal_state(board)
+    return (state == STALEMATE or
+            state == INSUFFICIENT_MATERIAL or
             board.is_seventyfive_moves() or
-            board.is_fivefold_repetition() or
-            board.can_claim_threefold_repetition() or
+            (board.halfmove_clock >= MIN_FIVEFOLD_PLIES and board.is_fivefold_repetition()) or
+            (board.halfmove_clock >= MIN_REPETITION_CLAIM_PLIES and board.can_claim_threefold_repetition()) or
             board.can_claim_fifty_moves())
 
 def is_capture_that_escapes_check(board, move):
@@ -78,88 +139,131 @@ def is_capture_that_escapes_check(board, move):
     return target_square in attackers
 
 def evaluate_exchange(board, move):
-    """Evaluate a capture sequence to determine material gain/loss"""
+    """Evaluate a capture sequence to determine material gain/loss
+    Static exchange evaluation: both sides keep recapturing on the target
+    square with their least valuable attacker and may stop when continuing
+    would lose material. Returns 0 for non-captures."""
     if not board.is_capture(move):
         return 0
+    return static_exchange_evaluation(board, move)
+
+def _least_valuable_attacker(board, attackers_mask, color):
+    """Get (piece_type, square bitboard) of a color's cheapest piece in the attackers mask"""
+    for piece_type in chess.PIECE_TYPES:
+        candidates = attackers_mask & board.pieces_mask(piece_type, color)
+        if candidates:
+            return piece_type, candidates & -candidates
+    return None, 0
+
+def _exchange_start(board, move):
+    """Initial (victim value, value of the piece left on the square, occupancy) for an exchange"""
+    occupied = board.occupied & ~chess.BB_SQUARES[move.from_square]
+    if board.is_en_passant(move):
+        victim_value = PIECE_VALUES[chess.PAWN]
+        occupied &= ~chess.BB_SQUARES[move.to_square ^ 8]
+    else:
+        victim_type = board.piece_type_at(move.to_square)
+        victim_value = PIECE_VALUES[victim_type] if victim_type else 0
     
-    # Get the capturing piece
-    capturing_piece = board.piece_at(move.from_square)
-    if not capturing_piece:
-        return 0
-    
-    # Get the captured piece
-    captured_piece = board.piece_at(move.to_square)
-    if not captured_piece:
-        # En passant capture
-        if board.is_en_passant(move):
-            return PIECE_VALUES[chess.PAWN]
-        return 0
-    
-    # Initial material gain (what we capture)
-    material_gain = PIECE_VALUES[captured_piece.piece_type]
+    attacker_value = PIECE_VALUES[board.piece_type_at(move.from_square)]
+    if move.promotion:
+        victim_value += PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+        attacker_value = PIECE_VALUES[move.promotion]
+    return victim_value, attacker_value, occupied
+
+def static_exchange_evaluation(board, move):
+    """Swap-list SEE on attacker bitboards, without making any move
+    Sliders behind a capturing piece join in as it leaves (x-rays), since
+    attackers are recomputed against the shrinking occupancy. Pins are ignored."""
+    target = move.to_square
+    victim_value, on_square_value, occupied = _exchange_start(board, move)
+    gains = [victim_value]
+    side = not board.turn
     
-    # Make a copy of the board to simulate the capture
-    test_board = board.copy()
-    test_board.push(move)
+    while True:
+        attackers = board.attackers_mask(side, target, occupied) & occupied
+        piece_type, attacker_bb = _least_valuable_attacker(board, attackers, side)
+        if piece_type is None:
+            break
+        # The king can't recapture onto a square the other side still attacks
+        if piece_type == chess.KING and board.attackers_mask(not side, target, occupied) & occupied:
+            break
+        
+        gains.append(on_square_value - gains[-1])
+        on_square_value = PIECE_VALUES[piece_type]
+        occupied &= ~attacker_bb
+        side = not side
     
-    # Check if the opponent can recapture
-    target_square = move.to_square
-    opponent_attackers = test_board.attackers(not test_board.turn, target_square)
+    # Either side may stop capturing, so back up the best choice at each step
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
+
+def see_ge(board, move, margin=0):
+    """Check whether the exchange started by a move wins at least margin
+    Threshold form of SEE for pruning: stops as soon as the outcome is known."""
+    if board.is_en_passant(move) or move.promotion or board.is_castling(move):
+        return static_exchange_evaluation(board, move) >= margin
     
-    if not opponent_attackers:
-        # NO RECAPTURE POSSIBLE - FREE MATERIAL!
-        return material_gain
+    target = move.to_square
+    victim_value, attacker_value, occupied = _exchange_start(board, move)
     
-    # Find the least valuable attacker that can recapture
-    min_attacker_value = float('inf')
-    for attacker_square in opponent_attackers:
-        attacker_piece = test_board.piece_at(attacker_square)
-        if attacker_piece:
-            attacker_value = PIECE_VALUES[attacker_piece.piece_type]
-            if attacker_value < min_attacker_value:
-                min_attacker_value = attacker_value
+    # Even winning the victim for free doesn't reach the margin
+    swap = victim_value - margin
+    if swap < 0:
+        return False
+    # Losing the capturing piece still keeps us at the margin
+    swap = attacker_value - swap
+    if swap <= 0:
+        return True
     
-    # Calculate net material exchange
-    our_loss = PIECE_VALUES[capturing_piece.piece_type]
-    their_loss = PIECE_VALUES[captured_piece.piece_type]
+    side = board.turn
+    result = True
+    while True:
+        side = not side
+        attackers = board.attackers_mask(side, target, occupied) & occupied
+        piece_type, attacker_bb = _least_valuable_attacker(board, attackers, side)
+        if piece_type is None:
+            break
+        result = not result
+        
+        if piece_type == chess.KING:
+            # Capturing with the king only works if the other side has nothing left
+            if board.attackers_mask(not side, target, occupied) & occupied:
+                return not result
+            return result
+        
+        swap = PIECE_VALUES[piece_type] - swap
+        if swap < int(result):
+            break
+        occupied &= ~attacker_bb
     
-    return their_loss - our_loss
+    return result
 
 def find_hanging_pieces(board, color):
     """Find undefended pieces that can be captured for free"""
+    from v7p3r_attack_map import get_attack_map
+    attack_map = get_attack_map(board)
     hanging_pieces = []
     
-    # Look at all opponent pieces
-    for square in chess.SQUARES:
+    # Look at all opponent pieces attacked by us
+    for square in chess.scan_forward(board.occupied_co[not color] & attack_map.attacked[color]):
         piece = board.piece_at(square)
-        if piece and piece.color != color:  # Opponent's piece
-            # Check if this piece is attacked by us
-            our_attackers = board.attackers(color, square)
-            if our_attackers:
-                # Check if it's defended by opponent
-                their_defenders = board.attackers(piece.color, square)
-                
-                if not their_defenders:
-                    # HANGING PIECE! No defenders
-                    hanging_pieces.append((square, piece, PIECE_VALUES[piece.piece_type]))
-                else:
-                    # Check if we can win the exchange
-                    min_attacker_value = min(
-                        PIECE_VALUES[board.piece_at(att_sq).piece_type] 
-                        for att_sq in our_attackers 
-                        if board.piece_at(att_sq)
-                    )
-                    min_defender_value = min(
-                        PIECE_VALUES[board.piece_at(def_sq).piece_type] 
-                        for def_sq in their_defenders 
-                        if board.piece_at(def_sq)
-                    )
-                    
-                    # If we can capture with a less valuable piece than their defender
-                    if min_attacker_value < min_defender_value:
-                        net_gain = PIECE_VALUES[piece.piece_type] - min_attacker_value
-                        if net_gain > 0:
-                            hanging_pieces.append((square, piece, net_gain))
+        
+        # Check if it's defended by opponent
+        if not attack_map.is_attacked(not color, square):
+            # HANGING PIECE! No defenders
+            hanging_pieces.append((square, piece, PIECE_VALUES[piece.piece_type]))
+        else:
+            # Check if we can win the exchange
+            min_attacker_value = attack_map.least_valuable_attacker_value(color, square)
+            min_defender_value = attack_map.least_valuable_attacker_value(not color, square)
+            
+            # If we can capture with a less valuable piece than their defender
+            if min_attacker_value < min_defender_value:
+                net_gain = PIECE_VALUES[piece.piece_type] - min_attacker_value
+                if net_gain > 0:
+                    hanging_pieces.append((square, piece, net_gain))
     
     # Sort by value (highest first)
     hanging_pieces.sort(key=lambda x: x[2], reverse=True)